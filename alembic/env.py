@@ -1,5 +1,6 @@
 """Alembic configuration file."""
 import os
+import re
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config, pool
@@ -17,7 +18,9 @@ from backend.events.event_models import (  # noqa: F401
 )
 from backend.health.health_models import (  # noqa: F401
     ChapterHealth,
+    ChapterHealthHistory,
     HealthQuestion,
+    LatestChapterHealth,
     Section,
 )
 from backend.inventory.inventory_models import (  # noqa: F401
@@ -45,7 +48,7 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-fileConfig(config.config_file_name)
+fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 if "DATABASE_URL" in os.environ:
     config.set_main_option("sqlalchemy.url", os.environ["DATABASE_URL"])
@@ -62,6 +65,27 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_name(name: str | None, type_: str, _parent_names: dict) -> bool:
+    """
+    Leave the partitions of chapter_health out of autogenerate.
+
+    The partitions are created by migrations rather than from the models.
+
+    Args:
+        name (str | None): The name of the database object
+        type_ (str): The type of database object, e.g. table
+        _parent_names (dict): The names of the object's schema and table
+
+    Returns:
+        bool: Whether to compare the object with the models
+
+    """
+    return not (
+        type_ == "table"
+        and re.fullmatch(r"chapter_health_(\d{4}|default)", name or "") is not None
+    )
+
+
 def run_migrations_offline() -> None:  # pragma: no cover
     """
     Run migrations in 'offline' mode.
@@ -79,6 +103,7 @@ def run_migrations_offline() -> None:  # pragma: no cover
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -102,7 +127,16 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        # Some migrations commit part way through to create or drop indexes
+        # concurrently, so each migration has its own transaction. A failed migration
+        # then leaves the database at the revision before it, rather than with every
+        # earlier migration in the run committed but not stamped.
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            transaction_per_migration=True,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
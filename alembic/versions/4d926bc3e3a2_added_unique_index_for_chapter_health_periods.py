@@ -0,0 +1,76 @@
+"""
+added unique index for chapter health periods
+
+Revision ID: 4d926bc3e3a2
+Revises: bbfd81e4557f
+Created Date: 2026-10-17 10:04:27.361942+01:00
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4d926bc3e3a2"
+down_revision = "bbfd81e4557f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    # Scores used to be saved again rather than updated, so keep only the most
+    # recent score for each chapter, period and question and delete the others.
+    op.execute(
+        """
+        UPDATE chapter_health
+        SET is_deleted = true,
+            last_modified_date = timezone('Europe/London', current_timestamp)
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT
+                    id,
+                    row_number() OVER (
+                        PARTITION BY chapter_id, year, month, week, health_question_id
+                        ORDER BY created_date DESC
+                    ) AS position
+                FROM chapter_health
+                WHERE is_deleted = false
+            ) AS scores
+            WHERE position > 1
+        )
+        """,
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_chapter_health_chapter_id_period_question",
+            "chapter_health",
+            ["chapter_id", "year", "month", "week", "health_question_id"],
+            unique=True,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    # The duplicate scores deleted by the upgrade are not restored
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_chapter_health_chapter_id_period_question",
+            table_name="chapter_health",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def merge_upgrade_ops() -> None:
+    """Merge upgrade operations from multiple branches."""
+    pass
+
+
+def merge_downgrade_ops() -> None:
+    """Merge downgrade operations from multiple branches."""
+    pass
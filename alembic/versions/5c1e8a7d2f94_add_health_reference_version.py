@@ -0,0 +1,61 @@
+"""
+add health reference version
+
+Revision ID: 5c1e8a7d2f94
+Revises: 713f92d70464
+Created Date: 2026-10-17 15:42:18.510376+01:00
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c1e8a7d2f94"
+down_revision = "713f92d70464"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence("health_reference_version")))
+    # Start at a called value so the first write changes last_value
+    op.execute("SELECT nextval('health_reference_version')")
+    op.execute(
+        """
+        CREATE FUNCTION bump_health_reference_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM nextval('health_reference_version');
+            RETURN NULL;
+        END;
+        $$
+        """,
+    )
+    for table in ["section", "health_questions"]:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_health_reference_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_health_reference_version()
+            """,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    for table in ["section", "health_questions"]:
+        op.execute(f"DROP TRIGGER {table}_health_reference_version ON {table}")
+    op.execute("DROP FUNCTION bump_health_reference_version()")
+    op.execute(sa.schema.DropSequence(sa.Sequence("health_reference_version")))
+
+
+def merge_upgrade_ops() -> None:
+    """Merge upgrade operations from multiple branches."""
+    pass
+
+
+def merge_downgrade_ops() -> None:
+    """Merge downgrade operations from multiple branches."""
+    pass
@@ -0,0 +1,87 @@
+"""
+add latest chapter health table
+
+Revision ID: 713f92d70464
+Revises: 4d926bc3e3a2
+Created Date: 2026-10-17 11:26:52.804113+01:00
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "713f92d70464"
+down_revision = "4d926bc3e3a2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    op.create_table(
+        "latest_chapter_health",
+        sa.Column("chapter_id", sa.UUID(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=False),
+        sa.Column("health_question_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=True),
+        sa.Column("comments", sa.String(), nullable=True),
+        sa.Column(
+            "last_modified_date",
+            sa.DateTime(timezone=True),
+            server_default=sa.text(
+                "timezone('Europe/London', timezone('Europe/London', CURRENT_TIMESTAMP))",
+            ),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["chapter_id"],
+            ["chapters.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["health_question_id"],
+            ["health_questions.id"],
+        ),
+        sa.PrimaryKeyConstraint(
+            "chapter_id",
+            "year",
+            "month",
+            "week",
+            "health_question_id",
+        ),
+    )
+    # Fill in the latest score of every chapter, period and question so far
+    op.execute(
+        """
+        INSERT INTO latest_chapter_health (
+            chapter_id, year, month, week, health_question_id, score, comments,
+            last_modified_date
+        )
+        SELECT DISTINCT ON (chapter_id, year, month, week, health_question_id)
+            chapter_id, year, month, week, health_question_id, score, comments,
+            coalesce(last_modified_date, created_date)
+        FROM chapter_health
+        WHERE is_deleted = false
+            AND year IS NOT NULL
+            AND month IS NOT NULL
+            AND week IS NOT NULL
+        ORDER BY chapter_id, year, month, week, health_question_id, created_date DESC
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    op.drop_table("latest_chapter_health")
+
+
+def merge_upgrade_ops() -> None:
+    """Merge upgrade operations from multiple branches."""
+    pass
+
+
+def merge_downgrade_ops() -> None:
+    """Merge downgrade operations from multiple branches."""
+    pass
@@ -0,0 +1,202 @@
+"""
+partition chapter health by year
+
+Revision ID: 9b3f6d0c84e1
+Revises: 5c1e8a7d2f94
+Created Date: 2026-10-17 17:08:41.262930+01:00
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b3f6d0c84e1"
+down_revision = "5c1e8a7d2f94"
+branch_labels = None
+depends_on = None
+
+COLUMNS = """
+    id, chapter_id, health_question_id, score, comments, year, month, week,
+    created_date, is_deleted, last_modified_date
+"""
+
+
+def create_chapter_health_table(**kwargs: str) -> None:
+    """
+    Create the chapter_health table and its indexes.
+
+    Args:
+        kwargs (str): Table options, e.g. postgresql_partition_by
+    """
+    partitioned = "postgresql_partition_by" in kwargs
+    op.create_table(
+        "chapter_health",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("uuid_generate_v4()"),
+            nullable=False,
+        ),
+        sa.Column("chapter_id", sa.UUID(), nullable=False),
+        sa.Column("health_question_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=True),
+        sa.Column("comments", sa.String(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=not partitioned),
+        sa.Column("month", sa.Integer(), nullable=True),
+        sa.Column("week", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_date",
+            sa.DateTime(timezone=True),
+            server_default=sa.text(
+                "timezone('Europe/London', timezone('Europe/London', CURRENT_TIMESTAMP))",
+            ),
+            nullable=False,
+        ),
+        sa.Column("is_deleted", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column("last_modified_date", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["chapter_id"],
+            ["chapters.id"],
+            name="chapter_health_chapter_id_fkey",
+        ),
+        sa.ForeignKeyConstraint(
+            ["health_question_id"],
+            ["health_questions.id"],
+            name="chapter_health_health_question_id_fkey",
+        ),
+        # The partition key has to be part of the primary key
+        sa.PrimaryKeyConstraint(*(["id", "year"] if partitioned else ["id"])),
+        **kwargs,
+    )
+    op.create_index("ix_chapter_health_id", "chapter_health", ["id"])
+    op.create_index(
+        "uq_chapter_health_chapter_id_period_question",
+        "chapter_health",
+        ["chapter_id", "year", "month", "week", "health_question_id"],
+        unique=True,
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    op.rename_table("chapter_health", "unpartitioned_chapter_health")
+    op.execute(
+        "ALTER TABLE unpartitioned_chapter_health "
+        "RENAME CONSTRAINT chapter_health_pkey TO unpartitioned_chapter_health_pkey",
+    )
+    # The indexes are dropped if they exist, as an earlier failed downgrade may have
+    # dropped them without unstamping their migrations
+    op.drop_index(
+        "ix_chapter_health_id",
+        "unpartitioned_chapter_health",
+        if_exists=True,
+    )
+    op.drop_index(
+        "ix_chapter_health_chapter_id_period",
+        "unpartitioned_chapter_health",
+        if_exists=True,
+    )
+    op.drop_index(
+        "uq_chapter_health_chapter_id_period_question",
+        "unpartitioned_chapter_health",
+        if_exists=True,
+    )
+
+    create_chapter_health_table(postgresql_partition_by="RANGE (year)")
+    # A partition for each year from the first scores to next year, and a default
+    # partition for any later years until their partitions are added by
+    # backend.health.create_chapter_health_partitions
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            partition_year integer;
+        BEGIN
+            FOR partition_year IN
+                SELECT generate_series(
+                    least(
+                        min(coalesce(year, extract(year FROM created_date)::integer)),
+                        extract(year FROM current_date)::integer
+                    ),
+                    extract(year FROM current_date)::integer + 1
+                )
+                FROM unpartitioned_chapter_health
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE chapter_health_%s PARTITION OF chapter_health '
+                    'FOR VALUES FROM (%s) TO (%s)',
+                    partition_year,
+                    partition_year,
+                    partition_year + 1
+                );
+            END LOOP;
+        END;
+        $$
+        """,
+    )
+    op.execute(
+        "CREATE TABLE chapter_health_default PARTITION OF chapter_health DEFAULT",
+    )
+
+    # Scores saved without a year are given the year they were saved in
+    op.execute(
+        f"""
+        INSERT INTO chapter_health ({COLUMNS})
+        SELECT
+            id, chapter_id, health_question_id, score, comments,
+            coalesce(year, extract(year FROM created_date)::integer), month, week,
+            created_date, is_deleted, last_modified_date
+        FROM unpartitioned_chapter_health
+        """,
+    )
+    op.drop_table("unpartitioned_chapter_health")
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    op.rename_table("chapter_health", "partitioned_chapter_health")
+    op.drop_index("ix_chapter_health_id", "partitioned_chapter_health", if_exists=True)
+    op.drop_index(
+        "uq_chapter_health_chapter_id_period_question",
+        "partitioned_chapter_health",
+        if_exists=True,
+    )
+    op.execute(
+        "ALTER TABLE partitioned_chapter_health "
+        "RENAME CONSTRAINT chapter_health_pkey TO partitioned_chapter_health_pkey",
+    )
+
+    create_chapter_health_table()
+    op.create_index(
+        "ix_chapter_health_chapter_id_period",
+        "chapter_health",
+        [
+            "chapter_id",
+            "health_question_id",
+            "year",
+            "month",
+            "week",
+            "created_date",
+        ],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.execute(
+        f"""
+        INSERT INTO chapter_health ({COLUMNS})
+        SELECT {COLUMNS} FROM partitioned_chapter_health
+        """,  # noqa: S608
+    )
+    # Dropping the partitioned table drops its partitions
+    op.drop_table("partitioned_chapter_health")
+
+
+def merge_upgrade_ops() -> None:
+    """Merge upgrade operations from multiple branches."""
+    pass
+
+
+def merge_downgrade_ops() -> None:
+    """Merge downgrade operations from multiple branches."""
+    pass
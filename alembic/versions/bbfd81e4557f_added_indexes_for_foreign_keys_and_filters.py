@@ -0,0 +1,328 @@
+"""
+added indexes for foreign keys and filters
+
+Revision ID: bbfd81e4557f
+Revises: b3c2204e90a5
+Created Date: 2026-10-16 09:12:41.518203+01:00
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "bbfd81e4557f"
+down_revision = "b3c2204e90a5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and does not lock
+    # writes so the migration is safe to run against the live database. Indexes
+    # left invalid by an interrupted run must be dropped before re-running.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_health_questions_section_id",
+            "health_questions",
+            ["section_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_chapter_health_chapter_id_period",
+            "chapter_health",
+            [
+                "chapter_id",
+                "health_question_id",
+                "year",
+                "month",
+                "week",
+                "created_date",
+            ],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_actions_assignee_id_due_date",
+            "actions",
+            ["assignee_id", "due_date"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_actions_chapter_id_due_date",
+            "actions",
+            ["chapter_id", "due_date"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_actions_section_id_due_date",
+            "actions",
+            ["section_id", "due_date"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_allocations_chapter_id",
+            "allocations",
+            ["chapter_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_allocations_user_id",
+            "allocations",
+            ["user_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_chapter_event_association_chapter_id",
+            "chapter_event_association",
+            ["chapter_id", "event_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_email",
+            "users",
+            ["email"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_full_name_created_date",
+            "users",
+            ["full_name", "created_date"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_chapters_zone_name",
+            "chapters",
+            ["zone", "name"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_committee_members_chapter_id",
+            "committee_members",
+            ["chapter_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_committee_members_natcom_buddy_id",
+            "committee_members",
+            ["natcom_buddy_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_chapter_updates_chapter_id",
+            "chapter_updates",
+            ["chapter_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_section_updates_section_id",
+            "section_updates",
+            ["section_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_matrix_meetings_zone",
+            "matrix_meetings",
+            ["zone"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_zonal_team_meetings_zone",
+            "zonal_team_meetings",
+            ["zone"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_section_meetings_section_id",
+            "section_meetings",
+            ["section_id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_membership_logs_chapter_id",
+            "membership_logs",
+            ["chapter_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_membership_logs_chapter_id",
+            table_name="membership_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_section_meetings_section_id",
+            table_name="section_meetings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_zonal_team_meetings_zone",
+            table_name="zonal_team_meetings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_matrix_meetings_zone",
+            table_name="matrix_meetings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_section_updates_section_id",
+            table_name="section_updates",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_chapter_updates_chapter_id",
+            table_name="chapter_updates",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_committee_members_natcom_buddy_id",
+            table_name="committee_members",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_committee_members_chapter_id",
+            table_name="committee_members",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_chapters_zone_name",
+            table_name="chapters",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_full_name_created_date",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_email",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_chapter_event_association_chapter_id",
+            table_name="chapter_event_association",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_allocations_user_id",
+            table_name="allocations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_allocations_chapter_id",
+            table_name="allocations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_actions_section_id_due_date",
+            table_name="actions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_actions_chapter_id_due_date",
+            table_name="actions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_actions_assignee_id_due_date",
+            table_name="actions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_chapter_health_chapter_id_period",
+            table_name="chapter_health",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_health_questions_section_id",
+            table_name="health_questions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def merge_upgrade_ops() -> None:
+    """Merge upgrade operations from multiple branches."""
+    pass
+
+
+def merge_downgrade_ops() -> None:
+    """Merge downgrade operations from multiple branches."""
+    pass
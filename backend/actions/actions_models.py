@@ -5,9 +5,11 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     func,
+    text,
 )
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
@@ -20,6 +22,26 @@ class Action(Base):
     """Action database model"""
 
     __tablename__ = "actions"
+    __table_args__ = (
+        Index(
+            "ix_actions_assignee_id_due_date",
+            "assignee_id",
+            "due_date",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_actions_chapter_id_due_date",
+            "chapter_id",
+            "due_date",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_actions_section_id_due_date",
+            "section_id",
+            "due_date",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
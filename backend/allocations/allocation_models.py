@@ -1,5 +1,5 @@
 """Allocation Database Models"""
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, func, text
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
 
@@ -11,6 +11,18 @@ class Allocation(Base):
     """Allocation database model"""
 
     __tablename__ = "allocations"
+    __table_args__ = (
+        Index(
+            "ix_allocations_chapter_id",
+            "chapter_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_allocations_user_id",
+            "user_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -1,5 +1,5 @@
 """Chapter Database Models"""
-from sqlalchemy import Boolean, Column, DateTime, String, func
+from sqlalchemy import Boolean, Column, DateTime, Index, String, func, text
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
 
@@ -12,6 +12,14 @@ class Chapter(Base):
     """Chapter database model."""
 
     __tablename__ = "chapters"
+    __table_args__ = (
+        Index(
+            "ix_chapters_zone_name",
+            "zone",
+            "name",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -5,7 +5,9 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette import status
 
@@ -13,10 +15,13 @@ from backend.chapters.chapters_models import Chapter
 from backend.chapters.chapters_schemas import ChapterCreate, ChapterRead, ChapterUpdate
 from backend.commands.get_paginated_result import GetPaginatedResult
 from backend.health.health_models import Section
-from backend.helpers import get_db
+from backend.helpers import get_db, get_read_db
 from backend.schemas import PaginationResult, SortBy
 from backend.users.users_commands.check_admin import check_admin
-from backend.users.users_commands.get_users import get_current_active_user
+from backend.users.users_commands.get_users import (
+    get_current_active_user,
+    get_current_active_user_async,
+)
 from backend.users.users_schemas import UserBase
 from backend.utils import convert_list_to_list, object_to_dict
 
@@ -27,6 +32,8 @@ chapters_router = APIRouter()
 
 db_session = Depends(get_db)
 current_user_instance = Depends(get_current_active_user)
+read_db_session = Depends(get_read_db)
+async_current_user_instance = Depends(get_current_active_user_async)
 
 
 @chapters_router.post(
@@ -94,10 +101,10 @@ def create_chapter(
         },
     },
 )
-def get_chapter(
+async def get_chapter(
     chapter_id: UUID,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """Get a chapter."""
     if current_user.chapter_id is not None:
@@ -108,7 +115,7 @@ def get_chapter(
             )
     else:
         check_admin(current_user)
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = await db.scalar(select(Chapter).filter(Chapter.id == chapter_id))
     if not chapter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -263,29 +270,31 @@ def delete_chapter(
     tags=["chapters"],
     description="Get all chapters",
 )
-def list_all_chapters(
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+async def list_all_chapters(
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """Get all chapters."""
     check_admin(current_user)
     zones: list[Row] = (
-        db.query(Chapter.zone)
-        .filter(Chapter.is_deleted.is_(False))
-        .distinct()
-        .order_by(Chapter.zone)
-        .all()
-    )
+        await db.execute(
+            select(Chapter.zone)
+            .filter(Chapter.is_deleted.is_(False))
+            .distinct()
+            .order_by(Chapter.zone),
+        )
+    ).all()
 
     output = []
     for zone in zones:
         chapters: list[Chapter] = (
-            db.query(Chapter)
-            .filter(Chapter.is_deleted.is_(False))
-            .filter(Chapter.zone == zone[0])
-            .order_by(Chapter.name)
-            .all()
-        )
+            await db.scalars(
+                select(Chapter)
+                .filter(Chapter.is_deleted.is_(False))
+                .filter(Chapter.zone == zone[0])
+                .order_by(Chapter.name),
+            )
+        ).all()
 
         output.append(
             {
@@ -312,11 +321,12 @@ def list_all_chapters(
     teams_output = []
 
     teams: list[Section] = (
-        db.query(Section)
-        .filter(Section.is_deleted.is_(False))
-        .order_by(Section.name)
-        .all()
-    )
+        await db.scalars(
+            select(Section)
+            .filter(Section.is_deleted.is_(False))
+            .order_by(Section.name),
+        )
+    ).all()
 
     for team in teams:
         teams_output.append(
@@ -373,16 +383,16 @@ def list_all_chapters(
 
 
 @chapters_router.get("/zones", tags=["zones"])
-def get_zones(
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+async def get_zones(
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """
     Get the zones
 
     Args:
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
 
     Returns:
@@ -391,12 +401,13 @@ def get_zones(
     """
     check_admin(current_user)
     zones: list[Row] = (
-        db.query(Chapter.zone)
-        .filter(Chapter.is_deleted.is_(False))
-        .distinct()
-        .order_by(Chapter.zone)
-        .all()
-    )
+        await db.execute(
+            select(Chapter.zone)
+            .filter(Chapter.is_deleted.is_(False))
+            .distinct()
+            .order_by(Chapter.zone),
+        )
+    ).all()
 
     output = []
 
@@ -409,18 +420,18 @@ def get_zones(
 
 
 @chapters_router.get("/chapters/{zone}", tags=["chapters"])
-def get_chapters_by_zone(
+async def get_chapters_by_zone(
     zone: str,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """
     Get the chapters by zone
 
     Args:
         zone (str): The zone
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         list[Chapter]: The chapters
@@ -428,12 +439,13 @@ def get_chapters_by_zone(
     """
     check_admin(current_user)
     chapters: list[Chapter] = (
-        db.query(Chapter)
-        .filter(Chapter.is_deleted.is_(False))
-        .filter(Chapter.zone == zone)
-        .order_by(Chapter.name)
-        .all()
-    )
+        await db.scalars(
+            select(Chapter)
+            .filter(Chapter.is_deleted.is_(False))
+            .filter(Chapter.zone == zone)
+            .order_by(Chapter.name),
+        )
+    ).all()
 
     output = []
 
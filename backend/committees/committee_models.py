@@ -1,5 +1,15 @@
 """Committee Database Models"""
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, String, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
 
@@ -11,6 +21,18 @@ class CommitteeMember(Base):
     """Committee Member database model."""
 
     __tablename__ = "committee_members"
+    __table_args__ = (
+        Index(
+            "ix_committee_members_chapter_id",
+            "chapter_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_committee_members_natcom_buddy_id",
+            "natcom_buddy_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
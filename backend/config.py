@@ -6,8 +6,25 @@ ALGORITHM = os.environ.get("ALGORITHM", "")
 BACKEND_ENDPOINT = os.environ.get("BACKEND_ENDPOINT", "")
 CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "")
 DATABASE_URL = os.environ.get("DATABASE_URL", "")
+DATABASE_POOL_SIZE = int(os.environ.get("DATABASE_POOL_SIZE", 5))
+DATABASE_MAX_OVERFLOW = int(os.environ.get("DATABASE_MAX_OVERFLOW", 10))
+DATABASE_POOL_TIMEOUT = int(os.environ.get("DATABASE_POOL_TIMEOUT", 30))
+DATABASE_POOL_RECYCLE = int(os.environ.get("DATABASE_POOL_RECYCLE", 1800))
+DATABASE_POOL_PRE_PING = os.environ.get("DATABASE_POOL_PRE_PING", "true").lower() in (
+    "1",
+    "t",
+    "true",
+)
+DATABASE_READ_URL = os.environ.get("DATABASE_READ_URL", "")
+DATABASE_READ_MAX_LAG = float(os.environ.get("DATABASE_READ_MAX_LAG", 30))
+DATABASE_READ_CHECK_INTERVAL = float(os.environ.get("DATABASE_READ_CHECK_INTERVAL", 10))
+DATABASE_READ_CHECK_TIMEOUT = float(os.environ.get("DATABASE_READ_CHECK_TIMEOUT", 2))
 ENVIRONMENT = os.environ.get("ENVIRONMENT", "")
 FRONTEND_ENDPOINT = os.environ.get("FRONTEND_ENDPOINT", "")
+MEMORY_SAMPLE_RATE = float(os.environ.get("MEMORY_SAMPLE_RATE", 0.01))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+PROFILER_INTERVAL = float(os.environ.get("PROFILER_INTERVAL", 0.001))
+PROFILER_MAX_PROFILES = int(os.environ.get("PROFILER_MAX_PROFILES", 20))
 LOGLEVEL = os.environ.get("LOGLEVEL", "")
 SECRET_KEY = os.environ.get("SECRET_KEY", "")
 UVICORN_RELOAD = os.environ.get("UVICORN_RELOAD", "")
@@ -1,14 +1,127 @@
 """Database module."""
+import asyncio
 import logging
 import os
+import time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import NullPool
 
+from backend.config import (
+    DATABASE_MAX_OVERFLOW,
+    DATABASE_POOL_PRE_PING,
+    DATABASE_POOL_RECYCLE,
+    DATABASE_POOL_SIZE,
+    DATABASE_POOL_TIMEOUT,
+    DATABASE_READ_CHECK_INTERVAL,
+    DATABASE_READ_CHECK_TIMEOUT,
+    DATABASE_READ_MAX_LAG,
+    DATABASE_READ_URL,
+)
+
 if TYPE_CHECKING:
     from sqlalchemy import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import Pool
+
+_session_factory: sessionmaker | None = None
+_async_session_factory: async_sessionmaker | None = None
+_async_read_session_factory: async_sessionmaker | None = None
+_replica_checked_at: float | None = None
+_replica_usable: bool = False
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica is behind the primary. A replica which has replayed everything
+# it has received is up to date even if no transaction has been replayed recently,
+# and on a primary both functions return NULL so the lag is reported as 0.
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()),
+            0
+        )
+    END
+    """,
+)
+
+
+def pool_options() -> dict:
+    """Get the create_engine pool options from the DATABASE_POOL_* settings."""
+    return {
+        "pool_size": DATABASE_POOL_SIZE,
+        "max_overflow": DATABASE_MAX_OVERFLOW,
+        "pool_timeout": DATABASE_POOL_TIMEOUT,
+        "pool_recycle": DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": DATABASE_POOL_PRE_PING,
+    }
+
+
+def create_database_engine(database_url: str | None = None) -> "Engine":
+    """
+    Create a pooled database engine.
+
+    Args:
+        database_url: database url
+
+    Returns:
+        Engine: database engine
+
+    """
+    if database_url is None:  # pragma: no cover
+        database_url = os.environ["DATABASE_URL"]
+    return create_engine(database_url, **pool_options())
+
+
+def async_database_url(database_url: str | None = None) -> str:
+    """
+    Get the asyncpg equivalent of a database url.
+
+    Args:
+        database_url: database url
+
+    Returns:
+        str: database url using the asyncpg driver
+
+    Examples:
+        >>> async_database_url("postgresql://chapter@chapter-db/chapter_backend")
+        'postgresql+asyncpg://chapter@chapter-db/chapter_backend'
+    """
+    if database_url is None:  # pragma: no cover
+        database_url = os.environ["DATABASE_URL"]
+    return (
+        make_url(database_url)
+        .set(drivername="postgresql+asyncpg")
+        .render_as_string(hide_password=False)
+    )
+
+
+def create_async_database_engine(
+    database_url: str | None = None,
+    pooled: bool = True,
+) -> "AsyncEngine":
+    """
+    Create an async database engine.
+
+    Args:
+        database_url: database url
+        pooled: whether to keep a connection pool. Connections cannot be shared
+            between event loops, so callers which create a loop per call (e.g. the
+            test client) should pass False.
+
+    Returns:
+        AsyncEngine: async database engine
+
+    """
+    if pooled:
+        return create_async_engine(async_database_url(database_url), **pool_options())
+    return create_async_engine(async_database_url(database_url), poolclass=NullPool)
 
 
 def session_local_factory(database_url: str | None = None) -> sessionmaker:
@@ -22,9 +135,7 @@ def session_local_factory(database_url: str | None = None) -> sessionmaker:
         sessionmaker: session factory
 
     """
-    if database_url is None:  # pragma: no cover
-        database_url = os.environ["DATABASE_URL"]
-    engine: Engine = create_engine(database_url, poolclass=NullPool)
+    engine: Engine = create_database_engine(database_url)
     session_factory: sessionmaker = sessionmaker(
         bind=engine,
         future=True,
@@ -39,4 +150,226 @@ def session_local_factory(database_url: str | None = None) -> sessionmaker:
     return session_factory
 
 
+def async_session_local_factory(
+    database_url: str | None = None,
+    pooled: bool = True,
+) -> async_sessionmaker:
+    """
+    Create an async session factory.
+
+    Args:
+        database_url: database url
+        pooled: whether to keep a connection pool
+
+    Returns:
+        async_sessionmaker: async session factory
+
+    """
+    return async_sessionmaker(
+        bind=create_async_database_engine(database_url, pooled),
+        expire_on_commit=False,
+    )
+
+
+def init_db(database_url: str | None = None) -> sessionmaker:
+    """
+    Create the process-wide session factory if it does not exist yet.
+
+    Args:
+        database_url: database url
+
+    Returns:
+        sessionmaker: session factory
+
+    """
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = session_local_factory(database_url)
+    return _session_factory
+
+
+def get_session_factory() -> sessionmaker:
+    """
+    Get the process-wide session factory.
+
+    The factory is normally created by the application lifespan, but it is created
+    lazily here for callers which run outside of it (e.g. scripts).
+    """
+    return init_db()
+
+
+def dispose_db() -> None:
+    """Close all pooled connections and forget the process-wide session factory."""
+    global _session_factory
+    if _session_factory is not None:
+        _session_factory.kw["bind"].dispose()
+        _session_factory = None
+
+
+def init_async_db(database_url: str | None = None) -> async_sessionmaker:
+    """
+    Create the process-wide async session factory if it does not exist yet.
+
+    Args:
+        database_url: database url
+
+    Returns:
+        async_sessionmaker: async session factory
+
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_session_local_factory(database_url)
+    return _async_session_factory
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get the process-wide async session factory."""
+    return init_async_db()
+
+
+async def dispose_async_db() -> None:
+    """Close all pooled async connections and forget the async session factory."""
+    global _async_session_factory
+    if _async_session_factory is not None:
+        await _async_session_factory.kw["bind"].dispose()
+        _async_session_factory = None
+
+
+def init_async_read_db(database_url: str | None = None) -> async_sessionmaker | None:
+    """
+    Create the process-wide read replica session factory if a replica is configured.
+
+    Args:
+        database_url: read replica database url, defaults to DATABASE_READ_URL
+
+    Returns:
+        async_sessionmaker | None: read replica session factory, None if there is no
+            read replica
+
+    """
+    global _async_read_session_factory
+    database_url = database_url or DATABASE_READ_URL
+    if _async_read_session_factory is None and database_url:
+        _async_read_session_factory = async_session_local_factory(database_url)
+    return _async_read_session_factory
+
+
+async def get_replica_lag(replica: async_sessionmaker) -> float:
+    """
+    Get the number of seconds the read replica is behind the primary.
+
+    Args:
+        replica: read replica session factory
+
+    Returns:
+        float: replication lag in seconds
+
+    """
+    async with replica() as db:
+        return float(await db.scalar(REPLICA_LAG_QUERY))
+
+
+async def replica_is_usable(replica: async_sessionmaker) -> bool:
+    """
+    Check whether the read replica is reachable and not lagging too far behind.
+
+    The result is cached for DATABASE_READ_CHECK_INTERVAL seconds so the check is
+    not repeated on every request.
+
+    Args:
+        replica: read replica session factory
+
+    Returns:
+        bool: True if reads should be sent to the replica
+
+    """
+    global _replica_checked_at, _replica_usable
+    now = time.monotonic()
+    if (
+        _replica_checked_at is not None
+        and now - _replica_checked_at < DATABASE_READ_CHECK_INTERVAL
+    ):
+        return _replica_usable
+
+    try:
+        lag = await asyncio.wait_for(
+            get_replica_lag(replica),
+            timeout=DATABASE_READ_CHECK_TIMEOUT,
+        )
+    except (OSError, SQLAlchemyError, TimeoutError):
+        logger.warning("Read replica is unavailable, reading from the primary")
+        _replica_usable = False
+    else:
+        _replica_usable = lag <= DATABASE_READ_MAX_LAG
+        if not _replica_usable:
+            logger.warning(
+                "Read replica is %.1f seconds behind, reading from the primary",
+                lag,
+            )
+    _replica_checked_at = now
+    return _replica_usable
+
+
+def mark_replica_unavailable() -> None:
+    """Stop reading from the replica until its next health check."""
+    global _replica_checked_at, _replica_usable
+    _replica_checked_at = time.monotonic()
+    _replica_usable = False
+
+
+def reset_replica_status() -> None:
+    """Forget the cached replica health check so the next read repeats it."""
+    global _replica_checked_at, _replica_usable
+    _replica_checked_at = None
+    _replica_usable = False
+
+
+async def get_async_read_session_factory() -> async_sessionmaker:
+    """
+    Get the session factory read-only queries should use.
+
+    Reads go to the replica when one is configured and healthy, and fall back to the
+    primary otherwise.
+
+    Returns
+        async_sessionmaker: read replica or primary async session factory
+
+    """
+    replica = init_async_read_db()
+    if replica is not None and await replica_is_usable(replica):
+        return replica
+    return get_async_session_factory()
+
+
+async def dispose_async_read_db() -> None:
+    """Close all pooled read replica connections and forget the replica factory."""
+    global _async_read_session_factory
+    if _async_read_session_factory is not None:
+        await _async_read_session_factory.kw["bind"].dispose()
+        _async_read_session_factory = None
+    reset_replica_status()
+
+
+def connection_pools() -> dict[str, "Pool"]:
+    """
+    Get the connection pools of the process-wide engines which have been created.
+
+    Returns
+        dict[str, Pool]: connection pools keyed by "primary", "primary_async" and
+            "replica"
+
+    """
+    session_factories = {
+        "primary": _session_factory,
+        "primary_async": _async_session_factory,
+        "replica": _async_read_session_factory,
+    }
+    return {
+        name: session_factory.kw["bind"].pool
+        for name, session_factory in session_factories.items()
+        if session_factory is not None
+    }
+
+
 Base = declarative_base()
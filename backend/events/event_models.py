@@ -1,5 +1,5 @@
 """Event Database Models"""
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, func, Date
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
 
@@ -125,11 +125,13 @@ class Event(Base):
     event_sub_type = relationship("EventSubType")
 
 
-
 class ChapterEventAssociation(Base):
     """Chapter Event Association table."""
 
     __tablename__ = "chapter_event_association"
+    __table_args__ = (
+        Index("ix_chapter_event_association_chapter_id", "chapter_id", "event_id"),
+    )
     id = Column(
         pg.UUID(as_uuid=True),
         primary_key=True,
@@ -0,0 +1,136 @@
+r"""
+Move deleted chapter health scores out of chapter_health into chapter_health_history.
+
+Scores used to be saved again rather than updated, and the superseded rows were
+deleted when chapter_health was given its unique index on each chapter, period and
+question, so only the current scores need to stay in the table. The rows are moved a
+batch at a time, each in its own transaction, then the table is vacuumed. Run
+
+    PYTHONPATH=. python -m backend.health.compact_chapter_health --batch-size 10000
+"""
+import argparse
+import os
+import time
+
+from sqlalchemy import delete, insert, select, text, true, tuple_
+from sqlalchemy.orm import Session
+
+from backend.database import get_session_factory, init_db
+from backend.health.health_models import ChapterHealth, ChapterHealthHistory
+
+COMPACT_BATCH_SIZE = 10_000
+ARCHIVED_COLUMNS = [
+    "id",
+    "chapter_id",
+    "health_question_id",
+    "score",
+    "comments",
+    "year",
+    "month",
+    "week",
+    "created_date",
+    "is_deleted",
+    "last_modified_date",
+]
+
+
+def archive_batch(
+    session: Session,
+    batch_size: int,
+    after: tuple | None = None,
+) -> list[tuple]:
+    """
+    Move a batch of deleted scores to the history table and commit.
+
+    The batch is the next deleted scores in primary key order, so moving every batch
+    reads the primary key index once.
+
+    Args:
+        session (Session): Database session
+        batch_size (int): The most scores to move
+        after (tuple | None): The id and year of the last score moved, if any
+
+    Returns:
+        list[tuple]: The id and year of each score moved
+
+    """
+    key = tuple_(ChapterHealth.id, ChapterHealth.year)
+    batch = (
+        select(ChapterHealth.id, ChapterHealth.year)
+        .filter(ChapterHealth.is_deleted.is_(True))
+        .filter(key > tuple_(*after) if after is not None else true())
+        .order_by(ChapterHealth.id, ChapterHealth.year)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .cte("batch")
+    )
+    archived = (
+        delete(ChapterHealth)
+        .where(key.in_(select(batch.c.id, batch.c.year)))
+        .returning(*(ChapterHealth.__table__.c[name] for name in ARCHIVED_COLUMNS))
+        .cte("archived")
+    )
+    moved = session.execute(
+        insert(ChapterHealthHistory)
+        .from_select(ARCHIVED_COLUMNS, select(archived))
+        .returning(ChapterHealthHistory.id, ChapterHealthHistory.year),
+    ).all()
+    session.commit()
+    return [tuple(row) for row in moved]
+
+
+def compact_chapter_health(
+    session: Session,
+    batch_size: int = COMPACT_BATCH_SIZE,
+) -> int:
+    """
+    Move every deleted score to the history table, then vacuum chapter_health.
+
+    Args:
+        session (Session): Database session
+        batch_size (int, optional): The most scores to move in each transaction.
+            Defaults to COMPACT_BATCH_SIZE.
+
+    Returns:
+        int: The number of scores moved
+
+    """
+    moved_count = 0
+    after = None
+    while True:
+        moved = archive_batch(session, batch_size, after)
+        moved_count += len(moved)
+        if len(moved) < batch_size:
+            break
+        after = max(moved)
+
+    # VACUUM cannot run in a transaction
+    with session.get_bind().connect().execution_options(
+        isolation_level="AUTOCOMMIT",
+    ) as connection:
+        connection.execute(text("VACUUM (ANALYZE) chapter_health"))
+    return moved_count
+
+
+def main() -> None:
+    """Compact chapter_health and print the number of scores moved."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        required="DATABASE_URL" not in os.environ,
+    )
+    parser.add_argument("--batch-size", type=int, default=COMPACT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    init_db(args.database_url)
+    with get_session_factory()() as session:
+        moved_count = compact_chapter_health(session, args.batch_size)
+    print(  # noqa: T201
+        f"Moved {moved_count:,} scores in {time.perf_counter() - start_time:.1f}s",
+    )
+
+
+if __name__ == "__main__":
+    main()
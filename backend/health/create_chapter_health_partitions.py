@@ -0,0 +1,129 @@
+r"""
+Create the chapter_health partitions for the current and coming years.
+
+chapter_health is partitioned by year. Scores for a year without a partition go to
+the default partition, and its partition cannot be created while they are there, so
+the partitions are created ahead of time, e.g. each December from cron. Scores
+already in the default partition are moved into the new partition. Run
+
+    PYTHONPATH=. python -m backend.health.create_chapter_health_partitions --years-ahead 1
+"""
+import argparse
+import os
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from backend.database import get_session_factory, init_db
+from backend.health.health_models import ChapterHealth
+from backend.utils import datetime_now
+
+CHAPTER_HEALTH_COLUMNS = ", ".join(ChapterHealth.__table__.columns.keys())
+YEARS_AHEAD = 1
+
+
+def create_chapter_health_partition(session: Session, year: int) -> bool:
+    """
+    Create the partition of a year, if it does not exist, and commit.
+
+    If the default partition has scores for the year, it is detached while they are
+    moved, so saving scores waits until the partition is created.
+
+    Args:
+        session (Session): Database session
+        year (int): The year
+
+    Returns:
+        bool: Whether the partition was created
+
+    """
+    partition = f"chapter_health_{year:d}"
+    if session.scalar(select(func.to_regclass(partition))) is not None:
+        return False
+
+    create_partition = text(
+        f"CREATE TABLE {partition} PARTITION OF chapter_health "
+        f"FOR VALUES FROM ({year:d}) TO ({year + 1:d})",
+    )
+    has_default_scores = session.scalar(
+        text(
+            "SELECT EXISTS (SELECT FROM chapter_health_default WHERE year = :year)",
+        ).bindparams(year=year),
+    )
+    if not has_default_scores:
+        session.execute(create_partition)
+        session.commit()
+        return True
+
+    detach_default = (
+        "ALTER TABLE chapter_health DETACH PARTITION chapter_health_default"
+    )
+    attach_default = (
+        "ALTER TABLE chapter_health ATTACH PARTITION chapter_health_default DEFAULT"
+    )
+    session.execute(text(detach_default))
+    session.execute(create_partition)
+    session.execute(
+        text(
+            f"""
+            WITH moved AS (
+                DELETE FROM chapter_health_default WHERE year = :year
+                RETURNING {CHAPTER_HEALTH_COLUMNS}
+            )
+            INSERT INTO chapter_health ({CHAPTER_HEALTH_COLUMNS})
+            SELECT {CHAPTER_HEALTH_COLUMNS} FROM moved
+            """,  # noqa: S608
+        ).bindparams(year=year),
+    )
+    session.execute(text(attach_default))
+    session.commit()
+    return True
+
+
+def create_chapter_health_partitions(
+    session: Session,
+    years_ahead: int = YEARS_AHEAD,
+) -> list[int]:
+    """
+    Create the partitions of the current year and the years after it.
+
+    Args:
+        session (Session): Database session
+        years_ahead (int, optional): The number of years after the current year to
+            create partitions for. Defaults to YEARS_AHEAD.
+
+    Returns:
+        list[int]: The years a partition was created for
+
+    """
+    current_year = datetime_now().year
+    return [
+        year
+        for year in range(current_year, current_year + years_ahead + 1)
+        if create_chapter_health_partition(session, year)
+    ]
+
+
+def main() -> None:
+    """Create the chapter_health partitions and print the years created."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        required="DATABASE_URL" not in os.environ,
+    )
+    parser.add_argument("--years-ahead", type=int, default=YEARS_AHEAD)
+    args = parser.parse_args()
+
+    init_db(args.database_url)
+    with get_session_factory()() as session:
+        years = create_chapter_health_partitions(session, args.years_ahead)
+    print(  # noqa: T201
+        f"Created partitions for {', '.join(map(str, years))}"
+        if years
+        else "Every partition exists",
+    )
+
+
+if __name__ == "__main__":
+    main()
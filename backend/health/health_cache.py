@@ -0,0 +1,142 @@
+"""In-memory cache of the health sections and questions"""
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.health.health_models import HealthQuestion, HealthReferenceVersion, Section
+
+
+@dataclass(frozen=True)
+class CachedSection:
+    """A section that has not been deleted."""
+
+    id: int
+    name: str
+    icon: str | None
+
+
+@dataclass(frozen=True)
+class CachedQuestion:
+    """A health question that has not been deleted."""
+
+    id: int
+    question: str
+    section_id: int
+    rag_guide: str | None
+    is_comments: bool
+
+
+@dataclass(frozen=True)
+class HealthReference:
+    """The sections and their questions at a version of the database."""
+
+    version: int | None
+    sections: dict[int, CachedSection]
+    questions: dict[int, list[CachedQuestion]]
+
+    def section_questions(
+        self: "HealthReference",
+        section_id: int,
+    ) -> list[CachedQuestion]:
+        """
+        Get the questions of a section.
+
+        Args:
+            section_id (int): The section id
+
+        Returns:
+            list[CachedQuestion]: The questions in id order
+
+        """
+        return self.questions.get(section_id, [])
+
+
+async def load_health_reference(db: AsyncSession) -> HealthReference:
+    """
+    Load the sections and their questions, in id order, with their version.
+
+    The version is read in the same statement, so it is the version of the sections
+    and questions loaded even if they are written to meanwhile.
+
+    Args:
+        db (AsyncSession): The database session
+
+    Returns:
+        HealthReference: The sections and questions
+
+    """
+    result = await db.execute(
+        select(
+            HealthReferenceVersion.version,
+            Section.id,
+            Section.name,
+            Section.icon,
+            HealthQuestion,
+        )
+        .select_from(HealthReferenceVersion)
+        .outerjoin(Section, Section.is_deleted.is_(False))
+        .outerjoin(
+            HealthQuestion,
+            (HealthQuestion.section_id == Section.id)
+            & HealthQuestion.is_deleted.is_(False),
+        )
+        .order_by(Section.id, HealthQuestion.id),
+    )
+    rows = result.all()
+
+    sections = {}
+    questions = {}
+    for _, section_id, name, icon, question in rows:
+        if section_id is None:
+            continue
+        sections[section_id] = CachedSection(id=section_id, name=name, icon=icon)
+        section_questions = questions.setdefault(section_id, [])
+        if question is not None:
+            section_questions.append(
+                CachedQuestion(
+                    id=question.id,
+                    question=question.question,
+                    section_id=section_id,
+                    rag_guide=question.rag_guide,
+                    is_comments=question.is_comments,
+                ),
+            )
+    return HealthReference(
+        version=rows[0].version if rows else None,
+        sections=sections,
+        questions=questions,
+    )
+
+
+class HealthReferenceCache:
+    """
+    The sections and questions, reloaded when the database has a newer version.
+
+    Each worker has its own copy, which is checked against the version bumped by
+    every write to the tables, so a change made by any worker is seen by all of them
+    once it is committed.
+    """
+
+    def __init__(self: "HealthReferenceCache") -> None:
+        """Create an empty cache."""
+        self.reference: HealthReference | None = None
+
+    async def get(self: "HealthReferenceCache", db: AsyncSession) -> HealthReference:
+        """
+        Get the sections and questions, loading them if they have changed.
+
+        Args:
+            db (AsyncSession): The database session
+
+        Returns:
+            HealthReference: The sections and questions
+
+        """
+        version = await db.scalar(select(HealthReferenceVersion.version))
+        if self.reference is None or self.reference.version != version:
+            self.reference = await load_health_reference(db)
+        return self.reference
+
+
+health_reference_cache = HealthReferenceCache()
@@ -1,12 +1,40 @@
 """Health Database Models"""
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 from backend.database import Base
 from backend.utils import datetime_now, generate_uuid
 
 
+class HealthReferenceVersion(Base):
+    """
+    Health Reference Version Database Model
+
+    A single row, bumped by triggers in the same transaction as every write to the
+    sections and health questions, so cached copies of them can tell when they are
+    out of date.
+    """
+
+    __tablename__ = "health_reference_version"
+    __table_args__ = (CheckConstraint("id", name="health_reference_version_one_row"),)
+    id = Column(Boolean, primary_key=True, default=True, server_default="true")
+    version = Column(BigInteger, nullable=False, default=1, server_default="1")
+
+
 class Section(Base):
     """Section Database Model"""
 
@@ -21,6 +49,13 @@ class HealthQuestion(Base):
     """Health Question Database Model"""
 
     __tablename__ = "health_questions"
+    __table_args__ = (
+        Index(
+            "ix_health_questions_section_id",
+            "section_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     question = Column(String, nullable=False)
@@ -30,6 +65,13 @@ class HealthQuestion(Base):
         nullable=False,
     )
     rag_guide = Column(String, nullable=True)
+    # Whether the question asks for comments rather than a score
+    is_comments = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+    )
     created_date = Column(
         DateTime(timezone=True),
         nullable=False,
@@ -47,9 +89,30 @@ class HealthQuestion(Base):
 
 
 class ChapterHealth(Base):
-    """Chapter Health Database Model"""
+    """
+    Chapter Health Database Model
+
+    The table is partitioned by year, with a partition for each year from the first
+    scores and a default partition for any other year. The partitions of the coming
+    years are created by backend.health.create_chapter_health_partitions.
+    """
 
     __tablename__ = "chapter_health"
+    __table_args__ = (
+        # The conflict target of the scores upsert. The latest scores are read from
+        # latest_chapter_health, so the index does not need to cover them.
+        Index(
+            "uq_chapter_health_chapter_id_period_question",
+            "chapter_id",
+            "year",
+            "month",
+            "week",
+            "health_question_id",
+            unique=True,
+            postgresql_where=text("is_deleted = false"),
+        ),
+        {"postgresql_partition_by": "RANGE (year)"},
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -70,7 +133,7 @@ class ChapterHealth(Base):
     )
     score = Column(Integer, nullable=True)
     comments = Column(String, nullable=True)
-    year = Column(Integer, nullable=True)
+    year = Column(Integer, primary_key=True)
     month = Column(Integer, nullable=True)
     week = Column(Integer, nullable=True)
 
@@ -94,3 +157,115 @@ class ChapterHealth(Base):
     )
 
     health_question = relationship("HealthQuestion")
+
+
+def comments_search_vector(comments: ColumnElement) -> ColumnElement:
+    """
+    Get the full text search document of health comments.
+
+    The text search configuration is a literal rather than a parameter, so queries
+    match the expression of the comments search index.
+
+    Args:
+        comments (ColumnElement): The comments
+
+    Returns:
+        ColumnElement: The comments as a tsvector
+
+    """
+    return func.to_tsvector(text("'english'::regconfig"), comments)
+
+
+Index(
+    "ix_chapter_health_comments_search",
+    comments_search_vector(ChapterHealth.comments),
+    postgresql_using="gin",
+    postgresql_where=text("is_deleted = false"),
+)
+
+
+class ChapterHealthHistory(Base):
+    """
+    Chapter Health History Database Model
+
+    Deleted and superseded ChapterHealth rows, moved out of chapter_health by
+    compact_chapter_health.
+    """
+
+    __tablename__ = "chapter_health_history"
+    __table_args__ = (
+        Index(
+            "ix_chapter_health_history_chapter_id_period",
+            "chapter_id",
+            "year",
+            "month",
+            "week",
+            "health_question_id",
+        ),
+    )
+
+    id = Column(pg.UUID(as_uuid=True), primary_key=True)
+    chapter_id = Column(
+        pg.UUID(as_uuid=True),
+        ForeignKey("chapters.id"),
+        nullable=False,
+    )
+    health_question_id = Column(
+        Integer,
+        ForeignKey("health_questions.id"),
+        nullable=False,
+    )
+    score = Column(Integer, nullable=True)
+    comments = Column(String, nullable=True)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=True)
+    week = Column(Integer, nullable=True)
+    created_date = Column(DateTime(timezone=True), nullable=False)
+    is_deleted = Column(Boolean, nullable=False)
+    last_modified_date = Column(DateTime(timezone=True), nullable=True)
+    archived_date = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.timezone(
+            "Europe/London",
+            func.timezone("Europe/London", func.current_timestamp()),
+        ),
+    )
+
+
+class LatestChapterHealth(Base):
+    """
+    Latest Chapter Health Database Model
+
+    The current score and comments of each chapter, period and question, kept up to
+    date by update_chapter_health so reads do not have to find the latest
+    ChapterHealth row.
+    """
+
+    __tablename__ = "latest_chapter_health"
+
+    chapter_id = Column(
+        pg.UUID(as_uuid=True),
+        ForeignKey("chapters.id"),
+        primary_key=True,
+    )
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    week = Column(Integer, primary_key=True)
+    health_question_id = Column(
+        Integer,
+        ForeignKey("health_questions.id"),
+        primary_key=True,
+    )
+    score = Column(Integer, nullable=True)
+    comments = Column(String, nullable=True)
+    last_modified_date = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.timezone(
+            "Europe/London",
+            func.timezone("Europe/London", func.current_timestamp()),
+        ),
+    )
+
+    health_question = relationship("HealthQuestion")
@@ -1,16 +1,46 @@
 """Endpoints for health"""
+from itertools import groupby
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
+from sqlalchemy import (
+    Float,
+    and_,
+    case,
+    cast,
+    exists,
+    false,
+    func,
+    select,
+    text,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ColumnCollection
+from sqlalchemy.sql.elements import ColumnElement
 from starlette import status
 
 from backend.chapters.chapters_models import Chapter
-from backend.health.health_models import ChapterHealth, HealthQuestion, Section
-from backend.helpers import get_db
+from backend.health.health_cache import health_reference_cache
+from backend.health.health_models import (
+    ChapterHealth,
+    HealthQuestion,
+    LatestChapterHealth,
+    Section,
+    comments_search_vector,
+)
+from backend.health.health_stats import PERCENTILES, rounded, section_statistics
+from backend.helpers import get_db, get_read_db
 from backend.users.users_commands.check_admin import check_admin
-from backend.users.users_commands.get_users import get_current_active_user
+from backend.users.users_commands.get_users import (
+    get_current_active_user,
+    get_current_active_user_async,
+)
 from backend.users.users_schemas import UserBase
 from backend.utils import datetime_now, generate_uuid
 
@@ -18,20 +48,181 @@ health_router = APIRouter()
 
 db_session = Depends(get_db)
 current_user_instance = Depends(get_current_active_user)
+read_db_session = Depends(get_read_db)
+async_current_user_instance = Depends(get_current_active_user_async)
+
+# Health checks are done in the first and third weeks of each month
+HEALTH_CHECK_WEEKS = (1, 3)
+# Months of health checks shown when no start period is given
+DEFAULT_HEALTH_MONTHS = 10
+PERIOD_PATTERN = r"^\d{4}-(0?[1-9]|1[0-2])-[1-5]$"
+
+from_period_query = Query(
+    None,
+    alias="from",
+    pattern=PERIOD_PATTERN,
+    description="First period as year-month-week, e.g. 2024-06-1",
+)
+period_query = Query(
+    None,
+    pattern=PERIOD_PATTERN,
+    description="Period as year-month-week, defaults to the latest scores",
+)
+required_period_query = Query(
+    pattern=PERIOD_PATTERN,
+    description="Period as year-month-week, e.g. 2024-06-1",
+)
+ranked_chapter_query = Query(None, description="Chapter, defaults to every chapter")
+rows_query = Query(20, ge=1, le=100, description="Results per page")
+page_query = Query(0, ge=0, description="Page, from 0")
+search_query = Query(min_length=1, description="Words to search the comments for")
+zone_query = Query(None, description="Zone, defaults to every chapter")
+to_period_query = Query(
+    None,
+    alias="to",
+    pattern=PERIOD_PATTERN,
+    description="Last period as year-month-week, defaults to the latest scores",
+)
+
+
+def health_value(score: int | None, comments: str | None) -> int | str | None:
+    """
+    Get the value shown for a health score, its comments if it has no score.
+
+    Args:
+        score (int | None): The health score
+        comments (str | None): The health comments
+
+    Returns:
+        int | str | None: The score, else the comments, else None
+
+    """
+    if score is not None:
+        return score
+    return comments or None
+
+
+def round_average(average: float | None) -> float | None:
+    """
+    Round an average score to 2 decimal places.
+
+    Args:
+        average (float | None): The average, None if there are no scores
+
+    Returns:
+        float | None: The rounded average
+
+    Examples:
+        >>> round_average(2.3333)
+        2.33
+    """
+    return round(average, 2) if average is not None else None
+
+
+def parse_period(period: str) -> tuple[int, int, int]:
+    """
+    Parse a year-month-week period.
+
+    Args:
+        period (str): The period, e.g. 2024-06-1
+
+    Returns:
+        tuple[int, int, int]: The year, month and week
+
+    Examples:
+        >>> parse_period("2024-06-1")
+        (2024, 6, 1)
+    """
+    year, month, week = period.split("-")
+    return int(year), int(month), int(week)
+
+
+def months_before(period: tuple[int, int, int], months: int) -> tuple[int, int]:
+    """
+    Get the year and month a number of months before a period.
+
+    Args:
+        period (tuple[int, int, int]): The year, month and week
+        months (int): The number of months
+
+    Returns:
+        tuple[int, int]: The year and month
+
+    Examples:
+        >>> months_before((2025, 3, 3), 9)
+        (2024, 6)
+    """
+    year, month = divmod(period[0] * 12 + period[1] - 1 - months, 12)
+    return year, month + 1
+
+
+def health_check_periods(
+    start: tuple[int, int, int],
+    end: tuple[int, int, int],
+) -> list[tuple[int, int, int]]:
+    """
+    Get the health check periods between two periods, inclusive.
+
+    Args:
+        start (tuple[int, int, int]): The first year, month and week
+        end (tuple[int, int, int]): The last year, month and week
+
+    Returns:
+        list[tuple[int, int, int]]: The year, month and week of each health check
+
+    Examples:
+        >>> health_check_periods((2024, 12, 3), (2025, 1, 3))
+        [(2024, 12, 3), (2025, 1, 1), (2025, 1, 3)]
+    """
+    periods = []
+    for months in range(
+        start[0] * 12 + start[1] - 1,
+        end[0] * 12 + end[1],
+    ):
+        year, month = divmod(months, 12)
+        periods.extend(
+            (year, month + 1, week)
+            for week in HEALTH_CHECK_WEEKS
+            if start <= (year, month + 1, week) <= end
+        )
+    return periods
+
+
+def best_matches_first(matches: ColumnCollection) -> list[ColumnElement]:
+    """
+    Get the order of comments search matches, best match first.
+
+    The newest period comes first among equally ranked matches, and the score id
+    makes the order stable across pages.
+
+    Args:
+        matches (ColumnCollection): The columns of the matches
+
+    Returns:
+        list[ColumnElement]: The order by clauses
+
+    """
+    return [
+        matches.rank.desc(),
+        matches.year.desc(),
+        matches.month.desc(),
+        matches.week.desc(),
+        matches.id,
+    ]
 
 
 @health_router.get(
     "/health/{chapter_id}/year/{year}/month/{month}/week/{week}/question/{question_id}",
     tags=["chapter_health"],
 )
-def get_chapter_health(  # noqa: PLR0913
+async def get_chapter_health(  # noqa: PLR0913
     chapter_id: UUID,
     year: int,
     month: int,
     week: int,
     question_id: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> int:
     """
     Get the health score for a chapter in a given month and year for a given question
@@ -41,120 +232,159 @@ def get_chapter_health(  # noqa: PLR0913
         year (int): The year
         month (int): The month
         question_id (int): The question id
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         int: The health score
 
     """
     check_admin(current_user)
-    chapter_health: ChapterHealth = (
-        db.query(ChapterHealth)
-        .join(HealthQuestion, ChapterHealth.health_question_id == HealthQuestion.id)
-        .filter(ChapterHealth.chapter_id == chapter_id)
-        .filter(ChapterHealth.year == year)
-        .filter(ChapterHealth.month == month)
-        .filter(ChapterHealth.week == week)
-        .filter(ChapterHealth.health_question_id == question_id)
-        .filter(HealthQuestion.is_deleted.is_(False))
-        .filter(ChapterHealth.is_deleted.is_(False))
-        .order_by(ChapterHealth.created_date.desc())
-    ).first()
-
-    return chapter_health.score if chapter_health else None
+    return await db.scalar(
+        select(LatestChapterHealth.score)
+        .join(
+            HealthQuestion,
+            LatestChapterHealth.health_question_id == HealthQuestion.id,
+        )
+        .filter(LatestChapterHealth.chapter_id == chapter_id)
+        .filter(LatestChapterHealth.year == year)
+        .filter(LatestChapterHealth.month == month)
+        .filter(LatestChapterHealth.week == week)
+        .filter(LatestChapterHealth.health_question_id == question_id)
+        .filter(HealthQuestion.is_deleted.is_(False)),
+    )
 
 
 @health_router.get(
     "/health/{chapter_id}/section/{section_id}",
     tags=["chapter_health"],
 )
-def get_chapter_health_by_section(
+async def get_chapter_health_by_section(  # noqa: PLR0913
     chapter_id: UUID,
     section_id: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    from_period: str | None = from_period_query,
+    to_period: str | None = to_period_query,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> list[dict]:
     """
     Get the health scores for a chapter by section
 
+    There is a row for every health check between the periods, and for any other
+    period the chapter has scores for.
+
     Args:
         chapter_id (UUID): The chapter id
         section_id (int): The section id
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        from_period (str, optional): The first period. Defaults to ten months of
+            health checks before to_period.
+        to_period (str, optional): The last period. Defaults to the latest period
+            the chapter has scores for, or the current month if it has none.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         list[dict]: The health scores
 
     """
     check_admin(current_user)
-    periods: list[dict] = [
-        {"year": 2024, "month": 6, "week": 1},
-        {"year": 2024, "month": 6, "week": 3},
-        {"year": 2024, "month": 7, "week": 1},
-        {"year": 2024, "month": 7, "week": 3},
-        {"year": 2024, "month": 8, "week": 1},
-        {"year": 2024, "month": 8, "week": 3},
-        {"year": 2024, "month": 9, "week": 1},
-        {"year": 2024, "month": 9, "week": 3},
-        {"year": 2024, "month": 10, "week": 1},
-        {"year": 2024, "month": 10, "week": 3},
-        {"year": 2024, "month": 11, "week": 1},
-        {"year": 2024, "month": 11, "week": 3},
-        {"year": 2024, "month": 12, "week": 1},
-        {"year": 2024, "month": 12, "week": 3},
-        {"year": 2025, "month": 1, "week": 1},
-        {"year": 2025, "month": 1, "week": 3},
-        {"year": 2025, "month": 2, "week": 1},
-        {"year": 2025, "month": 2, "week": 3},
-        {"year": 2025, "month": 3, "week": 1},
-        {"year": 2025, "month": 3, "week": 3},
-    ]
-
-    questions: list[HealthQuestion] = (
-        db.query(HealthQuestion)
-        .filter(HealthQuestion.is_deleted.is_(False))
-        .filter(HealthQuestion.section_id == section_id)
-        .all()
-    )
-
-    for period in periods:
-        for question in questions:
-            chapter_health: ChapterHealth = (
-                db.query(ChapterHealth)
-                .filter(ChapterHealth.chapter_id == chapter_id)
-                .filter(ChapterHealth.year == period["year"])
-                .filter(ChapterHealth.month == period["month"])
-                .filter(ChapterHealth.week == period["week"])
-                .filter(ChapterHealth.health_question_id == question.id)
-                .filter(ChapterHealth.is_deleted.is_(False))
-                .order_by(ChapterHealth.created_date.desc())
-            ).first()
-
-            period[question.id] = (
-                chapter_health.score
-                if chapter_health and chapter_health.score is not None
-                else chapter_health.comments
-                if chapter_health and chapter_health.comments
-                else None
+    if to_period:
+        end = parse_period(to_period)
+    else:
+        latest_period = (
+            await db.execute(
+                select(
+                    LatestChapterHealth.year,
+                    LatestChapterHealth.month,
+                    LatestChapterHealth.week,
+                )
+                .filter(LatestChapterHealth.chapter_id == chapter_id)
+                .order_by(
+                    LatestChapterHealth.year.desc(),
+                    LatestChapterHealth.month.desc(),
+                    LatestChapterHealth.week.desc(),
+                )
+                .limit(1),
             )
+        ).first()
+        now = datetime_now()
+        end = (
+            tuple(latest_period)
+            if latest_period
+            else (now.year, now.month, HEALTH_CHECK_WEEKS[-1])
+        )
+    if from_period:
+        start = parse_period(from_period)
+    else:
+        start = (*months_before(end, DEFAULT_HEALTH_MONTHS - 1), HEALTH_CHECK_WEEKS[0])
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The from period must not be after the to period",
+        )
 
-    return periods
+    reference = await health_reference_cache.get(db)
+    questions = reference.section_questions(section_id)
+
+    # Every score in the range, in one range scan of the latest scores' primary key
+    latest_health = await db.execute(
+        select(
+            LatestChapterHealth.year,
+            LatestChapterHealth.month,
+            LatestChapterHealth.week,
+            LatestChapterHealth.health_question_id,
+            LatestChapterHealth.score,
+            LatestChapterHealth.comments,
+        )
+        .filter(LatestChapterHealth.chapter_id == chapter_id)
+        .filter(
+            tuple_(
+                LatestChapterHealth.year,
+                LatestChapterHealth.month,
+                LatestChapterHealth.week,
+            ).between(start, end),
+        )
+        .filter(
+            LatestChapterHealth.health_question_id.in_(
+                [question.id for question in questions],
+            ),
+        ),
+    )
+    health_values = {
+        (year, month, week, question_id): health_value(score, comments)
+        for year, month, week, question_id, score, comments in latest_health
+    }
+
+    periods = sorted(
+        set(health_check_periods(start, end))
+        | {(year, month, week) for year, month, week, _ in health_values},
+    )
+    return [
+        {
+            "year": year,
+            "month": month,
+            "week": week,
+            **{
+                question.id: health_values.get((year, month, week, question.id))
+                for question in questions
+            },
+        }
+        for year, month, week in periods
+    ]
 
 
 @health_router.get(
     "/health/zone/{zone}/year/{year}/month/{month}/week/{week}/section/{section_id}",
     tags=["chapter_health"],
 )
-def get_chapter_health_by_section_and_period(  # noqa: PLR0913
+async def get_chapter_health_by_section_and_period(  # noqa: PLR0913
     zone: str,
     year: int,
     month: int,
     week: int,
     section_id: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """
     Get the health scores for a chapter by section
@@ -164,88 +394,675 @@ def get_chapter_health_by_section_and_period(  # noqa: PLR0913
         year (int): The year
         month (int): The month
         section_id (int): The section id
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         list[dict]: The health scores
 
     """
     check_admin(current_user)
-    chapters: list[Chapter] = (
-        db.query(Chapter)
+    questions = (
+        select(HealthQuestion.id)
+        .filter(HealthQuestion.section_id == section_id)
+        .filter(HealthQuestion.is_deleted.is_(False))
+        .subquery()
+    )
+
+    # One row per chapter, with every question's latest score and comments in
+    # question order. Chapters are outer joined to the questions so a chapter is
+    # listed even if the section has no questions.
+    chapter_rows = await db.execute(
+        select(
+            Chapter.id,
+            Chapter.name,
+            func.array_agg(aggregate_order_by(questions.c.id, questions.c.id)),
+            func.array_agg(
+                aggregate_order_by(LatestChapterHealth.score, questions.c.id),
+            ),
+            func.array_agg(
+                aggregate_order_by(LatestChapterHealth.comments, questions.c.id),
+            ),
+            cast(func.avg(LatestChapterHealth.score), Float),
+        )
+        .select_from(Chapter)
+        .outerjoin(questions, true())
+        .outerjoin(
+            LatestChapterHealth,
+            and_(
+                LatestChapterHealth.chapter_id == Chapter.id,
+                LatestChapterHealth.year == year,
+                LatestChapterHealth.month == month,
+                LatestChapterHealth.week == week,
+                LatestChapterHealth.health_question_id == questions.c.id,
+            ),
+        )
         .filter(Chapter.zone == zone)
         .filter(Chapter.is_deleted.is_(False))
-        .order_by(Chapter.name)
-        .all()
+        .group_by(Chapter.id, Chapter.name)
+        .order_by(Chapter.name),
     )
 
     output = []
+    for chapter_id, name, question_ids, scores, comments, average in chapter_rows:
+        output_dict = {"chapter_id": str(chapter_id), "chapter": name}
+        output_dict.update(
+            {
+                question_id: health_value(score, comment)
+                for question_id, score, comment in zip(
+                    question_ids,
+                    scores,
+                    comments,
+                    strict=True,
+                )
+                if question_id is not None
+            },
+        )
+        output_dict["average"] = round_average(average)
+        output.append(output_dict)
 
-    questions = (
-        db.query(HealthQuestion)
-        .filter(HealthQuestion.section_id == section_id)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=output,
+    )
+
+
+@health_router.get("/health/zone/{zone}/stats", tags=["chapter_health"])
+async def get_zone_health_statistics(
+    zone: str,
+    period: str | None = period_query,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
+) -> JSONResponse:
+    """
+    Get statistics comparing the zone's chapters in each section for a period
+
+    Each chapter's scores are averaged by section, then each section gets the mean,
+    median, standard deviation and percentiles of the chapter averages, and each
+    chapter its z-score in every section. Only chapters and sections with scores in
+    the period are included.
+
+    Args:
+        zone (str): The zone
+        period (str, optional): The period. Defaults to the zone's latest scores.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
+
+    Returns:
+        JSONResponse: The section statistics and chapter z-scores
+
+    """
+    check_admin(current_user)
+    if period:
+        year, month, week = parse_period(period)
+    else:
+        latest_period = (
+            await db.execute(
+                select(
+                    LatestChapterHealth.year,
+                    LatestChapterHealth.month,
+                    LatestChapterHealth.week,
+                )
+                .join(Chapter, LatestChapterHealth.chapter_id == Chapter.id)
+                .filter(Chapter.zone == zone)
+                .order_by(
+                    LatestChapterHealth.year.desc(),
+                    LatestChapterHealth.month.desc(),
+                    LatestChapterHealth.week.desc(),
+                )
+                .limit(1),
+            )
+        ).first()
+        if latest_period is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No health scores found for {zone}",
+            )
+        year, month, week = latest_period
+
+    scores = (
+        await db.execute(
+            select(
+                Chapter.id,
+                Chapter.name,
+                Section.id,
+                Section.name,
+                LatestChapterHealth.score,
+            )
+            .join(Chapter, LatestChapterHealth.chapter_id == Chapter.id)
+            .join(
+                HealthQuestion,
+                LatestChapterHealth.health_question_id == HealthQuestion.id,
+            )
+            .join(Section, HealthQuestion.section_id == Section.id)
+            .filter(Chapter.zone == zone)
+            .filter(LatestChapterHealth.year == year)
+            .filter(LatestChapterHealth.month == month)
+            .filter(LatestChapterHealth.week == week)
+            .filter(LatestChapterHealth.score.is_not(None))
+            .filter(Chapter.is_deleted.is_(False))
+            .filter(HealthQuestion.is_deleted.is_(False))
+            .filter(Section.is_deleted.is_(False)),
+        )
+    ).all()
+
+    chapter_ids, chapter_names, section_ids, section_names, values = (
+        zip(*scores, strict=True) if scores else ((), (), (), (), ())
+    )
+    chapters = dict(zip(chapter_ids, chapter_names, strict=True))
+    sections = dict(zip(section_ids, section_names, strict=True))
+    # Chapters in name order and sections in id order, with each score's position
+    chapter_order = sorted(chapters, key=lambda chapter_id: chapters[chapter_id])
+    section_order = sorted(sections)
+    chapter_positions = {chapter_id: i for i, chapter_id in enumerate(chapter_order)}
+    section_positions = {section_id: i for i, section_id in enumerate(section_order)}
+    stats = section_statistics(
+        np.fromiter(map(chapter_positions.get, chapter_ids), int, len(scores)),
+        np.fromiter(map(section_positions.get, section_ids), int, len(scores)),
+        np.fromiter(values, float, len(scores)),
+        (len(chapter_order), len(section_order)),
+    )
+
+    section_percentiles = rounded(stats.percentiles.T) if scores else []
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "zone": zone,
+            "year": year,
+            "month": month,
+            "week": week,
+            "sections": [
+                {
+                    "section_id": section_id,
+                    "section": sections[section_id],
+                    "chapters": count,
+                    "mean": mean,
+                    "median": median,
+                    "std": std,
+                    "percentiles": dict(
+                        zip(map(str, PERCENTILES), percentiles, strict=True),
+                    ),
+                }
+                for section_id, count, mean, median, std, percentiles in zip(
+                    section_order,
+                    stats.counts.tolist(),
+                    rounded(stats.mean),
+                    rounded(stats.median),
+                    rounded(stats.std),
+                    section_percentiles,
+                    strict=True,
+                )
+            ],
+            "chapters": [
+                {
+                    "chapter_id": str(chapter_id),
+                    "chapter": chapters[chapter_id],
+                    "averages": averages,
+                    "z_scores": z_scores,
+                }
+                for chapter_id, averages, z_scores in zip(
+                    chapter_order,
+                    rounded(stats.averages),
+                    rounded(stats.z_scores),
+                    strict=True,
+                )
+            ],
+        },
+    )
+
+
+@health_router.get("/health/zone/{zone}/rankings", tags=["chapter_health"])
+async def get_zone_health_rankings(
+    zone: str,
+    period: str = required_period_query,
+    chapter_id: UUID | None = ranked_chapter_query,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
+) -> list[dict]:
+    """
+    Get how the zone's chapters rank by their average score in each section
+
+    The best chapter in a section has rank 1, and chapters with the same average share
+    a rank. The percentile is the fraction of the zone's other chapters with a lower
+    average.
+
+    Args:
+        zone (str): The zone
+        period (str): The period
+        chapter_id (UUID, optional): The chapter. Defaults to every chapter.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
+
+    Returns:
+        list[dict]: Each section's chapters, best first
+
+    """
+    check_admin(current_user)
+    year, month, week = parse_period(period)
+
+    averages = (
+        select(
+            Chapter.id.label("chapter_id"),
+            Chapter.name.label("chapter"),
+            Section.id.label("section_id"),
+            Section.name.label("section"),
+            func.avg(cast(LatestChapterHealth.score, Float)).label("average"),
+        )
+        .join(Chapter, LatestChapterHealth.chapter_id == Chapter.id)
+        .join(
+            HealthQuestion,
+            LatestChapterHealth.health_question_id == HealthQuestion.id,
+        )
+        .join(Section, HealthQuestion.section_id == Section.id)
+        .filter(Chapter.zone == zone)
+        .filter(LatestChapterHealth.year == year)
+        .filter(LatestChapterHealth.month == month)
+        .filter(LatestChapterHealth.week == week)
+        .filter(LatestChapterHealth.score.is_not(None))
+        .filter(Chapter.is_deleted.is_(False))
         .filter(HealthQuestion.is_deleted.is_(False))
-        .all()
+        .filter(Section.is_deleted.is_(False))
+        .group_by(Chapter.id, Chapter.name, Section.id, Section.name)
+        .cte("section_averages")
+    )
+    # Every chapter is ranked before a single chapter is picked out
+    rankings = select(
+        averages,
+        func.rank()
+        .over(partition_by=averages.c.section_id, order_by=averages.c.average.desc())
+        .label("rank"),
+        func.percent_rank(type_=Float)
+        .over(partition_by=averages.c.section_id, order_by=averages.c.average)
+        .label("percentile"),
+    ).subquery("rankings")
+    ranking_rows = await db.execute(
+        select(rankings)
+        .filter(
+            rankings.c.chapter_id == chapter_id if chapter_id is not None else true(),
+        )
+        .order_by(
+            rankings.c.section_id,
+            rankings.c.rank,
+            rankings.c.chapter,
+            rankings.c.chapter_id,
+        ),
     )
 
-    for chapter in chapters:
-        output_dict = {
-            "chapter_id": str(chapter.id),
-            "chapter": chapter.name,
+    return [
+        {
+            "section_id": section_id,
+            "section": section,
+            "chapters": [
+                {
+                    "chapter_id": str(row.chapter_id),
+                    "chapter": row.chapter,
+                    "average": round_average(row.average),
+                    "rank": row.rank,
+                    "percentile": round_average(row.percentile),
+                }
+                for row in section_rows
+            ],
         }
-        for question in questions:
-            chapter_health: ChapterHealth = (
-                db.query(ChapterHealth)
-                .filter(ChapterHealth.chapter_id == chapter.id)
-                .filter(ChapterHealth.year == year)
-                .filter(ChapterHealth.month == month)
-                .filter(ChapterHealth.week == week)
-                .filter(ChapterHealth.is_deleted.is_(False))
-                .filter(ChapterHealth.health_question_id == question.id)
-                .order_by(ChapterHealth.created_date.desc())
-                .first()
-            )
+        for (section_id, section), section_rows in groupby(
+            ranking_rows,
+            key=lambda row: (row.section_id, row.section),
+        )
+    ]
 
-            output_dict[question.id] = (
-                chapter_health.score
-                if chapter_health and chapter_health.score is not None
-                else chapter_health.comments
-                if chapter_health and chapter_health.comments
-                else None
-            )
 
-        try:
-            output_dict["average"] = round(
-                sum(
-                    [
-                        output_dict[question.id]
-                        for question in questions
-                        if output_dict[question.id] is not None
-                        and isinstance(output_dict[question.id], int)
-                    ],
+@health_router.get("/health/trends", tags=["chapter_health"])
+async def get_health_trends(
+    zone: str | None = zone_query,
+    from_period: str | None = from_period_query,
+    to_period: str | None = to_period_query,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
+) -> list[dict]:
+    """
+    Get how each chapter's section averages changed between the periods
+
+    Each section has its average score in every period the chapter has scores for,
+    the change from the chapter's previous period and the slope of the averages'
+    linear trend, in score per month.
+
+    Args:
+        zone (str, optional): The zone. Defaults to every chapter.
+        from_period (str, optional): The first period. Defaults to ten months of
+            health checks before to_period.
+        to_period (str, optional): The last period. Defaults to the latest period
+            with scores.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
+
+    Returns:
+        list[dict]: The chapters' section trends
+
+    """
+    check_admin(current_user)
+    zone_filter = Chapter.zone == zone if zone is not None else true()
+    if to_period:
+        end = parse_period(to_period)
+    else:
+        latest_period = (
+            await db.execute(
+                select(
+                    LatestChapterHealth.year,
+                    LatestChapterHealth.month,
+                    LatestChapterHealth.week,
+                )
+                .join(Chapter, LatestChapterHealth.chapter_id == Chapter.id)
+                .filter(zone_filter)
+                .order_by(
+                    LatestChapterHealth.year.desc(),
+                    LatestChapterHealth.month.desc(),
+                    LatestChapterHealth.week.desc(),
                 )
-                / len(
-                    [
-                        question.id
-                        for question in questions
-                        if output_dict[question.id] is not None
-                        and isinstance(output_dict[question.id], int)
+                .limit(1),
+            )
+        ).first()
+        if latest_period is None:
+            return []
+        end = tuple(latest_period)
+    if from_period:
+        start = parse_period(from_period)
+    else:
+        start = (*months_before(end, DEFAULT_HEALTH_MONTHS - 1), HEALTH_CHECK_WEEKS[0])
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The from period must not be after the to period",
+        )
+
+    averages = (
+        select(
+            Chapter.id.label("chapter_id"),
+            Chapter.name.label("chapter"),
+            Section.id.label("section_id"),
+            Section.name.label("section"),
+            LatestChapterHealth.year,
+            LatestChapterHealth.month,
+            LatestChapterHealth.week,
+            func.avg(cast(LatestChapterHealth.score, Float)).label("average"),
+        )
+        .join(Chapter, LatestChapterHealth.chapter_id == Chapter.id)
+        .join(
+            HealthQuestion,
+            LatestChapterHealth.health_question_id == HealthQuestion.id,
+        )
+        .join(Section, HealthQuestion.section_id == Section.id)
+        .filter(zone_filter)
+        .filter(
+            tuple_(
+                LatestChapterHealth.year,
+                LatestChapterHealth.month,
+                LatestChapterHealth.week,
+            ).between(start, end),
+        )
+        .filter(LatestChapterHealth.score.is_not(None))
+        .filter(Chapter.is_deleted.is_(False))
+        .filter(HealthQuestion.is_deleted.is_(False))
+        .filter(Section.is_deleted.is_(False))
+        .group_by(
+            Chapter.id,
+            Chapter.name,
+            Section.id,
+            Section.name,
+            LatestChapterHealth.year,
+            LatestChapterHealth.month,
+            LatestChapterHealth.week,
+        )
+        .cte("period_averages")
+    )
+    chapter_section = (averages.c.chapter_id, averages.c.section_id)
+    period_order = (averages.c.year, averages.c.month, averages.c.week)
+    # Health checks are in the first and third weeks, so a week is a quarter month
+    months = cast(
+        averages.c.year * 12 + averages.c.month - 1 + (averages.c.week - 1) / 4.0,
+        Float,
+    )
+
+    # Every section average with its change from the previous period and the
+    # slope of the chapter's trend in the section, in one pass of window functions
+    trend_rows = await db.execute(
+        select(
+            averages.c.chapter_id,
+            averages.c.chapter,
+            averages.c.section_id,
+            averages.c.section,
+            *period_order,
+            averages.c.average,
+            averages.c.average
+            - func.lag(averages.c.average).over(
+                partition_by=chapter_section,
+                order_by=period_order,
+            ),
+            func.regr_slope(averages.c.average, months).over(
+                partition_by=chapter_section,
+            ),
+        ).order_by(
+            averages.c.chapter,
+            averages.c.chapter_id,
+            averages.c.section_id,
+            *period_order,
+        ),
+    )
+
+    output = []
+    for (chapter_id, chapter), chapter_rows in groupby(
+        trend_rows,
+        key=lambda row: (row[0], row[1]),
+    ):
+        sections = []
+        for (section_id, section, slope), section_rows in groupby(
+            chapter_rows,
+            key=lambda row: (row[2], row[3], row[9]),
+        ):
+            sections.append(
+                {
+                    "section_id": section_id,
+                    "section": section,
+                    "slope": round_average(slope),
+                    "periods": [
+                        {
+                            "year": row[4],
+                            "month": row[5],
+                            "week": row[6],
+                            "average": round_average(row[7]),
+                            "delta": round_average(row[8]),
+                        }
+                        for row in section_rows
                     ],
-                ),
-                2,
+                },
             )
-        except ZeroDivisionError:
-            output_dict["average"] = None
+        output.append(
+            {"chapter_id": str(chapter_id), "chapter": chapter, "sections": sections},
+        )
+    return output
 
-        output.append(output_dict)
+
+@health_router.get("/health/heatmap", tags=["chapter_health"])
+async def get_health_heatmap(
+    from_period: str | None = from_period_query,
+    to_period: str | None = to_period_query,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
+) -> JSONResponse:
+    """
+    Get the average score of every zone, period and section as a grid
+
+    The zones, periods and sections are listed once, and the averages are a flat
+    list in zone, then period, then section order, with None where there are no
+    scores. The average of zone z, period p and section s is at
+    (z * len(periods) + p) * len(sections) + s.
+
+    Args:
+        from_period (str, optional): The first period. Defaults to ten months of
+            health checks before to_period.
+        to_period (str, optional): The last period. Defaults to the current month.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
+
+    Returns:
+        JSONResponse: The grid's axes and averages
+
+    """
+    check_admin(current_user)
+    if to_period:
+        end = parse_period(to_period)
+    else:
+        now = datetime_now()
+        end = (now.year, now.month, HEALTH_CHECK_WEEKS[-1])
+    if from_period:
+        start = parse_period(from_period)
+    else:
+        start = (*months_before(end, DEFAULT_HEALTH_MONTHS - 1), HEALTH_CHECK_WEEKS[0])
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The from period must not be after the to period",
+        )
+
+    averages = (
+        await db.execute(
+            select(
+                Chapter.zone,
+                LatestChapterHealth.year,
+                LatestChapterHealth.month,
+                LatestChapterHealth.week,
+                Section.id,
+                Section.name,
+                func.avg(cast(LatestChapterHealth.score, Float)),
+            )
+            .join(Chapter, LatestChapterHealth.chapter_id == Chapter.id)
+            .join(
+                HealthQuestion,
+                LatestChapterHealth.health_question_id == HealthQuestion.id,
+            )
+            .join(Section, HealthQuestion.section_id == Section.id)
+            .filter(
+                tuple_(
+                    LatestChapterHealth.year,
+                    LatestChapterHealth.month,
+                    LatestChapterHealth.week,
+                ).between(start, end),
+            )
+            .filter(LatestChapterHealth.score.is_not(None))
+            .filter(Chapter.zone.is_not(None))
+            .filter(Chapter.is_deleted.is_(False))
+            .filter(HealthQuestion.is_deleted.is_(False))
+            .filter(Section.is_deleted.is_(False))
+            .group_by(
+                Chapter.zone,
+                LatestChapterHealth.year,
+                LatestChapterHealth.month,
+                LatestChapterHealth.week,
+                Section.id,
+                Section.name,
+            ),
+        )
+    ).all()
+
+    zones = sorted({zone for zone, *_ in averages})
+    periods = sorted(
+        set(health_check_periods(start, end))
+        | {(year, month, week) for _, year, month, week, *_ in averages},
+    )
+    sections = dict(sorted({(row[4], row[5]) for row in averages}))
+    zone_positions = {zone: i for i, zone in enumerate(zones)}
+    period_positions = {period: i for i, period in enumerate(periods)}
+    section_positions = {section_id: i for i, section_id in enumerate(sections)}
+
+    grid = np.full((len(zones), len(periods), len(sections)), np.nan)
+    for zone, year, month, week, section_id, _, average in averages:
+        grid[
+            zone_positions[zone],
+            period_positions[(year, month, week)],
+            section_positions[section_id],
+        ] = average
 
     return JSONResponse(
         status_code=status.HTTP_200_OK,
-        content=output,
+        content={
+            "zones": zones,
+            "periods": [f"{year}-{month:02d}-{week}" for year, month, week in periods],
+            "section_ids": list(sections),
+            "sections": list(sections.values()),
+            "averages": rounded(grid.ravel()),
+        },
     )
 
 
+@health_router.get("/health/missing", tags=["chapter_health"])
+async def get_missing_chapter_health(
+    period: str = required_period_query,
+    zone: str | None = zone_query,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
+) -> list[dict]:
+    """
+    Get the sections each chapter has not scored every question of for a period
+
+    Args:
+        period (str): The period
+        zone (str, optional): The zone. Defaults to every chapter.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
+
+    Returns:
+        list[dict]: The chapters and sections with the unanswered question ids
+
+    """
+    check_admin(current_user)
+    year, month, week = parse_period(period)
+
+    answered = exists().where(
+        LatestChapterHealth.chapter_id == Chapter.id,
+        LatestChapterHealth.year == year,
+        LatestChapterHealth.month == month,
+        LatestChapterHealth.week == week,
+        LatestChapterHealth.health_question_id == HealthQuestion.id,
+    )
+    # Every chapter and scored question without a latest score or comment for the
+    # period, grouped by section. The comments questions are optional.
+    missing_rows = await db.execute(
+        select(
+            Chapter.id,
+            Chapter.name,
+            Chapter.zone,
+            Section.id,
+            Section.name,
+            func.array_agg(
+                aggregate_order_by(HealthQuestion.id, HealthQuestion.id),
+            ),
+        )
+        .select_from(Chapter)
+        .join(HealthQuestion, true())
+        .join(Section, HealthQuestion.section_id == Section.id)
+        .filter(Chapter.zone == zone if zone is not None else true())
+        .filter(Chapter.is_deleted.is_(False))
+        .filter(HealthQuestion.is_deleted.is_(False))
+        .filter(HealthQuestion.is_comments.is_(False))
+        .filter(Section.is_deleted.is_(False))
+        .filter(~answered)
+        .group_by(Chapter.id, Chapter.name, Chapter.zone, Section.id, Section.name)
+        .order_by(Chapter.zone, Chapter.name, Chapter.id, Section.id),
+    )
+
+    return [
+        {
+            "chapter_id": str(chapter_id),
+            "chapter": chapter,
+            "zone": chapter_zone,
+            "section_id": section_id,
+            "section": section,
+            "question_ids": question_ids,
+        }
+        for chapter_id, chapter, chapter_zone, section_id, section, question_ids in (
+            missing_rows
+        )
+    ]
+
+
 @health_router.put(
     "/health/{chapter_id}",
     tags=["chapter_health"],
@@ -259,6 +1076,9 @@ def update_chapter_health(
     """
     Update the health scores for a chapter
 
+    The scores are saved in one statement, so none are saved if any question is not
+    found.
+
     Args:
         chapter_id (UUID): The chapter id
         data (dict): The health scores
@@ -270,118 +1090,162 @@ def update_chapter_health(
 
     """
     check_admin(current_user)
-    year = data.pop("year")
-    month = data.pop("month")
-    week = data.pop("week")
-
-    for question, score in data.items():
-        db_question: HealthQuestion = (
-            db.query(HealthQuestion)
-            .filter(HealthQuestion.id == int(question))
-            .filter(HealthQuestion.is_deleted.is_(False))
-            .first()
+    year = data.pop("year", None)
+    month = data.pop("month", None)
+    week = data.pop("week", None)
+    if year is None or month is None or week is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The year, month and week are required",
         )
-
-        if not db_question:
+    if not data:
+        return
+
+    question_ids = {int(question) for question in data}
+    found_question_ids = set(
+        db.scalars(
+            select(HealthQuestion.id)
+            .filter(HealthQuestion.id.in_(question_ids))
+            .filter(HealthQuestion.is_deleted.is_(False)),
+        ).all(),
+    )
+    for question in data:
+        if int(question) not in found_question_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Question {question} not found",
             )
 
-        chapter_health: ChapterHealth = (
-            db.query(ChapterHealth)
-            .filter(ChapterHealth.chapter_id == chapter_id)
-            .filter(ChapterHealth.year == year)
-            .filter(ChapterHealth.month == month)
-            .filter(ChapterHealth.week == week)
-            .filter(ChapterHealth.health_question_id == db_question.id)
-            .filter(ChapterHealth.is_deleted.is_(False))
-            .order_by(ChapterHealth.created_date.desc())
-        ).first()
-
-        if chapter_health:
-            # check if score is a string representation of an integer
-            if isinstance(score, int) or score.isdigit():
-                chapter_health.score = int(score)
-            else:
-                chapter_health.comments = score
-            chapter_health.last_modified_date = datetime_now()
-        else:
-            chapter_health = ChapterHealth(
-                id=generate_uuid(),
-                created_date=datetime_now(),
-                chapter_id=chapter_id,
-                year=year,
-                month=month,
-                week=week,
-                health_question_id=db_question.id,
-                score=score if score and score.isdigit() else None,
-                comments=score if score is not None and not score.isdigit() else None,
-            )
+    # A whole number is saved as the score and anything else as the comments,
+    # leaving the other column of an existing row as it was. Keys naming the same
+    # question, such as "7" and "07", save its last value.
+    now = datetime_now()
+    rows = {}
+    for question, value in data.items():
+        is_score = isinstance(value, int) or (value is not None and value.isdigit())
+        rows[int(question)] = {
+            "id": generate_uuid(),
+            "created_date": now,
+            "chapter_id": chapter_id,
+            "year": year,
+            "month": month,
+            "week": week,
+            "health_question_id": int(question),
+            "score": int(value) if is_score else None,
+            "comments": None if is_score else value,
+        }
 
-        db.add(chapter_health)
-        db.commit()
+    statement = insert(ChapterHealth).values(list(rows.values()))
+    saved_health = (
+        statement.on_conflict_do_update(
+            index_elements=[
+                ChapterHealth.chapter_id,
+                ChapterHealth.year,
+                ChapterHealth.month,
+                ChapterHealth.week,
+                ChapterHealth.health_question_id,
+            ],
+            index_where=text("is_deleted = false"),
+            set_={
+                "score": func.coalesce(statement.excluded.score, ChapterHealth.score),
+                "comments": case(
+                    (statement.excluded.score.is_(None), statement.excluded.comments),
+                    else_=ChapterHealth.comments,
+                ),
+                "last_modified_date": now,
+            },
+        )
+        .returning(
+            ChapterHealth.chapter_id,
+            ChapterHealth.year,
+            ChapterHealth.month,
+            ChapterHealth.week,
+            ChapterHealth.health_question_id,
+            ChapterHealth.score,
+            ChapterHealth.comments,
+        )
+        .cte("saved_health")
+    )
+    # Copy the saved scores to the latest scores in the same statement
+    latest_statement = insert(LatestChapterHealth).from_select(
+        [
+            LatestChapterHealth.chapter_id,
+            LatestChapterHealth.year,
+            LatestChapterHealth.month,
+            LatestChapterHealth.week,
+            LatestChapterHealth.health_question_id,
+            LatestChapterHealth.score,
+            LatestChapterHealth.comments,
+        ],
+        select(saved_health),
+    )
+    db.execute(
+        latest_statement.on_conflict_do_update(
+            index_elements=[
+                LatestChapterHealth.chapter_id,
+                LatestChapterHealth.year,
+                LatestChapterHealth.month,
+                LatestChapterHealth.week,
+                LatestChapterHealth.health_question_id,
+            ],
+            set_={
+                "score": latest_statement.excluded.score,
+                "comments": latest_statement.excluded.comments,
+                "last_modified_date": now,
+            },
+        ),
+    )
+    db.commit()
 
 
 @health_router.get("/sections", tags=["sections"])
-def get_sections(
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+async def get_sections(
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """
     Get the sections
 
     Args:
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         list[Section]: The sections
 
     """
     check_admin(current_user)
-    sections: list[Section] = (
-        db.query(Section)
-        .filter(Section.is_deleted.is_(False))
-        .order_by(Section.id)
-        .all()
-    )
+    reference = await health_reference_cache.get(db)
 
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content=[
-            {"id": section.id, "name": section.name, "is_deleted": section.is_deleted}
-            for section in sections
+            {"id": section.id, "name": section.name, "is_deleted": False}
+            for section in reference.sections.values()
         ],
     )
 
 
 @health_router.get("/questions/section/{section_id}", tags=["questions"])
-def get_questions(
+async def get_questions(
     section_id: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> list[dict]:
     """
     Get the questions for a section
 
     Args:
         section_id (int): The section id
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         list[dict]: The questions
 
     """
     check_admin(current_user)
-    questions: list[HealthQuestion] = (
-        db.query(HealthQuestion)
-        .filter(HealthQuestion.is_deleted.is_(False))
-        .filter(HealthQuestion.section_id == section_id)
-        .order_by(HealthQuestion.id)
-        .all()
-    )
+    questions = (await health_reference_cache.get(db)).section_questions(section_id)
 
     return [
         {"field": "year", "header": "year", "rag_guide": None},
@@ -399,31 +1263,25 @@ def get_questions(
 
 
 @health_router.get("/questions/section/{section_id}/section", tags=["questions"])
-def get_questions_by_section(
+async def get_questions_by_section(
     section_id: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> list[dict]:
     """
     Get the questions for a section
 
     Args:
         section_id (int): The section id
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         list[dict]: The questions
 
     """
     check_admin(current_user)
-    questions: list[HealthQuestion] = (
-        db.query(HealthQuestion)
-        .filter(HealthQuestion.is_deleted.is_(False))
-        .filter(HealthQuestion.section_id == section_id)
-        .order_by(HealthQuestion.id)
-        .all()
-    )
+    questions = (await health_reference_cache.get(db)).section_questions(section_id)
 
     return (
         [
@@ -443,38 +1301,37 @@ def get_questions_by_section(
 
 
 @health_router.get("/section/{section_id}", tags=["sections"])
-def get_section(
+async def get_section(
     section_id: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """
     Get the section
 
     Args:
         section_id (int): The section id
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         list[Section]: The sections
 
     """
     check_admin(current_user)
-    section: Section = (
-        db.query(Section)
-        .filter(Section.id == section_id)
-        .filter(Section.is_deleted.is_(False))
-        .order_by(Section.id)
-        .first()
-    )
+    section = (await health_reference_cache.get(db)).sections.get(section_id)
+    if section is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Section {section_id} not found",
+        )
 
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content={
             "id": section.id,
             "name": section.name,
-            "is_deleted": section.is_deleted,
+            "is_deleted": False,
         },
     )
 
@@ -483,13 +1340,13 @@ def get_section(
     "/health/{chapter_id}/year/{year}/month/{month}/week/{week}/average",
     tags=["chapter_health"],
 )
-def get_average_chapter_health(
+async def get_average_chapter_health(
     chapter_id: UUID,
     year: int,
     month: int,
     week: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """
     Get the average health score for a chapter in a given month and year
@@ -498,63 +1355,49 @@ def get_average_chapter_health(
         chapter_id (UUID): The chapter id
         year (int): The year
         month (int): The month
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
-        int: The health score
+        JSONResponse: The average health score of each section
 
     """
     check_admin(current_user)
-    sections: list[Section] = (
-        db.query(Section)
-        .filter(Section.is_deleted.is_(False))
-        .order_by(Section.id)
-        .all()
+    # A question which was answered with only a comment counts as a score of 0
+    latest_health = (
+        select(
+            LatestChapterHealth.health_question_id,
+            func.coalesce(LatestChapterHealth.score, 0).label("score"),
+        )
+        .filter(LatestChapterHealth.chapter_id == chapter_id)
+        .filter(LatestChapterHealth.year == year)
+        .filter(LatestChapterHealth.month == month)
+        .filter(LatestChapterHealth.week == week)
+        .subquery()
     )
 
-    output = []
-
-    for section in sections:
-        sum_average = 0
-        sum_count = 0
-
-        questions: list[HealthQuestion] = (
-            db.query(HealthQuestion)
-            .filter(HealthQuestion.section_id == section.id)
-            .filter(HealthQuestion.is_deleted.is_(False))
-            .all()
-        )
-
-        for question in questions:
-            chapter_health: ChapterHealth = (
-                db.query(ChapterHealth)
-                .filter(ChapterHealth.chapter_id == chapter_id)
-                .filter(ChapterHealth.year == year)
-                .filter(ChapterHealth.month == month)
-                .filter(ChapterHealth.week == week)
-                .filter(ChapterHealth.is_deleted.is_(False))
-                .filter(ChapterHealth.health_question_id == question.id)
-                .order_by(ChapterHealth.created_date.desc())
-                .first()
-            )
-
-            if chapter_health:
-                sum_average += (
-                    chapter_health.score if chapter_health.score is not None else 0
-                )
-                sum_count += 1
-
-        try:
-            average = sum_average / sum_count
-        except ZeroDivisionError:
-            average = None
-
-        output.append(average)
+    averages = await db.scalars(
+        select(func.avg(cast(latest_health.c.score, Float)))
+        .select_from(Section)
+        .outerjoin(
+            HealthQuestion,
+            and_(
+                HealthQuestion.section_id == Section.id,
+                HealthQuestion.is_deleted.is_(False),
+            ),
+        )
+        .outerjoin(
+            latest_health,
+            latest_health.c.health_question_id == HealthQuestion.id,
+        )
+        .filter(Section.is_deleted.is_(False))
+        .group_by(Section.id)
+        .order_by(Section.id),
+    )
 
     return JSONResponse(
         status_code=status.HTTP_200_OK,
-        content=output,
+        content=averages.all(),
     )
 
 
@@ -562,13 +1405,13 @@ def get_average_chapter_health(
     "/health/{chapter_id}/year/{year}/month/{month}/week/{week}/comments",
     tags=["chapter_health"],
 )
-def get_comments_chapter_health(
+async def get_comments_chapter_health(
     chapter_id: UUID,
     year: int,
     month: int,
     week: int,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
 ) -> JSONResponse:
     """
     Get the comments health score for a chapter in a given month and year
@@ -577,57 +1420,138 @@ def get_comments_chapter_health(
         chapter_id (UUID): The chapter id
         year (int): The year
         month (int): The month
-        db (Session, optional): The database session. Defaults to db_session.
-        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
     Returns:
         JSONResponse: The health comments
     """
     check_admin(current_user)
-    sections: list[Section] = (
-        db.query(Section)
+    comments = await db.execute(
+        select(Section.name, LatestChapterHealth.comments)
+        .join(
+            HealthQuestion,
+            LatestChapterHealth.health_question_id == HealthQuestion.id,
+        )
+        .join(Section, HealthQuestion.section_id == Section.id)
+        .filter(LatestChapterHealth.chapter_id == chapter_id)
+        .filter(LatestChapterHealth.year == year)
+        .filter(LatestChapterHealth.month == month)
+        .filter(LatestChapterHealth.week == week)
         .filter(Section.is_deleted.is_(False))
-        .order_by(Section.id)
-        .all()
+        .filter(HealthQuestion.is_deleted.is_(False))
+        .filter(HealthQuestion.is_comments.is_(True))
+        .order_by(Section.id, HealthQuestion.id),
     )
 
-    output = []
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=[
+            {"section": section, "comment": comment or None}
+            for section, comment in comments
+        ],
+    )
 
-    for section in sections:
-        questions: list[HealthQuestion] = (
-            db.query(HealthQuestion)
-            .filter(HealthQuestion.section_id == section.id)
-            .filter(HealthQuestion.is_deleted.is_(False))
-            .filter(HealthQuestion.question.ilike("%Comments%"))
-            .all()
-        )
-
-        for question in questions:
-            chapter_health: ChapterHealth = (
-                db.query(ChapterHealth)
-                .filter(ChapterHealth.chapter_id == chapter_id)
-                .filter(ChapterHealth.year == year)
-                .filter(ChapterHealth.month == month)
-                .filter(ChapterHealth.week == week)
-                .filter(ChapterHealth.is_deleted.is_(False))
-                .filter(ChapterHealth.health_question_id == question.id)
-                .order_by(ChapterHealth.created_date.desc())
-                .first()
-            )
 
-            if chapter_health:
-                output.append(
-                    {
-                        "section": section.name,
-                        "comment": chapter_health.comments
-                        if chapter_health.comments
-                        else None,
-                    },
-                )
+@health_router.get("/health/comments/search", tags=["chapter_health"])
+async def search_chapter_health_comments(
+    query: str = search_query,
+    rows: int = rows_query,
+    page: int = page_query,
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
+) -> JSONResponse:
+    """
+    Search the chapters' health comments, best matches first
+
+    Args:
+        query (str): The words to search for, in web search syntax
+        rows (int, optional): The results per page. Defaults to 20.
+        page (int, optional): The page, from 0. Defaults to 0.
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
+
+    Returns:
+        JSONResponse: A page of matching comments and the number of matches
+
+    """
+    check_admin(current_user)
+    search = func.websearch_to_tsquery(text("'english'::regconfig"), query)
+    rank = func.ts_rank(comments_search_vector(ChapterHealth.comments), search)
+
+    # The matches use the comments search index, which is partial on is_deleted =
+    # false and so is not used for is_deleted IS false. They are counted in the same
+    # statement as the page, which is joined to the count so the total is returned
+    # for a page past the last match.
+    matches = (
+        select(
+            ChapterHealth.id,
+            ChapterHealth.chapter_id,
+            Chapter.name.label("chapter"),
+            Section.name.label("section"),
+            ChapterHealth.year,
+            ChapterHealth.month,
+            ChapterHealth.week,
+            ChapterHealth.comments,
+            rank.label("rank"),
+        )
+        .join(Chapter, ChapterHealth.chapter_id == Chapter.id)
+        .join(HealthQuestion, ChapterHealth.health_question_id == HealthQuestion.id)
+        .join(Section, HealthQuestion.section_id == Section.id)
+        .filter(comments_search_vector(ChapterHealth.comments).op("@@")(search))
+        .filter(ChapterHealth.is_deleted == false())
+        .filter(Chapter.is_deleted.is_(False))
+        .filter(HealthQuestion.is_deleted.is_(False))
+        .filter(Section.is_deleted.is_(False))
+        .cte("matches")
+    )
+    total = select(func.count().label("total")).select_from(matches).cte("total")
+    matches_page = (
+        select(matches)
+        .order_by(*best_matches_first(matches.c))
+        .offset(page * rows)
+        .limit(rows)
+        .subquery("page")
+    )
+    results = (
+        await db.execute(
+            select(total.c.total, matches_page)
+            .select_from(total)
+            .outerjoin(matches_page, true())
+            .order_by(*best_matches_first(matches_page.c)),
+        )
+    ).all()
 
     return JSONResponse(
         status_code=status.HTTP_200_OK,
-        content=output,
+        content={
+            "results": [
+                {
+                    "chapter_id": str(chapter_id),
+                    "chapter": chapter,
+                    "section": section,
+                    "year": year,
+                    "month": month,
+                    "week": week,
+                    "comments": comments,
+                    "rank": round(match_rank, 4),
+                }
+                for (
+                    _,
+                    score_id,
+                    chapter_id,
+                    chapter,
+                    section,
+                    year,
+                    month,
+                    week,
+                    comments,
+                    match_rank,
+                ) in results
+                if score_id is not None
+            ],
+            "totalRecords": results[0].total,
+        },
     )
 
 
@@ -635,58 +1559,68 @@ def get_comments_chapter_health(
     "/health/{chapter_id}/latest",
     tags=["chapter_health"],
 )
-def get_chapter_latest_health(
+async def get_chapter_latest_health(
     chapter_id: UUID,
-    db: Session = db_session,
-    current_user: UserBase = current_user_instance,
-):
-    check_admin(current_user)
-
-    sections: list[Section] = (
-        db.query(Section)
-        .filter(Section.is_deleted.is_(False))
-        .order_by(Section.id)
-        .all()
-    )
+    db: AsyncSession = read_db_session,
+    current_user: UserBase = async_current_user_instance,
+) -> JSONResponse:
+    """
+    Get the average of each section's most recent health scores for a chapter
 
-    output = []
+    Args:
+        chapter_id (UUID): The chapter id
+        db (AsyncSession, optional): The database session. Defaults to read_db_session.
+        current_user (UserBase, optional): The current user. Defaults to async_current_user_instance.
 
-    for section in sections:
-        questions: list[HealthQuestion] = (
-            db.query(HealthQuestion)
-            .filter(HealthQuestion.section_id == section.id)
-            .filter(HealthQuestion.is_deleted.is_(False))
-            .filter(HealthQuestion.question.ilike("%Comments%").is_(False))
-            .all()
-        )
-
-        health_scores = []
-        for question in questions:
-            chapter_health: ChapterHealth | None = (
-                db.query(ChapterHealth)
-                .filter(ChapterHealth.chapter_id == chapter_id)
-                .filter(ChapterHealth.health_question_id == question.id)
-                .filter(ChapterHealth.is_deleted.is_(False))
-                .order_by(ChapterHealth.year.desc())
-                .order_by(ChapterHealth.month.desc())
-                .order_by(ChapterHealth.week.desc())
-                .first()
-            )
+    Returns:
+        JSONResponse: The section averages
 
-            if chapter_health:
-                health_scores.append(chapter_health.score)
+    """
+    check_admin(current_user)
+    latest_health = (
+        select(LatestChapterHealth.health_question_id, LatestChapterHealth.score)
+        .distinct(LatestChapterHealth.health_question_id)
+        .filter(LatestChapterHealth.chapter_id == chapter_id)
+        .order_by(
+            LatestChapterHealth.health_question_id,
+            LatestChapterHealth.year.desc(),
+            LatestChapterHealth.month.desc(),
+            LatestChapterHealth.week.desc(),
+        )
+        .subquery()
+    )
 
-        output.append(
-            {
-                "section": section.name,
-                "average": round(sum(health_scores) / len(health_scores), 2)
-                if health_scores
-                else None,
-                "icon": section.icon,
-            },
+    sections = await db.execute(
+        select(
+            Section.name,
+            Section.icon,
+            func.avg(cast(latest_health.c.score, Float)),
         )
+        .outerjoin(
+            HealthQuestion,
+            and_(
+                HealthQuestion.section_id == Section.id,
+                HealthQuestion.is_deleted.is_(False),
+                HealthQuestion.is_comments.is_(False),
+            ),
+        )
+        .outerjoin(
+            latest_health,
+            latest_health.c.health_question_id == HealthQuestion.id,
+        )
+        .filter(Section.is_deleted.is_(False))
+        .group_by(Section.id)
+        .order_by(Section.id),
+    )
 
     return JSONResponse(
         status_code=status.HTTP_200_OK,
-        content=output,
+        content=[
+            {
+                "section": name,
+                "average": round(average, 2) if average is not None else None,
+                "icon": icon,
+            }
+            for name, icon, average in sections
+        ],
     )
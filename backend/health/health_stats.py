@@ -0,0 +1,90 @@
+"""Vectorised statistics of chapter health scores"""
+from dataclasses import dataclass
+
+import numpy as np
+
+PERCENTILES = (10, 25, 75, 90)
+
+
+@dataclass
+class SectionStatistics:
+    """
+    Statistics of the chapters' average scores in each section.
+
+    Every array has a column per section, and averages and z_scores have a row per
+    chapter. NaN marks a chapter without scores in a section.
+    """
+
+    averages: np.ndarray
+    counts: np.ndarray
+    mean: np.ndarray
+    median: np.ndarray
+    std: np.ndarray
+    percentiles: np.ndarray
+    z_scores: np.ndarray
+
+
+def section_statistics(
+    chapter_index: np.ndarray,
+    section_index: np.ndarray,
+    scores: np.ndarray,
+    shape: tuple[int, int],
+) -> SectionStatistics:
+    """
+    Average each chapter's scores by section and compare the chapters in each section.
+
+    Args:
+        chapter_index (np.ndarray): The chapter of each score, from 0
+        section_index (np.ndarray): The section of each score, from 0
+        scores (np.ndarray): The scores
+        shape (tuple[int, int]): The number of chapters and sections
+
+    Returns:
+        SectionStatistics: The chapter averages and section statistics
+
+    Examples:
+        >>> stats = section_statistics(
+        ...     np.array([0, 0, 1]), np.array([0, 0, 0]), np.array([1, 3, 3]), (2, 1)
+        ... )
+        >>> stats.averages.tolist(), stats.mean.tolist(), stats.z_scores.tolist()
+        ([[2.0], [3.0]], [2.5], [[-1.0], [1.0]])
+    """
+    cells = np.ravel_multi_index((chapter_index, section_index), shape)
+    totals = np.bincount(cells, weights=scores, minlength=shape[0] * shape[1])
+    score_counts = np.bincount(cells, minlength=shape[0] * shape[1])
+    averages = np.full(shape[0] * shape[1], np.nan)
+    np.divide(totals, score_counts, out=averages, where=score_counts > 0)
+    averages = averages.reshape(shape)
+
+    mean = np.nanmean(averages, axis=0)
+    std = np.nanstd(averages, axis=0)
+    # Every chapter is at the mean of a section whose averages are all the same
+    z_scores = np.where(np.isnan(averages), np.nan, 0.0)
+    np.divide(averages - mean, std, out=z_scores, where=~np.isnan(averages) & (std > 0))
+
+    return SectionStatistics(
+        averages=averages,
+        counts=np.count_nonzero(~np.isnan(averages), axis=0),
+        mean=mean,
+        median=np.nanmedian(averages, axis=0),
+        std=std,
+        percentiles=np.nanpercentile(averages, PERCENTILES, axis=0),
+        z_scores=z_scores,
+    )
+
+
+def rounded(values: np.ndarray) -> list:
+    """
+    Convert an array to a list for JSON, rounded to 2 places with NaN as None.
+
+    Args:
+        values (np.ndarray): The values
+
+    Returns:
+        list: The rounded values
+
+    Examples:
+        >>> rounded(np.array([[1.234, np.nan]]))
+        [[1.23, None]]
+    """
+    return np.where(np.isnan(values), None, np.round(values, 2)).tolist()
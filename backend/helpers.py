@@ -1,4 +1,6 @@
 """Helper functions."""
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from backend import database
@@ -14,8 +16,43 @@ def get_db() -> Session:  # pragma: no cover
     """
     db = None
     try:
-        db = database.session_local_factory()()
+        db = database.get_session_factory()()
         yield db
     finally:
         if db:
             db.close()
+
+
+async def get_async_db() -> AsyncSession:  # pragma: no cover
+    """
+    Get an async database session.
+
+    Returns
+        AsyncSession: async database session
+
+    """
+    async with database.get_async_session_factory()() as db:
+        yield db
+
+
+async def get_read_db() -> AsyncSession:  # pragma: no cover
+    """
+    Get an async database session for read-only queries.
+
+    The session uses the read replica when one is configured and healthy, otherwise
+    the primary. Writes must use get_db or get_async_db instead.
+
+    Returns
+        AsyncSession: async database session
+
+    """
+    session_factory = await database.get_async_read_session_factory()
+    async with session_factory() as db:
+        try:
+            yield db
+        except DBAPIError as e:
+            if e.connection_invalidated and session_factory is not (
+                database.get_async_session_factory()
+            ):
+                database.mark_replica_unavailable()
+            raise
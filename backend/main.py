@@ -1,8 +1,8 @@
 """Main module for the backend FastAPI application."""
 import logging
 import os
-import re
-import tracemalloc
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
@@ -17,11 +17,26 @@ from .actions.actions_routes import actions_router
 from .allocations.allocation_routes import allocations_router
 from .committees.committee_routes import committee_router
 from .config import CORS_ORIGINS
+from .database import (
+    dispose_async_db,
+    dispose_async_read_db,
+    dispose_db,
+    init_async_db,
+    init_async_read_db,
+    init_db,
+)
 from .events.event_routes import event_router
 from .health.health_routes import health_router
 from .inventory.inventory_routes import inventory_router
 from .meetings.meetings_routes import meetings_router
-from .middleware import ContentSizeLimitMiddleware
+from .middleware import (
+    ContentSizeLimitMiddleware,
+    MemoryTrackingMiddleware,
+    ProfilingMiddleware,
+    PrometheusMiddleware,
+    SQLInstrumentationMiddleware,
+)
+from .monitoring.monitoring_routes import monitoring_router
 from .updates.update_routes import update_router
 from .users.users_routes import users_router
 from .visits.visits_routes import visit_router
@@ -29,10 +44,32 @@ from .visits.visits_routes import visit_router
 LOGLEVEL = os.environ.get("LOGLEVEL", "WARNING").upper()
 logging.basicConfig(level=LOGLEVEL)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create the database connection pools on start up and close it on shutdown.
+
+    Args:
+        _app: FastAPI application
+
+    Yields:
+        None
+    """
+    init_db()
+    init_async_db()
+    init_async_read_db()
+    yield
+    dispose_db()
+    await dispose_async_db()
+    await dispose_async_read_db()
+
+
 app = FastAPI(
     title="NHSF Backend",
     version="0.1.0",
     description="Backend for the NHSF application.",
+    lifespan=lifespan,
 )
 
 
@@ -68,6 +105,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(ContentSizeLimitMiddleware, max_content_size=10_000_000)
+app.add_middleware(MemoryTrackingMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(SQLInstrumentationMiddleware)
+app.add_middleware(PrometheusMiddleware)
 
 app.include_router(actions_router)
 app.include_router(allocations_router)
@@ -77,6 +118,7 @@ app.include_router(event_router)
 app.include_router(health_router)
 app.include_router(inventory_router)
 app.include_router(meetings_router)
+app.include_router(monitoring_router)
 app.include_router(update_router)
 app.include_router(users_router)
 app.include_router(visit_router)
@@ -102,45 +144,6 @@ async def health() -> str:
     return "ok"
 
 
-first_trace = None
-
-
-@app.get("/tracemalloc", response_class=PlainTextResponse)
-def trace(n: int = 10, filter_: str = ".*", v: bool = False) -> str:
-    """
-    Trace memory allocations.
-
-    Args:
-        n: number of top entries to show
-        filter_: regex to filter entries by
-        v: verbose
-
-    Returns:
-        str: trace
-    """
-    global first_trace
-
-    # On first call: create reference point
-    if not first_trace:
-        tracemalloc.start()
-        first_trace = tracemalloc.take_snapshot()
-        return "First snapshot taken!\n"
-    else:  # pragma: no cover
-        # Subsequent calls: show changes
-        top_stats = tracemalloc.take_snapshot().compare_to(first_trace, "lineno")
-        top_stats = [t for t in top_stats if re.search(filter_, str(t))]
-        if not v:
-            return "\n".join([str(stat) for stat in top_stats[:n]])
-        lines = []
-        for stat in top_stats[:n]:
-            lines.append(str(stat))
-            lines.append(f"{stat.count} memory blocks: {stat.size / 1024:.1f} KiB")
-            for line in stat.traceback.format():
-                lines.append(line)
-            lines.append("")
-        return "\n".join(lines)
-
-
 @app.get("/migrate_db", response_class=PlainTextResponse)
 def migrate_db() -> str:
     """
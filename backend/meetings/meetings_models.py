@@ -5,9 +5,11 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     func,
+    text,
 )
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
@@ -20,6 +22,13 @@ class MatrixMeeting(Base):
     """matrix meeting database model"""
 
     __tablename__ = "matrix_meetings"
+    __table_args__ = (
+        Index(
+            "ix_matrix_meetings_zone",
+            "zone",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -57,6 +66,13 @@ class ZonalTeamMeeting(Base):
     """zonal team meeting database model"""
 
     __tablename__ = "zonal_team_meetings"
+    __table_args__ = (
+        Index(
+            "ix_zonal_team_meetings_zone",
+            "zone",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -94,6 +110,13 @@ class SectionMeeting(Base):
     """section meeting database model"""
 
     __tablename__ = "section_meetings"
+    __table_args__ = (
+        Index(
+            "ix_section_meetings_section_id",
+            "section_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -1,5 +1,5 @@
 """Membership Database Models"""
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, func
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
 
@@ -11,6 +11,7 @@ class MembershipLog(Base):
     """Membership Logs table."""
 
     __tablename__ = "membership_logs"
+    __table_args__ = (Index("ix_membership_logs_chapter_id", "chapter_id"),)
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -1,11 +1,44 @@
 """
 Middleware for the backend application.
 
-This module contains the middleware for the backend application. The only middleware is the ContentSizeLimitMiddleware,
-which limits the size of the content that can be sent to the application.
+This module contains the middleware for the backend application. The ContentSizeLimitMiddleware limits the size of the
+content that can be sent to the application, the SQLInstrumentationMiddleware reports the SQL queries each request
+issues, the PrometheusMiddleware records the request metrics served on /metrics, the ProfilingMiddleware profiles
+individual requests on demand and the MemoryTrackingMiddleware measures the memory used by a sample of requests.
 """
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
 from starlette.responses import Response
-from starlette.status import HTTP_413_REQUEST_ENTITY_TOO_LARGE
+from starlette.status import (
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+)
+
+from backend.monitoring.memory_tracking import memory_tracker
+from backend.monitoring.metrics import (
+    REQUEST_COUNT,
+    REQUEST_ERRORS,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    route_template,
+)
+from backend.monitoring.profiling import (
+    is_admin_request,
+    profiling_requested,
+    save_profile,
+    start_profiler,
+)
+from backend.monitoring.sql_instrumentation import (
+    QueryStats,
+    install_sql_instrumentation,
+    start_query_stats,
+)
+from backend.utils import generate_uuid
+
+sql_logger = logging.getLogger("backend.sql")
 
 
 class ContentSizeLimitMiddleware:
@@ -69,3 +102,264 @@ class ContentSizeLimitMiddleware:
 
         wrapper = self.receive_wrapper(receive)
         await self.app(scope, wrapper, send)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    SQL query instrumentation middleware for ASGI applications
+
+    Records the number of queries, the total database time and the slowest statement
+    of each request. They are returned in the Server-Timing header and logged as a JSON
+    line on the backend.sql logger.
+
+    Args:
+      app (ASGI application): ASGI application
+    """
+
+    def __init__(self, app) -> None:
+        """Construct"""
+        self.app = app
+        install_sql_instrumentation()
+
+    @staticmethod
+    def server_timing(stats: QueryStats, duration: float) -> str:
+        """
+        Format the Server-Timing header value.
+
+        Args:
+            stats: queries issued by the request
+            duration: time taken by the request so far in seconds
+
+        Returns:
+            str: Server-Timing header value
+        """
+        return ", ".join(
+            [
+                f'db;dur={stats.total_time * 1000:.1f};desc="{stats.count} queries"',
+                f"db-slowest;dur={stats.slowest_time * 1000:.1f}",
+                f"app;dur={duration * 1000:.1f}",
+            ],
+        )
+
+    async def __call__(
+        self: "SQLInstrumentationMiddleware",
+        scope,
+        receive,
+        send,
+    ) -> None:
+        """
+        Middleware call
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive
+            send: ASGI send
+
+        Returns:
+            None
+        """
+        if scope["type"] != "http":  # pragma: no cover
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_query_stats()
+        start_time = time.perf_counter()
+        status_code = None
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    self.server_timing(stats, time.perf_counter() - start_time),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sql_logger.info(
+                json.dumps(
+                    {
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": status_code,
+                        "duration_ms": round(
+                            (time.perf_counter() - start_time) * 1000,
+                            1,
+                        ),
+                        "query_count": stats.count,
+                        "db_time_ms": round(stats.total_time * 1000, 1),
+                        "slowest_query_ms": round(stats.slowest_time * 1000, 1),
+                        "slowest_statement": stats.slowest_statement,
+                    },
+                ),
+            )
+
+
+class PrometheusMiddleware:
+    """
+    Prometheus request metrics middleware for ASGI applications
+
+    Records the request count, latency, in-flight requests and errors, labelled by the
+    route template rather than the raw path so /chapter/{chapter_id} is one series.
+
+    Args:
+      app (ASGI application): ASGI application
+    """
+
+    def __init__(self, app) -> None:
+        """Construct"""
+        self.app = app
+
+    async def __call__(
+        self: "PrometheusMiddleware",
+        scope,
+        receive,
+        send,
+    ) -> None:
+        """
+        Middleware call
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive
+            send: ASGI send
+
+        Returns:
+            None
+        """
+        if scope["type"] != "http":  # pragma: no cover
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+        error = None
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            REQUESTS_IN_FLIGHT.labels(method).dec()
+            # The router adds the matched route to the scope, so it is only known here
+            route = route_template(scope)
+            REQUEST_LATENCY.labels(method, route).observe(
+                time.perf_counter() - start_time,
+            )
+            REQUEST_COUNT.labels(method, route, status_code).inc()
+            if error is None and status_code >= HTTP_500_INTERNAL_SERVER_ERROR:
+                error = str(status_code)
+            if error is not None:
+                REQUEST_ERRORS.labels(method, route, error).inc()
+
+
+class ProfilingMiddleware:
+    """
+    On-demand request profiling middleware for ASGI applications
+
+    Requests made by an admin with an `X-Profile: true` header or `profile=true` query
+    parameter are run under a sampling profiler. The speedscope profile is stored and
+    its id returned in the X-Profile-Id header, so it can be downloaded from
+    /profiles/{profile_id}. Other requests are not affected.
+
+    Args:
+      app (ASGI application): ASGI application
+    """
+
+    def __init__(self, app) -> None:
+        """Construct"""
+        self.app = app
+
+    async def __call__(
+        self: "ProfilingMiddleware",
+        scope,
+        receive,
+        send,
+    ) -> None:
+        """
+        Middleware call
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive
+            send: ASGI send
+
+        Returns:
+            None
+        """
+        if (
+            scope["type"] != "http"
+            or not profiling_requested(scope)
+            or not await is_admin_request(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = str(generate_uuid())
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        profiler = start_profiler()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            save_profile(profile_id, profiler, scope["method"], scope["path"])
+
+
+class MemoryTrackingMiddleware:
+    """
+    Sampled memory accounting middleware for ASGI applications
+
+    Measures the peak and retained memory of a fraction of requests, set by
+    MEMORY_SAMPLE_RATE, and aggregates it by route template. The stats are served on
+    /memory.
+
+    Args:
+      app (ASGI application): ASGI application
+    """
+
+    def __init__(self, app) -> None:
+        """Construct"""
+        self.app = app
+
+    async def __call__(
+        self: "MemoryTrackingMiddleware",
+        scope,
+        receive,
+        send,
+    ) -> None:
+        """
+        Middleware call
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive
+            send: ASGI send
+
+        Returns:
+            None
+        """
+        if scope["type"] != "http" or not memory_tracker.start():
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            memory_tracker.stop(route_template(scope))
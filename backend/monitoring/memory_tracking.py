@@ -0,0 +1,129 @@
+"""Sampled per-route memory accounting."""
+import random
+import tracemalloc
+from dataclasses import dataclass
+from threading import Lock
+
+from backend.config import MEMORY_SAMPLE_RATE
+
+
+@dataclass
+class RouteMemoryStats:
+    """The memory allocated by the sampled requests of a route."""
+
+    route: str
+    samples: int = 0
+    total_peak: int = 0
+    max_peak: int = 0
+    total_retained: int = 0
+    max_retained: int = 0
+
+    def summary(self: "RouteMemoryStats") -> dict:
+        """Get the stats in bytes, with the mean peak and retained memory."""
+        return {
+            "route": self.route,
+            "samples": self.samples,
+            "mean_peak": self.total_peak // self.samples,
+            "max_peak": self.max_peak,
+            "mean_retained": self.total_retained // self.samples,
+            "max_retained": self.max_retained,
+        }
+
+
+class MemoryTracker:
+    """
+    Measure the memory allocated by a sample of requests and aggregate it by route.
+
+    tracemalloc is only switched on while a sampled request runs, and only one request
+    is sampled at a time, so the tracing overhead is limited to the sampled requests.
+    Allocations made by requests running concurrently are counted against the sampled
+    request, which averages out over many samples.
+
+    Args:
+        sample_rate: fraction of requests to measure, between 0 and 1
+    """
+
+    def __init__(self: "MemoryTracker", sample_rate: float) -> None:
+        """Construct"""
+        self.sample_rate = sample_rate
+        self._sampling = Lock()
+        self._stats_lock = Lock()
+        self._stats: dict[str, RouteMemoryStats] = {}
+        self._started_tracing = False
+        self._baseline = 0
+
+    def start(self: "MemoryTracker") -> bool:
+        """
+        Decide whether to sample a request, and start tracing if so.
+
+        Returns
+            bool: True if the request is being sampled and stop must be called
+
+        """
+        if random.random() >= self.sample_rate:  # noqa: S311
+            return False
+        if not self._sampling.acquire(blocking=False):
+            return False
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._baseline, _ = tracemalloc.get_traced_memory()
+        return True
+
+    def stop(self: "MemoryTracker", route: str) -> None:
+        """
+        Stop tracing a sampled request and record its memory against its route.
+
+        Args:
+            route: route template of the request
+
+        Returns:
+            None
+
+        """
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._started_tracing:
+                tracemalloc.stop()
+        finally:
+            self._sampling.release()
+        self.record(route, peak - self._baseline, current - self._baseline)
+
+    def record(self: "MemoryTracker", route: str, peak: int, retained: int) -> None:
+        """
+        Record the memory allocated by a request.
+
+        Args:
+            route: route template of the request
+            peak: peak memory allocated while handling the request in bytes
+            retained: memory still allocated when the request finished in bytes
+
+        Returns:
+            None
+
+        """
+        with self._stats_lock:
+            stats = self._stats.setdefault(route, RouteMemoryStats(route))
+            stats.samples += 1
+            stats.total_peak += peak
+            stats.max_peak = max(stats.max_peak, peak)
+            stats.total_retained += retained
+            stats.max_retained = max(stats.max_retained, retained)
+
+    def summary(self: "MemoryTracker") -> list[dict]:
+        """Get the memory stats of every sampled route, largest peak first."""
+        with self._stats_lock:
+            stats = list(self._stats.values())
+        return [
+            route_stats.summary()
+            for route_stats in sorted(stats, key=lambda s: s.max_peak, reverse=True)
+        ]
+
+    def clear(self: "MemoryTracker") -> None:
+        """Forget the stats recorded so far."""
+        with self._stats_lock:
+            self._stats = {}
+
+
+memory_tracker = MemoryTracker(MEMORY_SAMPLE_RATE)
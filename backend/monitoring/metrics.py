@@ -0,0 +1,92 @@
+"""Prometheus metrics for the backend application."""
+from collections.abc import Iterator
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.pool import QueuePool
+
+from backend import database
+
+# Requests which do not match a route are grouped together so that scanners cannot
+# create a new series per path.
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "Number of HTTP requests handled.",
+    ["method", "route", "status_code"],
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time taken to handle HTTP requests.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Number of HTTP requests currently being handled.",
+    ["method"],
+)
+REQUEST_ERRORS = Counter(
+    "http_request_errors_total",
+    "Number of HTTP requests which failed with a server error or an exception.",
+    ["method", "route", "error"],
+)
+
+
+def route_template(scope: dict) -> str:
+    """
+    Get the path template of the route which handled a request.
+
+    Args:
+        scope: ASGI scope, after routing
+
+    Returns:
+        str: route path template, e.g. /chapter/{chapter_id}
+
+    """
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return route.path
+
+
+class ConnectionPoolCollector(Collector):
+    """Collect the connection pool usage of the database engines at scrape time."""
+
+    def collect(self: "ConnectionPoolCollector") -> Iterator[GaugeMetricFamily]:
+        """
+        Collect the connection pool gauges.
+
+        Yields
+            GaugeMetricFamily: pool size, checked out and overflow gauges
+
+        """
+        size = GaugeMetricFamily(
+            "db_pool_size",
+            "Number of connections the database connection pool keeps open.",
+            labels=["pool"],
+        )
+        checked_out = GaugeMetricFamily(
+            "db_pool_checked_out",
+            "Number of database connections currently in use.",
+            labels=["pool"],
+        )
+        overflow = GaugeMetricFamily(
+            "db_pool_overflow",
+            "Number of database connections open above the pool size.",
+            labels=["pool"],
+        )
+        for name, pool in database.connection_pools().items():
+            if not isinstance(pool, QueuePool):
+                continue
+            size.add_metric([name], pool.size())
+            checked_out.add_metric([name], pool.checkedout())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+        yield size
+        yield checked_out
+        yield overflow
+
+
+REGISTRY.register(ConnectionPoolCollector())
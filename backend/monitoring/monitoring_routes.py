@@ -0,0 +1,132 @@
+"""Routes for monitoring the backend application."""
+from hmac import compare_digest
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette import status
+
+from backend.config import METRICS_TOKEN
+from backend.monitoring.memory_tracking import memory_tracker
+from backend.monitoring.profiling import profile_store
+from backend.users.users_commands.check_admin import check_admin
+from backend.users.users_commands.get_users import get_current_active_user
+from backend.users.users_schemas import UserBase
+
+current_user_instance = Depends(get_current_active_user)
+authorization_header = Header(None, include_in_schema=False)
+
+monitoring_router = APIRouter()
+
+
+@monitoring_router.get("/metrics", tags=["monitoring"], include_in_schema=False)
+def metrics(authorization: str | None = authorization_header) -> Response:
+    """
+    Get the Prometheus metrics.
+
+    Prometheus cannot log in, so when METRICS_TOKEN is set the metrics are served to
+    requests with it as their bearer token instead of to admins. Without it they are
+    served to anyone, e.g. when only the scraper can reach the backend's port.
+
+    Args:
+        authorization (str | None): The Authorization header, if any
+
+    Returns:
+        Response: metrics in the Prometheus text exposition format
+    """
+    if METRICS_TOKEN and not compare_digest(
+        authorization or "",
+        f"Bearer {METRICS_TOKEN}",
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@monitoring_router.get("/profiles", tags=["monitoring"])
+def list_profiles(current_user: UserBase = current_user_instance) -> JSONResponse:
+    """
+    List the stored request profiles, newest first.
+
+    Args:
+        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+
+    Returns:
+        JSONResponse: The profile ids, requests and durations
+    """
+    check_admin(current_user)
+
+    return JSONResponse(
+        content=[profile.summary() for profile in profile_store.list()],
+    )
+
+
+@monitoring_router.get("/profiles/{profile_id}", tags=["monitoring"])
+def get_profile(
+    profile_id: str,
+    current_user: UserBase = current_user_instance,
+) -> Response:
+    """
+    Download a request profile, which can be opened in https://www.speedscope.app.
+
+    Args:
+        profile_id (str): The profile id from the X-Profile-Id response header
+        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+
+    Returns:
+        Response: The speedscope profile
+    """
+    check_admin(current_user)
+
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+
+    return Response(
+        content=profile.speedscope,
+        media_type="application/json",
+        headers={
+            "Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"',
+        },
+    )
+
+
+@monitoring_router.get("/memory", tags=["monitoring"])
+def get_memory_stats(current_user: UserBase = current_user_instance) -> JSONResponse:
+    """
+    Get the memory used by the sampled requests of each route, largest peak first.
+
+    Args:
+        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+
+    Returns:
+        JSONResponse: The number of samples and the mean and max peak and retained
+            memory in bytes of each route
+    """
+    check_admin(current_user)
+
+    return JSONResponse(content=memory_tracker.summary())
+
+
+@monitoring_router.delete("/memory", tags=["monitoring"])
+def clear_memory_stats(current_user: UserBase = current_user_instance) -> JSONResponse:
+    """
+    Clear the memory stats, e.g. to measure the effect of a deployment.
+
+    Args:
+        current_user (UserBase, optional): The current user. Defaults to current_user_instance.
+
+    Returns:
+        JSONResponse: Empty memory stats
+    """
+    check_admin(current_user)
+
+    memory_tracker.clear()
+    return JSONResponse(content=memory_tracker.summary())
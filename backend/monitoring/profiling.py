@@ -0,0 +1,191 @@
+"""On-demand sampling profiler for individual requests."""
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+
+from backend.config import PROFILER_INTERVAL, PROFILER_MAX_PROFILES
+from backend.helpers import get_async_db
+from backend.users.users_commands.get_users import (
+    get_token_data,
+    get_user_by_email_async,
+)
+from backend.utils import datetime_now
+
+PROFILE_FLAG_VALUES = ("1", "true")
+ADMIN_USER_TYPES = ("admin", "super_admin")
+
+
+@dataclass
+class RequestProfile:
+    """A sampling profile of a single request."""
+
+    id: str
+    method: str
+    path: str
+    duration: float
+    created_date: datetime
+    speedscope: str
+
+    def summary(self: "RequestProfile") -> dict:
+        """Get the profile details without the profile itself."""
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "duration": self.duration,
+            "created_date": self.created_date.isoformat(),
+        }
+
+
+class ProfileStore:
+    """
+    Bounded in-memory store of the most recent request profiles.
+
+    Args:
+        max_profiles: number of profiles to keep, the oldest are discarded first
+    """
+
+    def __init__(self: "ProfileStore", max_profiles: int) -> None:
+        """Construct"""
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+        self._lock = Lock()
+
+    def add(self: "ProfileStore", profile: RequestProfile) -> None:
+        """Store a profile, discarding the oldest if the store is full."""
+        with self._lock:
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self: "ProfileStore", profile_id: str) -> RequestProfile | None:
+        """Get a profile by id, None if it does not exist or has been discarded."""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self: "ProfileStore") -> list[RequestProfile]:
+        """List the stored profiles, newest first."""
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+
+profile_store = ProfileStore(PROFILER_MAX_PROFILES)
+
+
+def profiling_requested(scope: dict) -> bool:
+    """
+    Check whether a request asks to be profiled.
+
+    A request is profiled if it has an `X-Profile: true` header or a `profile=true`
+    query parameter.
+
+    Args:
+        scope: ASGI scope
+
+    Returns:
+        bool: True if the request asks to be profiled
+
+    """
+    for name, value in scope["headers"]:
+        if name == b"x-profile" and value.decode().lower() in PROFILE_FLAG_VALUES:
+            return True
+    query = parse_qs(scope.get("query_string", b"").decode())
+    return any(
+        value.lower() in PROFILE_FLAG_VALUES for value in query.get("profile", [])
+    )
+
+
+async def is_admin_request(scope: dict) -> bool:
+    """
+    Check whether a request has a valid bearer token for an active admin.
+
+    The user is looked up as for get_current_active_user_async, so a user who has
+    been deleted or is no longer an admin cannot profile requests with a token that
+    has not expired yet. The session comes from get_async_db, or its override, as it
+    would for a route.
+
+    Args:
+        scope: ASGI scope
+
+    Returns:
+        bool: True if the request was made by an admin
+
+    """
+    for name, value in scope["headers"]:
+        if name != b"authorization":
+            continue
+        scheme, _, token = value.decode().partition(" ")
+        if scheme.lower() != "bearer":
+            return False
+        try:
+            token_data = get_token_data(token)
+        except HTTPException:
+            return False
+
+        get_db = scope["app"].dependency_overrides.get(get_async_db, get_async_db)
+        async with aclosing(get_db()) as sessions:
+            user = await get_user_by_email_async(
+                await anext(sessions),
+                email=token_data.username,
+            )
+        return (
+            user is not None
+            and not user.is_deleted
+            and user.user_type_name in ADMIN_USER_TYPES
+        )
+    return False
+
+
+def start_profiler() -> Profiler:
+    """
+    Start a sampling profiler for the current request.
+
+    Only the event loop thread is sampled, so the time spent in sync routes, which run
+    in the thread pool, shows up as time waiting for the thread pool.
+
+    Returns
+        Profiler: running profiler
+
+    """
+    profiler = Profiler(interval=PROFILER_INTERVAL, async_mode="enabled")
+    profiler.start()
+    return profiler
+
+
+def save_profile(
+    profile_id: str,
+    profiler: Profiler,
+    method: str,
+    path: str,
+) -> RequestProfile:
+    """
+    Stop a request's profiler and store its speedscope profile.
+
+    Args:
+        profile_id: id to store the profile under
+        profiler: running profiler
+        method: request method
+        path: request path
+
+    Returns:
+        RequestProfile: stored profile
+
+    """
+    session = profiler.stop()
+    profile = RequestProfile(
+        id=profile_id,
+        method=method,
+        path=path,
+        duration=session.duration,
+        created_date=datetime_now(),
+        speedscope=SpeedscopeRenderer().render(session),
+    )
+    profile_store.add(profile)
+    return profile
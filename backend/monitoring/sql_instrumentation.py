@@ -0,0 +1,95 @@
+"""Per-request SQL query instrumentation."""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExecutionContext
+
+MAX_STATEMENT_LENGTH = 500
+
+
+@dataclass
+class QueryStats:
+    """The SQL queries issued while handling a request."""
+
+    count: int = 0
+    total_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+
+    def record(self: "QueryStats", statement: str, duration: float) -> None:
+        """
+        Record a query.
+
+        Args:
+            statement: SQL statement
+            duration: time taken to execute the statement in seconds
+
+        Returns:
+            None
+
+        """
+        self.count += 1
+        self.total_time += duration
+        if self.slowest_statement is None or duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = " ".join(statement.split())[:MAX_STATEMENT_LENGTH]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> QueryStats:
+    """
+    Start recording the queries issued by the current request.
+
+    The stats are stored in a context variable, so they are shared with the thread
+    pool workers and async tasks the request runs on.
+
+    Returns
+        QueryStats: the stats the queries will be recorded in
+
+    """
+    stats = QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+
+def get_query_stats() -> QueryStats | None:
+    """Get the query stats for the current request, None outside of a request."""
+    return _query_stats.get()
+
+
+def before_cursor_execute(
+    _conn: Connection,
+    _cursor: object,
+    _statement: str,
+    _parameters: object,
+    context: ExecutionContext,
+    *_args: object,
+) -> None:
+    """Remember when the statement started executing."""
+    context.query_start_time = time.perf_counter()
+
+
+def after_cursor_execute(
+    _conn: Connection,
+    _cursor: object,
+    statement: str,
+    _parameters: object,
+    context: ExecutionContext,
+    *_args: object,
+) -> None:
+    """Record the statement against the current request."""
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context.query_start_time)
+
+
+def install_sql_instrumentation() -> None:
+    """Record the queries executed by every engine, sync and async."""
+    if event.contains(Engine, "before_cursor_execute", before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", after_cursor_execute)
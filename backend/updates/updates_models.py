@@ -5,9 +5,11 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     func,
+    text,
 )
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
@@ -20,6 +22,13 @@ class ChapterUpdate(Base):
     """Chapter Updates"""
 
     __tablename__ = "chapter_updates"
+    __table_args__ = (
+        Index(
+            "ix_chapter_updates_chapter_id",
+            "chapter_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -77,6 +86,13 @@ class SectionUpdate(Base):
     """Chapter Updates"""
 
     __tablename__ = "section_updates"
+    __table_args__ = (
+        Index(
+            "ix_section_updates_section_id",
+            "section_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
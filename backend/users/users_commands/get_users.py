@@ -2,11 +2,13 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from starlette import status
 
 from backend.config import ALGORITHM, SECRET_KEY
-from backend.helpers import get_db
+from backend.helpers import get_async_db, get_db
 from backend.users.users_models import User
 from backend.users.users_schemas import TokenData, UserBase
 
@@ -14,6 +16,26 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 oauth2_scheme_depends = Depends(oauth2_scheme)
 db_session = Depends(get_db)
+async_db_session = Depends(get_async_db)
+
+
+credentials_exception_kwargs = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "Could not validate credentials",
+    "headers": {"WWW-Authenticate": "Bearer"},
+}
+
+
+def get_token_data(token: str) -> TokenData:
+    """Decode the bearer token."""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError as e:
+        raise HTTPException(**credentials_exception_kwargs) from e
+    username: str = payload.get("sub")
+    if username is None:
+        raise HTTPException(**credentials_exception_kwargs)
+    return TokenData(username=username)
 
 
 def get_current_user(
@@ -21,26 +43,27 @@ def get_current_user(
     token: str = oauth2_scheme_depends,
 ) -> UserBase:
     """Get current user."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except JWTError:
-        raise credentials_exception
-    username: str = payload.get("sub")
-    if username is None:
-        raise credentials_exception
-    token_data = TokenData(username=username)
+    token_data = get_token_data(token)
     user: User | None = get_user_by_email(db, email=token_data.username)
     if user is None:
-        raise credentials_exception
+        raise HTTPException(**credentials_exception_kwargs)
+    return UserBase.model_validate(user)
+
+
+async def get_current_user_async(
+    db: AsyncSession = async_db_session,
+    token: str = oauth2_scheme_depends,
+) -> UserBase:
+    """Get current user using an async database session."""
+    token_data = get_token_data(token)
+    user: User | None = await get_user_by_email_async(db, email=token_data.username)
+    if user is None:
+        raise HTTPException(**credentials_exception_kwargs)
     return UserBase.model_validate(user)
 
 
 current_user_depends = Depends(get_current_user)
+current_user_async_depends = Depends(get_current_user_async)
 
 
 def get_current_active_user(
@@ -55,6 +78,13 @@ def get_current_active_user(
     return current_user
 
 
+async def get_current_active_user_async(
+    current_user: UserBase = current_user_async_depends,
+) -> UserBase:
+    """Get current active user using an async database session."""
+    return get_current_active_user(current_user)
+
+
 def get_user_by_username(db: Session, username: str) -> User | None:
     """Get user by username."""
     return db.query(User).filter(User.username == username).first()
@@ -63,3 +93,11 @@ def get_user_by_username(db: Session, username: str) -> User | None:
 def get_user_by_email(db: Session, email: str) -> User | None:
     """Get user."""
     return db.query(User).filter(User.email == email).first()
+
+
+async def get_user_by_email_async(db: AsyncSession, email: str) -> User | None:
+    """Get user, loading the user type eagerly as async sessions cannot lazy load."""
+    result = await db.execute(
+        select(User).options(joinedload(User.user_type)).filter(User.email == email),
+    )
+    return result.scalars().first()
@@ -1,5 +1,5 @@
 """Users Database Models"""
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import relationship
 
@@ -26,6 +26,10 @@ class User(Base):
     """Users database model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_email", "email"),
+        Index("ix_users_full_name_created_date", "full_name", "created_date"),
+    )
 
     id = Column(
         pg.UUID(as_uuid=True),
@@ -13,7 +13,10 @@ from backend.config import ACCESS_TOKEN_EXPIRE_MINUTES
 from backend.helpers import get_db
 from backend.users.users_commands.authenticate_user import authenticate_user
 from backend.users.users_commands.check_admin import check_admin
-from backend.users.users_commands.get_users import get_current_active_user
+from backend.users.users_commands.get_users import (
+    get_current_active_user,
+    get_current_active_user_async,
+)
 from backend.users.users_commands.password_token_commands import get_password_hash
 from backend.users.users_commands.tokens import create_access_token
 from backend.users.users_models import User, UserType
@@ -22,6 +25,7 @@ from backend.utils import datetime_now, generate_uuid
 
 db_session = Depends(get_db)
 current_user_instance = Depends(get_current_active_user)
+async_current_user_instance = Depends(get_current_active_user_async)
 form_instace = Depends()
 
 users_router = APIRouter()
@@ -171,8 +175,8 @@ def post_user_chapter(
 
 
 @users_router.get("/users/me", tags=["users"])
-def get_me(
-    current_user: UserBase = current_user_instance,
+async def get_me(
+    current_user: UserBase = async_current_user_instance,
 ) -> UserBase:
     """Get current user."""
     return current_user
@@ -0,0 +1,661 @@
+r"""
+Seed a synthetic dataset resembling production for benchmarks and query plans.
+
+Rows are generated a batch at a time, sampling from small pools of fake text rather
+than calling Faker per row, and loaded with Postgres COPY, so a dataset with millions
+of chapter health scores can be seeded in about a minute. To seed a database without
+running the benchmarks, e.g. to look at query plans, run
+
+    PYTHONPATH=. python -m testing.benchmarks.benchmark_dataset \\
+        --database-url postgresql://chapter@chapter-db/chapter_benchmark --scale 10
+
+The database is emptied before it is seeded, so never point this at real data.
+"""
+import argparse
+import io
+import os
+import random
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import MetaData, insert, select, text
+from sqlalchemy.orm import Session
+
+from alembic.command import upgrade as alembic_upgrade
+from alembic.config import Config as AlembicConfig
+from backend.actions.actions_models import Action
+from backend.allocations.allocation_models import Allocation
+from backend.chapters.chapters_models import Chapter
+from backend.chapters.chapters_schemas import ZoneEnum
+from backend.committees.committee_models import CommitteeMember
+from backend.database import Base, get_session_factory, init_db
+from backend.health.health_models import (
+    ChapterHealth,
+    HealthQuestion,
+    LatestChapterHealth,
+    Section,
+)
+from backend.membership.membership_models import MembershipLog
+from backend.updates.updates_models import ChapterUpdate, SectionUpdate
+from backend.users.users_commands.password_token_commands import get_password_hash
+from backend.users.users_models import User, UserType
+from backend.users.users_schemas import UserBase
+from backend.utils import datetime_now
+from backend.visits.visits_models import ChapterVisitAssociation, Visit, VisitCategory
+from testing.helpers.fake_data import (
+    fake_email,
+    fake_health_question,
+    fake_name,
+    fake_paragraph,
+)
+
+SECTION_NAMES = ["Events", "Finance", "Committee", "Sewa", "Welfare"]
+LAST_PERIOD = (2025, 3)
+HEALTH_WEEKS = (1, 3)
+HEALTH_SCORES = (1, 2, 3)
+# Roughly a quarter of the scores are red, half amber and a quarter green
+HEALTH_SCORE_WEIGHTS = (1, 2, 1)
+COPY_BATCH_SIZE = 100_000
+TEXT_POOL_SIZE = 200
+SEED = 20250301
+
+
+@dataclass
+class DatasetSize:
+    """
+    The number of rows to seed.
+
+    Args:
+        chapters_per_zone: chapters in each ZoneEnum zone
+        questions_per_section: health questions in each section, the last of which is
+            a comments question
+        years: years of fortnightly health scores, ending in March 2025
+        users: admin users, who own the actions, updates and visits
+        actions: actions
+        updates: chapter and section updates
+        visits: chapter visits
+    """
+
+    chapters_per_zone: int = 20
+    questions_per_section: int = 5
+    years: int = 2
+    users: int = 50
+    actions: int = 2_000
+    updates: int = 2_000
+    visits: int = 1_000
+
+    @classmethod
+    def scaled(cls: type["DatasetSize"], scale: float, years: int = 2) -> "DatasetSize":
+        """
+        Get the default size multiplied by a scale factor.
+
+        The questions and history stay the same, so the number of health scores grows
+        with the number of chapters.
+
+        Args:
+            scale: scale factor, 1 is the default size
+            years: years of health scores
+
+        Returns:
+            DatasetSize: scaled dataset size
+
+        Examples:
+            >>> DatasetSize.scaled(10).chapters_per_zone
+            200
+        """
+        default = cls()
+        return cls(
+            chapters_per_zone=max(round(default.chapters_per_zone * scale), 1),
+            questions_per_section=default.questions_per_section,
+            years=years,
+            users=max(round(default.users * scale), 1),
+            actions=round(default.actions * scale),
+            updates=round(default.updates * scale),
+            visits=round(default.visits * scale),
+        )
+
+
+@dataclass
+class BenchmarkDataset:
+    """The ids of the seeded rows, used to fill in the route path parameters."""
+
+    admin_user: UserBase
+    chapter_ids: list[UUID] = field(default_factory=list)
+    section_ids: list[int] = field(default_factory=list)
+    question_ids: list[int] = field(default_factory=list)
+    action_ids: list[UUID] = field(default_factory=list)
+    allocation_ids: list[UUID] = field(default_factory=list)
+    committee_ids: list[UUID] = field(default_factory=list)
+    chapter_update_ids: list[UUID] = field(default_factory=list)
+    section_update_ids: list[UUID] = field(default_factory=list)
+    visit_ids: list[UUID] = field(default_factory=list)
+    periods: list[tuple[int, int, int]] = field(default_factory=list)
+    row_counts: dict[str, int] = field(default_factory=dict)
+
+
+def health_periods(years: int) -> list[tuple[int, int, int]]:
+    """
+    Get the fortnightly health periods, oldest first.
+
+    Args:
+        years: number of years of periods, ending in LAST_PERIOD
+
+    Returns:
+        list[tuple[int, int, int]]: year, month and week of each period
+
+    """
+    last_year, last_month = LAST_PERIOD
+    periods = []
+    for months_ago in reversed(range(years * 12)):
+        year, month = divmod(last_year * 12 + last_month - 1 - months_ago, 12)
+        periods.extend((year, month + 1, week) for week in HEALTH_WEEKS)
+    return periods
+
+
+def copy_value(value: Any) -> str:  # noqa: ANN401
+    r"""
+    Format a value for a COPY in the default text format.
+
+    Args:
+        value: column value
+
+    Returns:
+        str: the value with tabs, newlines and backslashes escaped, \N for NULL
+
+    Examples:
+        >>> copy_value(None)
+        '\\N'
+        >>> copy_value(True)
+        't'
+        >>> copy_value("Line one\nLine two")
+        'Line one\\nLine two'
+    """
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(
+    session: Session,
+    model: type[Base],
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+) -> int:
+    """
+    Load rows into a model's table with COPY, in batches of COPY_BATCH_SIZE.
+
+    Columns which are not given use the model's default if it is a constant, as not
+    every server default in the models exists in the migrated database, and the
+    database default otherwise. Primary keys always use the database default.
+
+    Args:
+        session: database session, which must use psycopg2 and is not committed
+        model: model of the table to load
+        columns: names of the columns in each row
+        rows: rows of column values
+
+    Returns:
+        int: number of rows loaded
+
+    """
+    defaults = {
+        column.name: column.default.arg
+        for column in model.__table__.columns
+        if column.name not in columns
+        and not column.primary_key
+        and column.default is not None
+        and column.default.is_scalar
+    }
+    suffix = "".join(f"\t{copy_value(value)}" for value in defaults.values()) + "\n"
+    statement = (
+        f"COPY {model.__tablename__} ({', '.join([*columns, *defaults])}) FROM STDIN"
+    )
+    cursor = session.connection().connection.dbapi_connection.cursor()
+
+    row_count = 0
+    batch = io.StringIO()
+    for row_count, row in enumerate(rows, start=1):
+        batch.write("\t".join(copy_value(value) for value in row) + suffix)
+        if row_count % COPY_BATCH_SIZE == 0:
+            batch.seek(0)
+            cursor.copy_expert(statement, batch)
+            batch = io.StringIO()
+    if batch.tell():
+        batch.seek(0)
+        cursor.copy_expert(statement, batch)
+    return row_count
+
+
+def text_pool(generator: Callable[[], str], size: int = TEXT_POOL_SIZE) -> list[str]:
+    """Generate a pool of fake text to sample rows from, as Faker is slow per row."""
+    return [generator() for _ in range(size)]
+
+
+def random_dates(
+    rng: random.Random,
+    start_date: date,
+    end_date: date,
+    count: int,
+) -> list[date]:
+    """Get a batch of random dates between two dates."""
+    days = rng.choices(range((end_date - start_date).days + 1), k=count)
+    return [start_date + timedelta(days=day) for day in days]
+
+
+def truncate_tables(session: Session) -> None:
+    """Delete every row, except the alembic and health reference versions."""
+    engine = session.get_bind()
+    meta = MetaData()
+    meta.reflect(bind=engine)
+    with engine.begin() as conn:
+        for table in meta.sorted_tables:
+            if table.name not in ["alembic_version", "health_reference_version"]:
+                conn.execute(text(f"TRUNCATE {table.name} CASCADE"))
+
+
+def seed_users(session: Session, size: DatasetSize) -> list[tuple[UUID, str, str]]:
+    """Seed the user types and admin users, and return their ids, names and emails."""
+    admin_type_id, chapter_type_id = uuid4(), uuid4()
+    copy_rows(
+        session,
+        UserType,
+        ["id", "name"],
+        [(admin_type_id, "admin"), (chapter_type_id, "chapter")],
+    )
+
+    users = [(uuid4(), fake_name(), f"{i}.{fake_email()}") for i in range(size.users)]
+    hashed_password = get_password_hash("benchmark")
+    copy_rows(
+        session,
+        User,
+        ["id", "full_name", "email", "hashed_password", "user_type_id"],
+        (
+            (user_id, full_name, email, hashed_password, admin_type_id)
+            for user_id, full_name, email in users
+        ),
+    )
+    return users
+
+
+def seed_chapters(session: Session, size: DatasetSize) -> list[UUID]:
+    """Seed the chapters of every zone and return their ids."""
+    names, emails = text_pool(fake_name), text_pool(fake_email)
+    chapters = [
+        (uuid4(), f"{names[i % len(names)]} {i}", zone.value, emails[i % len(emails)])
+        for i, zone in enumerate(
+            zone for zone in ZoneEnum for _ in range(size.chapters_per_zone)
+        )
+    ]
+    copy_rows(session, Chapter, ["id", "name", "zone", "email"], chapters)
+    return [chapter_id for chapter_id, *_ in chapters]
+
+
+def seed_health(
+    session: Session,
+    rng: random.Random,
+    size: DatasetSize,
+    dataset: BenchmarkDataset,
+) -> None:
+    """Seed the health sections, questions and every chapter's scores."""
+    # The sections and questions are few, and their ids come from sequences
+    sections = [Section(name=name) for name in SECTION_NAMES]
+    session.add_all(sections)
+    session.flush()
+    questions = []
+    for section in sections:
+        questions.extend(
+            HealthQuestion(question=fake_health_question(), section_id=section.id)
+            for _ in range(size.questions_per_section - 1)
+        )
+        questions.append(
+            HealthQuestion(
+                question="Comments",
+                section_id=section.id,
+                is_comments=True,
+            ),
+        )
+    session.add_all(questions)
+    session.flush()
+
+    dataset.section_ids = [section.id for section in sections]
+    dataset.question_ids = [question.id for question in questions]
+    dataset.periods = health_periods(size.years)
+    comment_ids = {question.id for question in questions if question.is_comments}
+
+    def chapter_scores() -> Iterable[tuple]:
+        # One batch of scores for every period and question of a chapter at a time
+        cells = [
+            (question_id, year, month, week)
+            for year, month, week in dataset.periods
+            for question_id in dataset.question_ids
+        ]
+        for chapter_id in dataset.chapter_ids:
+            scores = rng.choices(HEALTH_SCORES, HEALTH_SCORE_WEIGHTS, k=len(cells))
+            for (question_id, year, month, week), score in zip(
+                cells,
+                scores,
+                strict=True,
+            ):
+                is_comment = question_id in comment_ids
+                yield (
+                    chapter_id,
+                    question_id,
+                    year,
+                    month,
+                    week,
+                    None if is_comment else score,
+                    "Going well" if is_comment else None,
+                )
+
+    dataset.row_counts["chapter_health"] = copy_rows(
+        session,
+        ChapterHealth,
+        [
+            "chapter_id",
+            "health_question_id",
+            "year",
+            "month",
+            "week",
+            "score",
+            "comments",
+        ],
+        chapter_scores(),
+    )
+    session.execute(
+        insert(LatestChapterHealth).from_select(
+            [
+                "chapter_id",
+                "year",
+                "month",
+                "week",
+                "health_question_id",
+                "score",
+                "comments",
+            ],
+            select(
+                ChapterHealth.chapter_id,
+                ChapterHealth.year,
+                ChapterHealth.month,
+                ChapterHealth.week,
+                ChapterHealth.health_question_id,
+                ChapterHealth.score,
+                ChapterHealth.comments,
+            ),
+        ),
+    )
+
+
+def seed_chapter_activity(
+    session: Session,
+    rng: random.Random,
+    size: DatasetSize,
+    user_ids: list[UUID],
+    dataset: BenchmarkDataset,
+) -> None:
+    """Seed the actions, allocations, committees, updates, visits and memberships."""
+    start_date = date(LAST_PERIOD[0] - size.years, LAST_PERIOD[1], 1)
+    end_date = date(*LAST_PERIOD, 28)
+    chapter_ids, section_ids = dataset.chapter_ids, dataset.section_ids
+    names, emails = text_pool(fake_name), text_pool(fake_email)
+    paragraphs = text_pool(fake_paragraph)
+
+    def seed(model: type[Base], columns: list[str], rows: list[tuple]) -> list[UUID]:
+        # Every row starts with its id
+        dataset.row_counts[model.__tablename__] = copy_rows(
+            session,
+            model,
+            ["id", *columns],
+            rows,
+        )
+        return [row[0] for row in rows]
+
+    dataset.action_ids = seed(
+        Action,
+        [
+            "assignee_id",
+            "section_id",
+            "chapter_id",
+            "note",
+            "due_date",
+            "created_user_id",
+        ],
+        [
+            (
+                uuid4(),
+                user_ids[i % len(user_ids)],
+                section_ids[i % len(section_ids)],
+                chapter_ids[i % len(chapter_ids)],
+                note,
+                due_date,
+                user_ids[(i + 1) % len(user_ids)],
+            )
+            for i, (note, due_date) in enumerate(
+                zip(
+                    rng.choices(paragraphs, k=size.actions),
+                    random_dates(rng, start_date, end_date, size.actions),
+                    strict=True,
+                ),
+            )
+        ],
+    )
+    dataset.allocation_ids = seed(
+        Allocation,
+        ["user_id", "section_id", "chapter_id"],
+        [
+            (
+                uuid4(),
+                user_ids[i % len(user_ids)],
+                section_ids[i % len(section_ids)],
+                chapter_id,
+            )
+            for i, chapter_id in enumerate(chapter_ids)
+        ],
+    )
+    dataset.committee_ids = seed(
+        CommitteeMember,
+        [
+            "name",
+            "chapter_id",
+            "position",
+            "email",
+            "commencement_date",
+            "natcom_buddy_id",
+        ],
+        [
+            (
+                uuid4(),
+                rng.choice(names),
+                chapter_id,
+                position,
+                rng.choice(emails),
+                start_date,
+                user_ids[i % len(user_ids)],
+            )
+            for i, chapter_id in enumerate(chapter_ids)
+            for position in ("President", "Vice President", "Treasurer")
+        ],
+    )
+    dataset.chapter_update_ids = seed(
+        ChapterUpdate,
+        ["chapter_id", "user_id", "update_date", "update_text"],
+        [
+            (
+                uuid4(),
+                chapter_ids[i % len(chapter_ids)],
+                user_ids[i % len(user_ids)],
+                update_date,
+                update_text,
+            )
+            for i, (update_date, update_text) in enumerate(
+                zip(
+                    random_dates(rng, start_date, end_date, size.updates),
+                    rng.choices(paragraphs, k=size.updates),
+                    strict=True,
+                ),
+            )
+        ],
+    )
+    section_updates = size.updates // len(section_ids)
+    dataset.section_update_ids = seed(
+        SectionUpdate,
+        ["section_id", "user_id", "update_date", "update_text"],
+        [
+            (
+                uuid4(),
+                section_ids[i % len(section_ids)],
+                user_ids[i % len(user_ids)],
+                update_date,
+                update_text,
+            )
+            for i, (update_date, update_text) in enumerate(
+                zip(
+                    random_dates(rng, start_date, end_date, section_updates),
+                    rng.choices(paragraphs, k=section_updates),
+                    strict=True,
+                ),
+            )
+        ],
+    )
+    seed(
+        MembershipLog,
+        ["chapter_id", "number_of_members", "log_date"],
+        [
+            (uuid4(), chapter_id, rng.randint(20, 60), datetime_now())
+            for chapter_id in chapter_ids
+        ],
+    )
+    visit_category_id = uuid4()
+    seed(VisitCategory, ["name"], [(visit_category_id, "Chapter visit")])
+    dataset.visit_ids = seed(
+        Visit,
+        ["visit_date", "user_id", "visit_category_id", "comments"],
+        [
+            (
+                uuid4(),
+                visit_date,
+                user_ids[i % len(user_ids)],
+                visit_category_id,
+                comments,
+            )
+            for i, (visit_date, comments) in enumerate(
+                zip(
+                    random_dates(rng, start_date, end_date, size.visits),
+                    rng.choices(paragraphs, k=size.visits),
+                    strict=True,
+                ),
+            )
+        ],
+    )
+    seed(
+        ChapterVisitAssociation,
+        ["visit_id", "chapter_id"],
+        [
+            (uuid4(), visit_id, chapter_ids[i % len(chapter_ids)])
+            for i, visit_id in enumerate(dataset.visit_ids)
+        ],
+    )
+
+
+def seed_benchmark_dataset(session: Session, size: DatasetSize) -> BenchmarkDataset:
+    """
+    Replace the contents of the database with a synthetic dataset.
+
+    Args:
+        session (Session): Database session
+        size (DatasetSize): Number of rows to seed
+
+    Returns:
+        BenchmarkDataset: The ids of the seeded rows
+
+    """
+    truncate_tables(session)
+    # Seeded so every run with the same size loads the same scores
+    rng = random.Random(SEED)
+
+    users = seed_users(session, size)
+    _, admin_name, admin_email = users[0]
+    dataset = BenchmarkDataset(
+        admin_user=UserBase(
+            email=admin_email,
+            full_name=admin_name,
+            is_deleted=False,
+            user_type_name="admin",
+        ),
+        chapter_ids=seed_chapters(session, size),
+    )
+    dataset.row_counts = {"users": len(users), "chapters": len(dataset.chapter_ids)}
+    seed_health(session, rng, size, dataset)
+    seed_chapter_activity(
+        session,
+        rng,
+        size,
+        [user_id for user_id, *_ in users],
+        dataset,
+    )
+    session.commit()
+
+    # Refresh the planner statistics so query plans reflect the new data
+    with session.get_bind().connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+    return dataset
+
+
+def seed_database(database_url: str, size: DatasetSize) -> BenchmarkDataset:
+    """
+    Migrate a database to the latest revision and seed it with a synthetic dataset.
+
+    Args:
+        database_url (str): Database to seed, which is emptied first
+        size (DatasetSize): Number of rows to seed
+
+    Returns:
+        BenchmarkDataset: The ids of the seeded rows
+
+    """
+    os.environ["DATABASE_URL"] = database_url
+    alembic_config = AlembicConfig("alembic.ini")
+    alembic_config.set_main_option("sqlalchemy.url", database_url)
+    alembic_upgrade(alembic_config, "head")
+
+    init_db(database_url)
+    with get_session_factory()() as session:
+        return seed_benchmark_dataset(session, size)
+
+
+def main() -> None:
+    """Seed the benchmark database and print the number of rows seeded."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCHMARK_DATABASE_URL"),
+        required="BENCHMARK_DATABASE_URL" not in os.environ,
+        help="database to seed, it is emptied first",
+    )
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--years", type=int, default=2)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    dataset = seed_database(
+        args.database_url,
+        DatasetSize.scaled(args.scale, args.years),
+    )
+    for table, row_count in dataset.row_counts.items():
+        print(f"{table:<30} {row_count:>10,}")  # noqa: T201
+    print(f"\nSeeded in {time.perf_counter() - start_time:.1f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+r"""
+Benchmark every GET endpoint against a synthetic dataset.
+
+Seeds the database at --database-url with a synthetic dataset, requests every GET
+route through the TestClient and reports the p50/p95 latency and SQL query count of
+each. The results are saved to JSON so runs can be compared across commits, e.g.
+
+    PYTHONPATH=. python -m testing.benchmarks.run_benchmarks \\
+        --database-url postgresql://chapter@chapter-db/chapter_benchmark \\
+        --baseline benchmark_results/previous.json
+
+The database is emptied before it is seeded, so never point this at real data.
+"""
+import argparse
+import json
+import math
+import os
+import re
+import subprocess
+import time
+from pathlib import Path
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.users.users_commands.get_users import (
+    get_current_active_user,
+    get_current_active_user_async,
+)
+from backend.utils import datetime_now
+from testing.benchmarks.benchmark_dataset import (
+    BenchmarkDataset,
+    DatasetSize,
+    seed_database,
+)
+
+# Routes which report on the process or change the schema or data rather than read it
+EXCLUDED_ROUTES = {
+    "/generate_migrations",
+    "/memory",
+    "/metrics",
+    "/migrate_db",
+    "/profiles",
+    "/profiles/{profile_id}",
+    "/users/deactivate_all",
+}
+SERVER_TIMING_DB = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Get a percentile of a list of values, using the nearest rank method.
+
+    Args:
+        values: values, which must not be empty
+        percent: percentile between 0 and 100
+
+    Returns:
+        float: the value below which percent of the values fall
+
+    Examples:
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 50)
+        2.0
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def parse_server_timing(header: str) -> tuple[int, float]:
+    """
+    Get the query count and database time from a Server-Timing header.
+
+    Args:
+        header: Server-Timing header value
+
+    Returns:
+        tuple[int, float]: number of queries and database time in milliseconds
+
+    Examples:
+        >>> parse_server_timing('db;dur=1.5;desc="3 queries", app;dur=4.0')
+        (3, 1.5)
+    """
+    match = SERVER_TIMING_DB.search(header)
+    if match is None:
+        return 0, 0.0
+    return int(match.group(2)), float(match.group(1))
+
+
+def path_parameters(dataset: BenchmarkDataset) -> dict[str, str]:
+    """
+    Get a value for each path and required query parameter the dataset can fill in.
+
+    Args:
+        dataset: seeded dataset
+
+    Returns:
+        dict[str, str]: parameter values by name
+
+    """
+    year, month, week = dataset.periods[-1]
+    ids = {
+        "chapter_id": dataset.chapter_ids,
+        "section_id": dataset.section_ids,
+        "question_id": dataset.question_ids,
+        "action_id": dataset.action_ids,
+        "allocation_id": dataset.allocation_ids,
+        "committee_id": dataset.committee_ids,
+        "chapter_update_id": dataset.chapter_update_ids,
+        "section_update_id": dataset.section_update_ids,
+        "visit_id": dataset.visit_ids,
+    }
+    parameters = {name: str(values[0]) for name, values in ids.items() if values}
+    parameters.update(
+        {
+            "zone": "London",
+            "zone_name": "London",
+            "year": str(year),
+            "month": str(month),
+            "week": str(week),
+            "period": f"{year}-{month}-{week}",
+            "query": "event",
+        },
+    )
+    return parameters
+
+
+def benchmark_routes(
+    client: TestClient,
+    dataset: BenchmarkDataset,
+    iterations: int,
+) -> tuple[list[dict], list[dict]]:
+    """
+    Request every GET route and measure it.
+
+    Args:
+        client: test client
+        dataset: seeded dataset
+        iterations: number of times to request each route
+
+    Returns:
+        tuple[list[dict], list[dict]]: results of the routes which were benchmarked,
+            and the routes which were skipped with the reason
+
+    """
+    parameters = path_parameters(dataset)
+    results, skipped = [], []
+    for route in app.routes:
+        if (
+            not isinstance(route, APIRoute)
+            or "GET" not in route.methods
+            or route.path in EXCLUDED_ROUTES
+        ):
+            continue
+        missing = [
+            param.name
+            for param in route.dependant.path_params + route.dependant.query_params
+            if param.required and param.name not in parameters
+        ]
+        if missing:
+            skipped.append({"route": route.path, "missing": missing})
+            continue
+
+        path = route.path.format(**parameters)
+        query = {
+            param.name: parameters[param.name]
+            for param in route.dependant.query_params
+            if param.required
+        }
+        latencies, db_times = [], []
+        for _ in range(iterations):
+            start_time = time.perf_counter()
+            response = client.get(path, params=query)
+            latencies.append((time.perf_counter() - start_time) * 1000)
+            queries, db_time = parse_server_timing(
+                response.headers.get("Server-Timing", ""),
+            )
+            db_times.append(db_time)
+
+        results.append(
+            {
+                "route": route.path,
+                "path": path,
+                "status_code": response.status_code,
+                "p50_ms": round(percentile(latencies, 50), 2),
+                "p95_ms": round(percentile(latencies, 95), 2),
+                "db_p50_ms": round(percentile(db_times, 50), 2),
+                "queries": queries,
+            },
+        )
+    return results, skipped
+
+
+def git_commit() -> str | None:
+    """Get the current git commit, None if it cannot be found."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S603, S607
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: list[dict], baseline: dict | None) -> None:
+    """Print the results, with the p95 change against a baseline run if given."""
+    baseline_p95 = {
+        result["route"]: result["p95_ms"]
+        for result in (baseline or {}).get("results", [])
+    }
+    print(  # noqa: T201
+        f"{'route':<90} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'queries':>7}",
+    )
+    for result in sorted(results, key=lambda r: r["p95_ms"], reverse=True):
+        change = ""
+        if result["route"] in baseline_p95:
+            change = f" ({result['p95_ms'] - baseline_p95[result['route']]:+.1f})"
+        print(  # noqa: T201
+            f"{result['route']:<90} {result['status_code']:>6} "
+            f"{result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} "
+            f"{result['queries']:>7}{change}",
+        )
+
+
+def main() -> None:
+    """Seed the benchmark database, benchmark every GET route and save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCHMARK_DATABASE_URL"),
+        required="BENCHMARK_DATABASE_URL" not in os.environ,
+        help="database to seed and benchmark, it is emptied first",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="dataset scale factor, 10 seeds around 1.2 million health scores",
+    )
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    args = parser.parse_args()
+
+    dataset = seed_database(
+        args.database_url,
+        DatasetSize.scaled(args.scale, args.years),
+    )
+
+    app.dependency_overrides[get_current_active_user] = lambda: dataset.admin_user
+    app.dependency_overrides[get_current_active_user_async] = lambda: dataset.admin_user
+    # Entering the client runs the lifespan, so requests use the pooled engines. A
+    # route which fails is reported with its 500 status rather than ending the run.
+    with TestClient(app, raise_server_exceptions=False) as client:
+        results, skipped = benchmark_routes(client, dataset, args.iterations)
+    app.dependency_overrides = {}
+
+    commit = git_commit()
+    output = args.output or Path(
+        "benchmark_results",
+        f"{datetime_now():%Y%m%d%H%M%S}_{commit or 'unknown'}.json",
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "created_date": datetime_now().isoformat(),
+                "iterations": args.iterations,
+                "scale": args.scale,
+                "row_counts": dataset.row_counts,
+                "results": results,
+                "skipped": skipped,
+            },
+            indent=2,
+        ),
+    )
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    print_results(results, baseline)
+    print(f"\nSaved results to {output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,53 @@
 """Test client fixture for FastAPI app."""
+from collections.abc import Callable
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
 
-from backend.helpers import get_db
+from backend.helpers import get_async_db, get_db, get_read_db
 from backend.main import app
+from backend.users.users_commands.get_users import (
+    get_current_active_user,
+    get_current_active_user_async,
+)
+from backend.users.users_schemas import UserBase
+from testing.helpers.fake_data import fake_email, fake_name
+
+
+def async_db_override(async_session_factory: async_sessionmaker) -> Callable:
+    """Create a get_async_db or get_read_db override using the given session factory."""
+
+    async def get_async_test_db() -> AsyncSession:
+        async with async_session_factory() as async_session:
+            yield async_session
+
+    return get_async_test_db
 
 
 @pytest.fixture()
-def client(session: Session) -> TestClient:
+def client(session: Session, async_session_factory: async_sessionmaker) -> TestClient:
     """Generate test client."""
     app.dependency_overrides[get_db] = lambda: session
+    app.dependency_overrides[get_async_db] = async_db_override(async_session_factory)
+    app.dependency_overrides[get_read_db] = async_db_override(async_session_factory)
 
     yield TestClient(app)
 
     app.dependency_overrides = {}
+
+
+@pytest.fixture()
+def admin_client(client: TestClient) -> TestClient:
+    """Generate test client authenticated as an admin user."""
+    admin_user = UserBase(
+        email=fake_email(),
+        full_name=fake_name(),
+        is_deleted=False,
+        user_type_name="admin",
+    )
+    app.dependency_overrides[get_current_active_user] = lambda: admin_user
+    app.dependency_overrides[get_current_active_user_async] = lambda: admin_user
+
+    return client
@@ -4,15 +4,17 @@ import sys
 
 import pytest
 from sqlalchemy import MetaData, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from alembic.command import upgrade as alembic_upgrade
 from alembic.config import Config as AlembicConfig
-from backend.database import session_local_factory
+from backend.database import async_session_local_factory, dispose_db, init_db
 
 
 @pytest.fixture(scope="session")
-def session_factory() -> session_local_factory:
-    """Create a session factory for a local database."""
+def session_factory() -> sessionmaker:
+    """Create the shared session factory for a local database."""
     # Migrate the database if it's not up to date.
     database_url = os.environ["DATABASE_URL"]
     if (
@@ -23,26 +25,39 @@ def session_factory() -> session_local_factory:
     alembic_config.set_main_option("sqlalchemy.url", database_url)
     alembic_upgrade(alembic_config, "head")
 
-    return session_local_factory(database_url)
+    yield init_db(database_url)
+
+    dispose_db()
+
+
+@pytest.fixture(scope="session")
+def async_session_factory(session_factory: sessionmaker) -> async_sessionmaker:
+    """
+    Create an async session factory for a local database.
+
+    The test client runs each request in a new event loop, so connections are not
+    pooled.
+    """
+    _ = session_factory
+    return async_session_local_factory(os.environ["DATABASE_URL"], pooled=False)
 
 
 @pytest.fixture()
-def session(session_factory: session_local_factory) -> session_local_factory:
+def session(session_factory: sessionmaker) -> Session:
     """Create a session for a local database."""
     sess = session_factory()
     engine = session_factory.kw["bind"]
     meta = MetaData()
     meta.reflect(bind=engine)
-    conn = engine.connect()
-    transaction = conn.begin()
-    for table in meta.sorted_tables:
-        if table.name in [
-            "alembic_version",
-            "stages",
-        ]:
-            continue
-        conn.execute(text(f"TRUNCATE {table.name} CASCADE"))
-    transaction.commit()
+    with engine.begin() as conn:
+        for table in meta.sorted_tables:
+            if table.name in [
+                "alembic_version",
+                "health_reference_version",
+                "stages",
+            ]:
+                continue
+            conn.execute(text(f"TRUNCATE {table.name} CASCADE"))
 
     try:
         yield sess
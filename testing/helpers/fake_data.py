@@ -1,4 +1,5 @@
 """Fake data for testing purposes."""
+from datetime import date
 from secrets import choice
 from uuid import UUID
 
@@ -117,6 +118,31 @@ def fake_chapter() -> dict:
     }
 
 
+def fake_section_name() -> str:
+    """Return a fake health section name."""
+    return choice(["Events", "Finance", "Committee", "Sewa", "Welfare"])
+
+
+def fake_health_question() -> str:
+    """Return a fake health question."""
+    return fake.sentence(nb_words=6)
+
+
+def fake_health_score() -> int:
+    """Return a fake red, amber or green health score."""
+    return choice([1, 2, 3])
+
+
+def fake_paragraph() -> str:
+    """Return a fake paragraph, e.g. for an update or comment."""
+    return fake.paragraph()
+
+
+def fake_date_between(start_date: date, end_date: date) -> date:
+    """Return a fake date between two dates."""
+    return fake.date_between(start_date=start_date, end_date=end_date)
+
+
 def fake_sport_name() -> str:
     """Return a fake sport."""
     return choice(["Football", "Netball", "Cricket", "Kho Kho", "Kabaddi"])
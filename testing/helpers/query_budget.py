@@ -0,0 +1,37 @@
+"""Query budget assertions for tests."""
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import Engine, event
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[list[str]]:
+    """
+    Fail if the code inside the block executes more than max_queries SQL statements.
+
+    Wrap a single request in the block to guard a route against N+1 regressions,
+    e.g. `with query_budget(3): client.get("/sections")`.
+
+    Args:
+        max_queries: maximum number of statements allowed
+
+    Yields:
+        list[str]: the statements executed so far
+
+    """
+    statements: list[str] = []
+
+    def record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "after_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "after_cursor_execute", record)
+
+    assert len(statements) <= max_queries, (
+        f"{len(statements)} queries exceeded the budget of {max_queries}:\n"
+        + "\n".join(statements)
+    )
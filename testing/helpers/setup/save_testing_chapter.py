@@ -2,6 +2,7 @@
 from sqlalchemy.orm import Session
 
 from backend.chapters.chapters_models import Chapter
+from backend.utils import generate_uuid
 from testing.helpers.fake_data import fake_email, fake_name, fake_zone
 
 
@@ -23,6 +24,7 @@ def save_testing_chapter(
 
     """
     chapter = Chapter(
+        id=generate_uuid(),
         name=name if name else fake_name(),
         zone=zone if zone else fake_zone(),
         email=fake_email(),
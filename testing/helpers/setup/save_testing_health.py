@@ -0,0 +1,126 @@
+"""Save testing health sections, questions and scores."""
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from backend.health.health_models import (
+    ChapterHealth,
+    HealthQuestion,
+    LatestChapterHealth,
+    Section,
+)
+from backend.utils import datetime_now, generate_uuid
+from testing.helpers.fake_data import fake_health_question, fake_section_name
+
+
+def save_testing_section(session: Session, name: str | None = None) -> Section:
+    """
+    Save a testing section.
+
+    Args:
+        session (Session): Database session
+        name (str, optional): Section name. Defaults to None in which case a fake name is generated.
+
+    Returns:
+        Section: A section instance.
+
+    """
+    section = Section(name=name if name else fake_section_name())
+
+    session.add(section)
+    session.commit()
+
+    return section
+
+
+def save_testing_health_question(
+    session: Session,
+    section: Section,
+    question: str | None = None,
+    is_comments: bool = False,
+) -> HealthQuestion:
+    """
+    Save a testing health question.
+
+    Args:
+        session (Session): Database session
+        section (Section): The section the question belongs to
+        question (str, optional): Question text. Defaults to None in which case a fake question is generated.
+        is_comments (bool, optional): Whether the question asks for comments. Defaults to False.
+
+    Returns:
+        HealthQuestion: A health question instance.
+
+    """
+    health_question = HealthQuestion(
+        question=question if question else fake_health_question(),
+        section_id=section.id,
+        is_comments=is_comments,
+        created_date=datetime_now(),
+    )
+
+    session.add(health_question)
+    session.commit()
+
+    return health_question
+
+
+def save_testing_chapter_health(  # noqa: PLR0913
+    session: Session,
+    chapter_id: UUID,
+    health_question: HealthQuestion,
+    year: int,
+    month: int,
+    week: int,
+    score: int | None = None,
+    comments: str | None = None,
+    is_deleted: bool = False,
+) -> ChapterHealth:
+    """
+    Save a testing chapter health score.
+
+    Args:
+        session (Session): Database session
+        chapter_id (UUID): Chapter id
+        health_question (HealthQuestion): The question being answered
+        year (int): Year
+        month (int): Month
+        week (int): Week
+        score (int, optional): Score. Defaults to None.
+        comments (str, optional): Comments. Defaults to None.
+        is_deleted (bool, optional): Whether the score is deleted. Defaults to False.
+
+    Returns:
+        ChapterHealth: A chapter health instance.
+
+    """
+    chapter_health = ChapterHealth(
+        id=generate_uuid(),
+        created_date=datetime_now(),
+        chapter_id=chapter_id,
+        health_question_id=health_question.id,
+        year=year,
+        month=month,
+        week=week,
+        score=score,
+        comments=comments,
+        is_deleted=is_deleted,
+    )
+
+    session.add(chapter_health)
+    if not is_deleted:
+        # Keep the latest scores up to date, as update_chapter_health does
+        session.merge(
+            LatestChapterHealth(
+                chapter_id=chapter_id,
+                year=year,
+                month=month,
+                week=week,
+                health_question_id=health_question.id,
+                score=score,
+                comments=comments,
+            ),
+        )
+    session.commit()
+
+    return chapter_health
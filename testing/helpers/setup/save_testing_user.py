@@ -0,0 +1,38 @@
+"""Save a testing user."""
+from sqlalchemy.orm import Session
+
+from backend.users.users_models import User, UserType
+from backend.utils import generate_uuid
+from testing.helpers.fake_data import fake_email, fake_name
+
+
+def save_testing_user(
+    session: Session,
+    user_type: str,
+    is_deleted: bool = False,
+) -> User:
+    """
+    Save a testing user.
+
+    Args:
+        session (Session): Database session
+        user_type (str): The name of the user type, e.g. admin
+        is_deleted (bool, optional): Whether the user is deleted. Defaults to False.
+
+    Returns:
+        User: A user instance.
+
+    """
+    user = User(
+        id=generate_uuid(),
+        full_name=fake_name(),
+        email=fake_email(),
+        hashed_password="",
+        is_deleted=is_deleted,
+        user_type=UserType(id=generate_uuid(), name=user_type),
+    )
+
+    session.add(user)
+    session.commit()
+
+    return user
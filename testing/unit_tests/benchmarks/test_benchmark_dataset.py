@@ -0,0 +1,82 @@
+"""Tests for the benchmark dataset seeder."""
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.health.health_models import ChapterHealth, LatestChapterHealth
+from backend.visits.visits_models import Visit
+from testing.benchmarks.benchmark_dataset import (
+    DatasetSize,
+    copy_rows,
+    seed_benchmark_dataset,
+)
+from testing.fixtures.database import session, session_factory  # noqa: F401
+from testing.helpers.setup.save_testing_chapter import save_testing_chapter
+from testing.helpers.setup.save_testing_health import (
+    save_testing_health_question,
+    save_testing_section,
+)
+
+
+def test_seed_benchmark_dataset(session: Session) -> None:
+    """
+    Test every chapter gets a score for every question in every period.
+
+    Args:
+        session (Session): Database session
+
+    Returns:
+        None
+
+    """
+    size = DatasetSize(
+        chapters_per_zone=1,
+        years=1,
+        users=2,
+        actions=3,
+        updates=5,
+        visits=4,
+    )
+
+    dataset = seed_benchmark_dataset(session, size)
+
+    health_count = session.scalar(select(func.count()).select_from(ChapterHealth))
+    assert health_count == len(dataset.chapter_ids) * len(dataset.periods) * len(
+        dataset.question_ids,
+    )
+    assert dataset.row_counts["chapter_health"] == health_count
+    assert (
+        session.scalar(select(func.count()).select_from(LatestChapterHealth))
+        == health_count
+    )
+    assert len(dataset.action_ids) == size.actions
+    assert not session.scalar(select(Visit.is_deleted).limit(1))
+
+
+def test_copy_rows_escapes_values(session: Session) -> None:
+    """
+    Test values containing tabs, newlines and backslashes are copied unchanged.
+
+    Args:
+        session (Session): Database session
+
+    Returns:
+        None
+
+    """
+    comments = "Tab\tnewline\nbackslash\\N"
+    chapter = save_testing_chapter(session)
+    question = save_testing_health_question(session, save_testing_section(session))
+
+    row_count = copy_rows(
+        session,
+        ChapterHealth,
+        ["chapter_id", "health_question_id", "year", "score", "comments"],
+        [(chapter.id, question.id, 2024, None, comments)],
+    )
+    session.commit()
+
+    assert row_count == 1
+    health = session.scalars(select(ChapterHealth)).one()
+    assert health.comments == comments
+    assert health.score is None
+    assert health.is_deleted is False
@@ -0,0 +1,29 @@
+"""Tests for the endpoint benchmark helpers."""
+from testing.benchmarks.benchmark_dataset import health_periods
+from testing.benchmarks.run_benchmarks import parse_server_timing, percentile
+
+
+def test_percentile() -> None:
+    """Test percentiles use the nearest rank."""
+    latencies = [float(latency) for latency in range(1, 101)]
+
+    assert percentile(latencies, 50) == 50.0  # noqa: PLR2004
+    assert percentile(latencies, 95) == 95.0  # noqa: PLR2004
+    assert percentile([3.0], 95) == 3.0  # noqa: PLR2004
+
+
+def test_parse_server_timing() -> None:
+    """Test the query count and database time are read from the Server-Timing header."""
+    header = 'db;dur=12.5;desc="7 queries", db-slowest;dur=3.0, app;dur=20.1'
+
+    assert parse_server_timing(header) == (7, 12.5)
+    assert parse_server_timing("") == (0, 0.0)
+
+
+def test_health_periods() -> None:
+    """Test the health periods are fortnightly and end in March 2025."""
+    periods = health_periods(1)
+
+    assert len(periods) == 24  # noqa: PLR2004
+    assert periods[0] == (2024, 4, 1)
+    assert periods[-2:] == [(2025, 3, 1), (2025, 3, 3)]
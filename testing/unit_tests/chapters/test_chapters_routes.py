@@ -6,19 +6,26 @@ This module contains unit tests for the FastAPI routes related to chapter creati
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import Session
 from starlette import status
 
-from backend.helpers import get_db
+from backend.helpers import get_async_db, get_db, get_read_db
 from backend.main import app
 from backend.utils import generate_uuid
-from testing.fixtures.database import session, session_factory  # noqa: F401
+from testing.fixtures.client import async_db_override
+from testing.fixtures.database import (  # noqa: F401
+    async_session_factory,
+    session,
+    session_factory,
+)
 from testing.helpers.fake_data import fake_chapter, fake_email, fake_name
 
 
 @pytest.fixture()
 def client(
     session: Session,
+    async_session_factory: async_sessionmaker,
 ) -> TestClient:
     """
     Fixture Function: client
@@ -27,11 +34,14 @@ def client(
 
     Args:
        session (Session): A SQLAlchemy database session.
+       async_session_factory (async_sessionmaker): A SQLAlchemy async session factory.
 
     Yields:
        TestClient: A FastAPI test client configured to use the provided session.
     """
     app.dependency_overrides[get_db] = lambda: session
+    app.dependency_overrides[get_async_db] = async_db_override(async_session_factory)
+    app.dependency_overrides[get_read_db] = async_db_override(async_session_factory)
 
     yield TestClient(app)
 
@@ -0,0 +1,54 @@
+"""Tests for compacting chapter health."""
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.health.compact_chapter_health import compact_chapter_health
+from backend.health.health_models import ChapterHealth, ChapterHealthHistory
+from testing.fixtures.database import session, session_factory  # noqa: F401
+from testing.helpers.setup.save_testing_chapter import save_testing_chapter
+from testing.helpers.setup.save_testing_health import (
+    save_testing_chapter_health,
+    save_testing_health_question,
+    save_testing_section,
+)
+
+DELETED_SCORE = 2
+
+
+def test_compact_chapter_health(session: Session) -> None:
+    """
+    Test every deleted score is moved to the history table in batches.
+
+    Args:
+        session (Session): Database session
+
+    Returns:
+        None
+
+    """
+    chapter = save_testing_chapter(session)
+    question = save_testing_health_question(session, save_testing_section(session))
+    deleted_ids = {
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            question,
+            year,
+            6,
+            1,
+            DELETED_SCORE,
+            is_deleted=True,
+        ).id
+        for year in [2023, 2024, 2024, 2025, 2025]
+    }
+    live = save_testing_chapter_health(session, chapter.id, question, 2024, 6, 1, 3)
+    session.commit()
+
+    moved_count = compact_chapter_health(session, batch_size=2)
+
+    assert moved_count == len(deleted_ids)
+    assert session.scalars(select(ChapterHealth.id)).all() == [live.id]
+    history = session.scalars(select(ChapterHealthHistory)).all()
+    assert {health.id for health in history} == deleted_ids
+    assert all(health.is_deleted for health in history)
+    assert all(health.score == DELETED_SCORE for health in history)
@@ -0,0 +1,75 @@
+"""Tests for creating the chapter health partitions."""
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from backend.health.create_chapter_health_partitions import (
+    create_chapter_health_partition,
+    create_chapter_health_partitions,
+)
+from backend.utils import datetime_now
+from testing.fixtures.database import session, session_factory  # noqa: F401
+from testing.helpers.setup.save_testing_chapter import save_testing_chapter
+from testing.helpers.setup.save_testing_health import (
+    save_testing_chapter_health,
+    save_testing_health_question,
+    save_testing_section,
+)
+
+PARTITION_YEAR = 2099
+
+
+def test_scores_moved_from_default_partition(session: Session) -> None:
+    """
+    Test scores saved before their year's partition are moved into it.
+
+    Args:
+        session (Session): Database session
+
+    Returns:
+        None
+
+    """
+    chapter = save_testing_chapter(session)
+    question = save_testing_health_question(session, save_testing_section(session))
+    health = save_testing_chapter_health(
+        session,
+        chapter.id,
+        question,
+        PARTITION_YEAR,
+        6,
+        1,
+        3,
+    )
+
+    try:
+        created = create_chapter_health_partition(session, PARTITION_YEAR)
+        created_again = create_chapter_health_partition(session, PARTITION_YEAR)
+
+        assert created
+        assert not created_again
+        assert session.scalars(
+            text(f"SELECT id FROM chapter_health_{PARTITION_YEAR}"),  # noqa: S608
+        ).all() == [health.id]
+        assert session.scalar(text("SELECT count(*) FROM chapter_health_default")) == 0
+    finally:
+        session.rollback()
+        session.execute(text(f"DROP TABLE IF EXISTS chapter_health_{PARTITION_YEAR}"))
+        session.commit()
+
+
+def test_partitions_created_ahead(session: Session) -> None:
+    """
+    Test the current and next year have partitions.
+
+    Args:
+        session (Session): Database session
+
+    Returns:
+        None
+
+    """
+    create_chapter_health_partitions(session)
+
+    current_year = datetime_now().year
+    for year in [current_year, current_year + 1]:
+        assert session.scalar(select(func.to_regclass(f"chapter_health_{year}")))
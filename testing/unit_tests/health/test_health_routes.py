@@ -0,0 +1,1537 @@
+"""Tests for the chapter health routes."""
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+from starlette import status
+
+from backend.health.health_models import ChapterHealth, LatestChapterHealth, Section
+from testing.fixtures.client import admin_client, client  # noqa: F401
+from testing.fixtures.database import (  # noqa: F401
+    async_session_factory,
+    session,
+    session_factory,
+)
+from testing.helpers.query_budget import query_budget
+from testing.helpers.setup.save_testing_chapter import save_testing_chapter
+from testing.helpers.setup.save_testing_health import (
+    save_testing_chapter_health,
+    save_testing_health_question,
+    save_testing_section,
+)
+
+YEAR = 2024
+MONTH = 6
+WEEK = 1
+JUNE = {"from": f"{YEAR}-{MONTH}-1", "to": f"{YEAR}-{MONTH}-3"}
+
+
+class TestGetSections:
+    """Test cases for the GET /sections route."""
+
+    def test_get_sections(
+        self: "TestGetSections",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the sections are listed in id order.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        first = save_testing_section(session, "Events")
+        second = save_testing_section(session, "Finance")
+
+        response = admin_client.get("/sections")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"id": first.id, "name": "Events", "is_deleted": False},
+            {"id": second.id, "name": "Finance", "is_deleted": False},
+        ]
+
+    def test_sections_cached_until_changed(
+        self: "TestGetSections",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the cached sections are reused until a section is saved.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        save_testing_section(session, "Events")
+        admin_client.get("/sections")
+
+        with query_budget(1):
+            cached_response = admin_client.get("/sections")
+        save_testing_section(session, "Finance")
+        response = admin_client.get("/sections")
+
+        assert [section["name"] for section in cached_response.json()] == ["Events"]
+        assert [section["name"] for section in response.json()] == [
+            "Events",
+            "Finance",
+        ]
+
+    def test_sections_cached_after_write_in_progress(
+        self: "TestGetSections",
+        admin_client: TestClient,
+        session: Session,
+        session_factory: sessionmaker,
+    ) -> None:
+        """
+        Test a section saved while the sections are being cached is seen once committed.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+            session_factory (sessionmaker): Factory for a second database session
+
+        Returns:
+            None
+
+        """
+        save_testing_section(session, "Events")
+
+        with session_factory() as writer:
+            writer.add(Section(name="Finance"))
+            writer.flush()
+            in_progress_response = admin_client.get("/sections")
+            writer.commit()
+        response = admin_client.get("/sections")
+
+        assert [section["name"] for section in in_progress_response.json()] == [
+            "Events",
+        ]
+        assert [section["name"] for section in response.json()] == [
+            "Events",
+            "Finance",
+        ]
+
+    def test_get_section_not_found(
+        self: "TestGetSections",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test a deleted section is not found.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        section = save_testing_section(session)
+        section.is_deleted = True
+        session.commit()
+
+        response = admin_client.get(f"/section/{section.id}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_sections_unauthenticated(
+        self: "TestGetSections",
+        client: TestClient,
+    ) -> None:
+        """
+        Test the sections cannot be listed without a token.
+
+        Args:
+            client (TestClient): Test client
+
+        Returns:
+            None
+
+        """
+        response = client.get("/sections")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestUpdateChapterHealth:
+    """Test cases for the PUT /health/{chapter_id} route."""
+
+    def test_scores_and_comments_are_upserted(
+        self: "TestUpdateChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test saving a period again updates its scores and keeps its comments.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        updated_score = 3
+        chapter = save_testing_chapter(session)
+        section = save_testing_section(session)
+        questions = [save_testing_health_question(session, section) for _ in range(5)]
+        period = {"year": YEAR, "month": MONTH, "week": WEEK}
+
+        with query_budget(2):
+            response = admin_client.put(
+                f"/health/{chapter.id}",
+                json={
+                    **period,
+                    **{str(question.id): "2" for question in questions[:-1]},
+                    str(questions[-1].id): "Going well",
+                },
+            )
+        assert response.status_code == status.HTTP_200_OK
+        response = admin_client.put(
+            f"/health/{chapter.id}",
+            json={**period, str(questions[0].id): updated_score},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        session.expire_all()
+        scores = {
+            health.health_question_id: (health.score, health.comments)
+            for health in session.scalars(select(ChapterHealth))
+        }
+        assert len(scores) == len(questions)
+        assert scores[questions[0].id] == (updated_score, None)
+        assert scores[questions[1].id] == (2, None)
+        assert scores[questions[-1].id] == (None, "Going well")
+        latest_scores = {
+            health.health_question_id: (health.score, health.comments)
+            for health in session.scalars(select(LatestChapterHealth))
+        }
+        assert latest_scores == scores
+
+    def test_unknown_question_saves_nothing(
+        self: "TestUpdateChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test no scores are saved if any question in the submission does not exist.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        question = save_testing_health_question(session, save_testing_section(session))
+
+        response = admin_client.put(
+            f"/health/{chapter.id}",
+            json={
+                "year": YEAR,
+                "month": MONTH,
+                "week": WEEK,
+                str(question.id): "2",
+                str(question.id + 1): "3",
+            },
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": f"Question {question.id + 1} not found"}
+        assert session.scalars(select(ChapterHealth)).first() is None
+
+    def test_missing_period_saves_nothing(
+        self: "TestUpdateChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test no scores are saved without a year, month and week.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        question = save_testing_health_question(session, save_testing_section(session))
+
+        null_year_response = admin_client.put(
+            f"/health/{chapter.id}",
+            json={"year": None, "month": MONTH, "week": WEEK, str(question.id): "2"},
+        )
+        missing_week_response = admin_client.put(
+            f"/health/{chapter.id}",
+            json={"year": YEAR, "month": MONTH, str(question.id): "2"},
+        )
+
+        assert null_year_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert missing_week_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert session.scalars(select(ChapterHealth)).first() is None
+
+    def test_repeated_question_saves_last_value(
+        self: "TestUpdateChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test keys naming the same question save its last value.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        question = save_testing_health_question(session, save_testing_section(session))
+
+        response = admin_client.put(
+            f"/health/{chapter.id}",
+            json={
+                "year": YEAR,
+                "month": MONTH,
+                "week": WEEK,
+                str(question.id): "2",
+                f"0{question.id}": "3",
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        scores = session.scalars(select(ChapterHealth.score)).all()
+        assert scores == [3]
+
+
+class TestGetChapterHealthBySection:
+    """Test cases for the GET /health/{chapter_id}/section/{section_id} route."""
+
+    def test_latest_score_is_returned(
+        self: "TestGetChapterHealthBySection",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the current score for a period is returned for each question.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        latest_score = 3
+        chapter = save_testing_chapter(session)
+        section = save_testing_section(session)
+        score_question = save_testing_health_question(session, section)
+        comment_question = save_testing_health_question(session, section)
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            score_question,
+            YEAR,
+            MONTH,
+            WEEK,
+            2,
+            is_deleted=True,
+        )
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            score_question,
+            YEAR,
+            MONTH,
+            WEEK,
+            latest_score,
+        )
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            comment_question,
+            YEAR,
+            MONTH,
+            WEEK,
+            comments="Going well",
+        )
+
+        response = admin_client.get(
+            f"/health/{chapter.id}/section/{section.id}",
+            params=JUNE,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        june = response.json()[0]
+        assert june["year"] == YEAR
+        assert june["month"] == MONTH
+        assert june["week"] == WEEK
+        assert june[str(score_question.id)] == latest_score
+        assert june[str(comment_question.id)] == "Going well"
+        assert response.json()[1][str(score_question.id)] is None
+
+    def test_deleted_scores_are_ignored(
+        self: "TestGetChapterHealthBySection",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test a deleted score is not returned, even if it is the most recent.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        section = save_testing_section(session)
+        question = save_testing_health_question(session, section)
+        save_testing_chapter_health(session, chapter.id, question, YEAR, MONTH, WEEK, 1)
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            question,
+            YEAR,
+            MONTH,
+            WEEK,
+            2,
+            is_deleted=True,
+        )
+
+        response = admin_client.get(
+            f"/health/{chapter.id}/section/{section.id}",
+            params=JUNE,
+        )
+
+        assert response.json()[0][str(question.id)] == 1
+
+    def test_query_count_does_not_grow_with_questions(
+        self: "TestGetChapterHealthBySection",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the scores are fetched in one query however many questions there are.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        section = save_testing_section(session)
+        for _ in range(5):
+            question = save_testing_health_question(session, section)
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH,
+                WEEK,
+                2,
+            )
+        # Load the cached questions first
+        admin_client.get("/sections")
+
+        with query_budget(2):
+            response = admin_client.get(
+                f"/health/{chapter.id}/section/{section.id}",
+                params=JUNE,
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_default_periods_end_with_latest_scores(
+        self: "TestGetChapterHealthBySection",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test ten months of health checks up to the latest scores are returned.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        section = save_testing_section(session)
+        question = save_testing_health_question(session, section)
+        save_testing_chapter_health(session, chapter.id, question, 2025, 3, 3, 2)
+        # Load the cached questions first
+        admin_client.get("/sections")
+
+        with query_budget(3):
+            response = admin_client.get(f"/health/{chapter.id}/section/{section.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        periods = [(row["year"], row["month"], row["week"]) for row in response.json()]
+        assert len(periods) == 20  # noqa: PLR2004
+        assert periods[0] == (2024, 6, 1)
+        assert periods[-1] == (2025, 3, 3)
+        assert response.json()[-1][str(question.id)] == 2  # noqa: PLR2004
+
+    def test_period_range(
+        self: "TestGetChapterHealthBySection",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test a range includes its health checks and any other period with scores.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        section = save_testing_section(session)
+        question = save_testing_health_question(session, section)
+        save_testing_chapter_health(session, chapter.id, question, 2023, 12, 2, 1)
+        save_testing_chapter_health(session, chapter.id, question, 2024, 2, 1, 3)
+
+        response = admin_client.get(
+            f"/health/{chapter.id}/section/{section.id}",
+            params={"from": "2023-12-1", "to": "2024-01-3"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"year": 2023, "month": 12, "week": 1, str(question.id): None},
+            {"year": 2023, "month": 12, "week": 2, str(question.id): 1},
+            {"year": 2023, "month": 12, "week": 3, str(question.id): None},
+            {"year": 2024, "month": 1, "week": 1, str(question.id): None},
+            {"year": 2024, "month": 1, "week": 3, str(question.id): None},
+        ]
+
+    def test_invalid_period_range(
+        self: "TestGetChapterHealthBySection",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test a malformed period or a range which ends before it starts is rejected.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        section = save_testing_section(session)
+        url = f"/health/{chapter.id}/section/{section.id}"
+
+        malformed = admin_client.get(url, params={"from": "2024-13-1"})
+        reversed_range = admin_client.get(
+            url,
+            params={"from": "2024-06-1", "to": "2024-01-1"},
+        )
+
+        assert malformed.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert reversed_range.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestGetChapterHealthBySectionAndPeriod:
+    """Test cases for the zone health matrix route."""
+
+    def test_zone_matrix(
+        self: "TestGetChapterHealthBySectionAndPeriod",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test every chapter in the zone gets its latest scores and their average.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        average = 2.33
+        scored = save_testing_chapter(session, name="A Chapter", zone="London")
+        unscored = save_testing_chapter(session, name="B Chapter", zone="London")
+        save_testing_chapter(session, name="C Chapter", zone="North")
+        section = save_testing_section(session)
+        questions = [save_testing_health_question(session, section) for _ in range(3)]
+        comment_question = save_testing_health_question(session, section)
+        for question, score in zip(questions, [1, 3, 3], strict=True):
+            save_testing_chapter_health(
+                session,
+                scored.id,
+                question,
+                YEAR,
+                MONTH,
+                WEEK,
+                score,
+            )
+        save_testing_chapter_health(
+            session,
+            scored.id,
+            comment_question,
+            YEAR,
+            MONTH,
+            WEEK,
+            comments="Going well",
+        )
+
+        with query_budget(1):
+            response = admin_client.get(
+                f"/health/zone/London/year/{YEAR}/month/{MONTH}/week/{WEEK}"
+                f"/section/{section.id}",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "chapter_id": str(scored.id),
+                "chapter": "A Chapter",
+                str(questions[0].id): 1,
+                str(questions[1].id): 3,
+                str(questions[2].id): 3,
+                str(comment_question.id): "Going well",
+                "average": average,
+            },
+            {
+                "chapter_id": str(unscored.id),
+                "chapter": "B Chapter",
+                str(questions[0].id): None,
+                str(questions[1].id): None,
+                str(questions[2].id): None,
+                str(comment_question.id): None,
+                "average": None,
+            },
+        ]
+
+    def test_average_rounds_half_to_even(
+        self: "TestGetChapterHealthBySectionAndPeriod",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test an average halfway between two hundredths is rounded to the even one.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        average = 4.62
+        chapter = save_testing_chapter(session, zone="London")
+        section = save_testing_section(session)
+        for score in [5, 5, 5, 5, 5, 5, 5, 2]:
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                save_testing_health_question(session, section),
+                YEAR,
+                MONTH,
+                WEEK,
+                score,
+            )
+
+        response = admin_client.get(
+            f"/health/zone/London/year/{YEAR}/month/{MONTH}/week/{WEEK}"
+            f"/section/{section.id}",
+        )
+
+        # The mean is 4.625
+        assert response.json()[0]["average"] == average
+
+
+class TestGetZoneHealthStatistics:
+    """Test cases for the zone health statistics route."""
+
+    def test_zone_statistics(
+        self: "TestGetZoneHealthStatistics",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test each section's statistics and each chapter's z-scores in the zone.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        first = save_testing_chapter(session, name="A Chapter", zone="London")
+        second = save_testing_chapter(session, name="B Chapter", zone="London")
+        other = save_testing_chapter(session, name="C Chapter", zone="North")
+        section = save_testing_section(session)
+        questions = [save_testing_health_question(session, section) for _ in range(2)]
+        for chapter, scores in [(first, [1, 3]), (second, [4, 4]), (other, [1, 1])]:
+            for question, score in zip(questions, scores, strict=True):
+                save_testing_chapter_health(
+                    session,
+                    chapter.id,
+                    question,
+                    YEAR,
+                    MONTH,
+                    WEEK,
+                    score,
+                )
+
+        with query_budget(2):
+            response = admin_client.get("/health/zone/London/stats")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "zone": "London",
+            "year": YEAR,
+            "month": MONTH,
+            "week": WEEK,
+            "sections": [
+                {
+                    "section_id": section.id,
+                    "section": section.name,
+                    "chapters": 2,
+                    "mean": 3.0,
+                    "median": 3.0,
+                    "std": 1.0,
+                    "percentiles": {"10": 2.2, "25": 2.5, "75": 3.5, "90": 3.8},
+                },
+            ],
+            "chapters": [
+                {
+                    "chapter_id": str(first.id),
+                    "chapter": "A Chapter",
+                    "averages": [2.0],
+                    "z_scores": [-1.0],
+                },
+                {
+                    "chapter_id": str(second.id),
+                    "chapter": "B Chapter",
+                    "averages": [4.0],
+                    "z_scores": [1.0],
+                },
+            ],
+        }
+
+    def test_zone_without_scores(
+        self: "TestGetZoneHealthStatistics",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test a zone without scores is not found, and a period without scores is empty.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        save_testing_chapter(session, zone="London")
+
+        latest_response = admin_client.get("/health/zone/London/stats")
+        period_response = admin_client.get(
+            "/health/zone/London/stats",
+            params={"period": f"{YEAR}-{MONTH}-{WEEK}"},
+        )
+
+        assert latest_response.status_code == status.HTTP_404_NOT_FOUND
+        assert period_response.status_code == status.HTTP_200_OK
+        assert period_response.json()["sections"] == []
+        assert period_response.json()["chapters"] == []
+
+
+class TestGetZoneHealthRankings:
+    """Test cases for the zone health rankings route."""
+
+    def test_zone_rankings(
+        self: "TestGetZoneHealthRankings",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the zone's chapters are ranked best first in each section.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapters = [
+            save_testing_chapter(session, name=name, zone="London")
+            for name in ["A Chapter", "B Chapter", "C Chapter"]
+        ]
+        other = save_testing_chapter(session, name="D Chapter", zone="North")
+        section = save_testing_section(session)
+        questions = [save_testing_health_question(session, section) for _ in range(2)]
+        for chapter, scores in zip(
+            [*chapters, other],
+            [[2, 3], [5, 5], [3, 2], [5, 5]],
+            strict=True,
+        ):
+            for question, score in zip(questions, scores, strict=True):
+                save_testing_chapter_health(
+                    session,
+                    chapter.id,
+                    question,
+                    YEAR,
+                    MONTH,
+                    WEEK,
+                    score,
+                )
+        period = {"period": f"{YEAR}-{MONTH}-{WEEK}"}
+
+        with query_budget(1):
+            response = admin_client.get("/health/zone/London/rankings", params=period)
+        chapter_response = admin_client.get(
+            "/health/zone/London/rankings",
+            params={**period, "chapter_id": str(chapters[0].id)},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "section_id": section.id,
+                "section": section.name,
+                "chapters": [
+                    {
+                        "chapter_id": str(chapters[1].id),
+                        "chapter": "B Chapter",
+                        "average": 5.0,
+                        "rank": 1,
+                        "percentile": 1.0,
+                    },
+                    {
+                        "chapter_id": str(chapters[0].id),
+                        "chapter": "A Chapter",
+                        "average": 2.5,
+                        "rank": 2,
+                        "percentile": 0.0,
+                    },
+                    {
+                        "chapter_id": str(chapters[2].id),
+                        "chapter": "C Chapter",
+                        "average": 2.5,
+                        "rank": 2,
+                        "percentile": 0.0,
+                    },
+                ],
+            },
+        ]
+        assert chapter_response.json()[0]["chapters"] == [
+            response.json()[0]["chapters"][1],
+        ]
+
+
+class TestGetHealthTrends:
+    """Test cases for the health trends route."""
+
+    def test_zone_trends(
+        self: "TestGetHealthTrends",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test each section's averages, their changes and the slope of their trend.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session, name="A Chapter", zone="London")
+        other = save_testing_chapter(session, name="B Chapter", zone="North")
+        section = save_testing_section(session)
+        questions = [save_testing_health_question(session, section) for _ in range(2)]
+        periods = [(MONTH, 1, [1, 2]), (MONTH, 3, [3, 4]), (MONTH + 1, 1, [2, 2])]
+        for month, week, scores in periods:
+            for question, score in zip(questions, scores, strict=True):
+                save_testing_chapter_health(
+                    session,
+                    chapter.id,
+                    question,
+                    YEAR,
+                    month,
+                    week,
+                    score,
+                )
+        save_testing_chapter_health(session, other.id, questions[0], YEAR, MONTH, 1, 4)
+
+        with query_budget(2):
+            response = admin_client.get("/health/trends", params={"zone": "London"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "chapter_id": str(chapter.id),
+                "chapter": "A Chapter",
+                "sections": [
+                    {
+                        "section_id": section.id,
+                        "section": section.name,
+                        "slope": 0.5,
+                        "periods": [
+                            {
+                                "year": YEAR,
+                                "month": MONTH,
+                                "week": 1,
+                                "average": 1.5,
+                                "delta": None,
+                            },
+                            {
+                                "year": YEAR,
+                                "month": MONTH,
+                                "week": 3,
+                                "average": 3.5,
+                                "delta": 2.0,
+                            },
+                            {
+                                "year": YEAR,
+                                "month": MONTH + 1,
+                                "week": 1,
+                                "average": 2.0,
+                                "delta": -1.5,
+                            },
+                        ],
+                    },
+                ],
+            },
+        ]
+
+    def test_organisation_trends_in_range(
+        self: "TestGetHealthTrends",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test every zone's chapters are included, with only the periods in the range.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        first = save_testing_chapter(session, name="A Chapter", zone="London")
+        second = save_testing_chapter(session, name="B Chapter", zone="North")
+        question = save_testing_health_question(session, save_testing_section(session))
+        for chapter in [first, second]:
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH,
+                1,
+                2,
+            )
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH,
+                3,
+                3,
+            )
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH + 1,
+                1,
+                5,
+            )
+
+        with query_budget(1):
+            response = admin_client.get("/health/trends", params=JUNE)
+
+        assert response.status_code == status.HTTP_200_OK
+        trends = response.json()
+        assert [chapter["chapter"] for chapter in trends] == ["A Chapter", "B Chapter"]
+        for chapter in trends:
+            (section,) = chapter["sections"]
+            assert section["slope"] == 2.0  # noqa: PLR2004
+            assert [period["delta"] for period in section["periods"]] == [None, 1.0]
+
+
+class TestGetHealthHeatmap:
+    """Test cases for the health heatmap route."""
+
+    def test_heatmap(
+        self: "TestGetHealthHeatmap",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test every zone, period and section's average is in the flat grid.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        london = save_testing_chapter(session, zone="London")
+        other_london = save_testing_chapter(session, zone="London")
+        north = save_testing_chapter(session, zone="North")
+        events = save_testing_section(session, "Events")
+        finance = save_testing_section(session, "Finance")
+        events_question = save_testing_health_question(session, events)
+        finance_question = save_testing_health_question(session, finance)
+        for chapter, question, week, score in [
+            (london, events_question, 1, 1),
+            (other_london, events_question, 1, 4),
+            (london, finance_question, 3, 2),
+            (north, events_question, 3, 5),
+        ]:
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH,
+                week,
+                score,
+            )
+
+        with query_budget(1):
+            response = admin_client.get("/health/heatmap", params=JUNE)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "zones": ["London", "North"],
+            "periods": [f"{YEAR}-0{MONTH}-1", f"{YEAR}-0{MONTH}-3"],
+            "section_ids": [events.id, finance.id],
+            "sections": ["Events", "Finance"],
+            "averages": [2.5, None, None, 2.0, None, None, 5.0, None],
+        }
+
+
+class TestGetMissingChapterHealth:
+    """Test cases for the missing chapter health route."""
+
+    def test_missing_sections(
+        self: "TestGetMissingChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test only the sections with unanswered questions in the period are listed.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session, name="A Chapter", zone="London")
+        save_testing_chapter(session, name="B Chapter", zone="North")
+        complete_section = save_testing_section(session)
+        partial_section = save_testing_section(session)
+        complete_question = save_testing_health_question(session, complete_section)
+        answered_question = save_testing_health_question(session, partial_section)
+        missing_question = save_testing_health_question(session, partial_section)
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            complete_question,
+            YEAR,
+            MONTH,
+            WEEK,
+            comments="Going well",
+        )
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            answered_question,
+            YEAR,
+            MONTH,
+            WEEK,
+            3,
+        )
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            missing_question,
+            YEAR,
+            MONTH,
+            WEEK + 2,
+            3,
+        )
+
+        with query_budget(1):
+            response = admin_client.get(
+                "/health/missing",
+                params={"period": f"{YEAR}-{MONTH}-{WEEK}", "zone": "London"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "chapter_id": str(chapter.id),
+                "chapter": "A Chapter",
+                "zone": "London",
+                "section_id": partial_section.id,
+                "section": partial_section.name,
+                "question_ids": [missing_question.id],
+            },
+        ]
+
+    def test_blank_comments_not_missing(
+        self: "TestGetMissingChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test a section is not listed when only its comments are blank.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session, zone="London")
+        section = save_testing_section(session)
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            save_testing_health_question(session, section),
+            YEAR,
+            MONTH,
+            WEEK,
+            3,
+        )
+        save_testing_health_question(session, section, is_comments=True)
+
+        response = admin_client.get(
+            "/health/missing",
+            params={"period": f"{YEAR}-{MONTH}-{WEEK}", "zone": "London"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    def test_every_zone_missing(
+        self: "TestGetMissingChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test every chapter's sections are listed when no zone is given.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        save_testing_chapter(session, name="A Chapter", zone="London")
+        save_testing_chapter(session, name="B Chapter", zone="North")
+        section = save_testing_section(session)
+        questions = [save_testing_health_question(session, section) for _ in range(2)]
+
+        response = admin_client.get(
+            "/health/missing",
+            params={"period": f"{YEAR}-{MONTH}-{WEEK}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [(row["chapter"], row["question_ids"]) for row in response.json()] == [
+            ("A Chapter", [question.id for question in questions]),
+            ("B Chapter", [question.id for question in questions]),
+        ]
+
+
+class TestGetAverageChapterHealth:
+    """Test cases for the chapter's average health for a period route."""
+
+    def test_section_averages(
+        self: "TestGetAverageChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test each section's average counts a comment as 0 and skips unanswered questions.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        answered = save_testing_section(session, "Events")
+        save_testing_section(session, "Finance")
+        questions = [save_testing_health_question(session, answered) for _ in range(4)]
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            questions[0],
+            YEAR,
+            MONTH,
+            WEEK,
+            1,
+            is_deleted=True,
+        )
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            questions[0],
+            YEAR,
+            MONTH,
+            WEEK,
+            3,
+        )
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            questions[1],
+            YEAR,
+            MONTH,
+            WEEK,
+            2,
+        )
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            questions[2],
+            YEAR,
+            MONTH,
+            WEEK,
+            comments="Going well",
+        )
+
+        with query_budget(1):
+            response = admin_client.get(
+                f"/health/{chapter.id}/year/{YEAR}/month/{MONTH}/week/{WEEK}/average",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [5 / 3, None]
+
+
+class TestGetChapterLatestHealth:
+    """Test cases for the GET /health/{chapter_id}/latest route."""
+
+    def test_latest_section_averages(
+        self: "TestGetChapterLatestHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test each section's average uses the most recent period of every question.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        average = 2.5
+        chapter = save_testing_chapter(session)
+        answered = save_testing_section(session, "Events")
+        save_testing_section(session, "Finance")
+        first = save_testing_health_question(session, answered)
+        second = save_testing_health_question(session, answered)
+        comments = save_testing_health_question(
+            session,
+            answered,
+            "Comments",
+            is_comments=True,
+        )
+        save_testing_chapter_health(session, chapter.id, first, YEAR, MONTH, 3, 3)
+        save_testing_chapter_health(session, chapter.id, first, YEAR, MONTH, WEEK, 1)
+        save_testing_chapter_health(session, chapter.id, second, YEAR - 1, 12, 3, 2)
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            comments,
+            YEAR,
+            MONTH,
+            3,
+            comments="Going well",
+        )
+
+        with query_budget(1):
+            response = admin_client.get(f"/health/{chapter.id}/latest")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"section": "Events", "average": average, "icon": None},
+            {"section": "Finance", "average": None, "icon": None},
+        ]
+
+
+class TestSearchChapterHealthComments:
+    """Test cases for the health comments search route."""
+
+    def test_search_ranked_and_paged(
+        self: "TestSearchChapterHealthComments",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the matching comments are ranked best first and paged.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session, name="A Chapter")
+        section = save_testing_section(session, "Events")
+        question = save_testing_health_question(session, section, is_comments=True)
+        for week, comments in [
+            (1, "Diwali event planned"),
+            (2, "Events planned: Diwali and Holi events"),
+            (3, "Nothing happened"),
+        ]:
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH,
+                week,
+                comments=comments,
+            )
+
+        with query_budget(1):
+            first_page = admin_client.get(
+                "/health/comments/search",
+                params={"query": "planned events", "rows": 1},
+            )
+        second_page = admin_client.get(
+            "/health/comments/search",
+            params={"query": "planned events", "rows": 1, "page": 1},
+        )
+        past_last_page = admin_client.get(
+            "/health/comments/search",
+            params={"query": "planned events", "rows": 1, "page": 2},
+        )
+
+        assert first_page.status_code == status.HTTP_200_OK
+        assert first_page.json()["totalRecords"] == 2  # noqa: PLR2004
+        (best_match,) = first_page.json()["results"]
+        assert best_match["comments"] == "Events planned: Diwali and Holi events"
+        assert best_match["chapter"] == "A Chapter"
+        assert best_match["section"] == "Events"
+        assert best_match["week"] == 2  # noqa: PLR2004
+        (next_match,) = second_page.json()["results"]
+        assert next_match["comments"] == "Diwali event planned"
+        assert next_match["rank"] < best_match["rank"]
+        assert past_last_page.json() == {"results": [], "totalRecords": 2}
+
+    def test_search_without_matches(
+        self: "TestSearchChapterHealthComments",
+        admin_client: TestClient,
+    ) -> None:
+        """
+        Test a search without matches returns no results.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+
+        Returns:
+            None
+
+        """
+        response = admin_client.get(
+            "/health/comments/search",
+            params={"query": "fundraising"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"results": [], "totalRecords": 0}
+
+    def test_search_excludes_deleted_questions(
+        self: "TestSearchChapterHealthComments",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the comments of a deleted question or section are not searched.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        deleted_section = save_testing_section(session)
+        section = save_testing_section(session)
+        deleted_question = save_testing_health_question(session, section)
+        for question in [
+            save_testing_health_question(session, deleted_section),
+            deleted_question,
+        ]:
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH,
+                WEEK,
+                comments="Diwali event planned",
+            )
+        deleted_section.is_deleted = True
+        deleted_question.is_deleted = True
+        session.commit()
+
+        response = admin_client.get(
+            "/health/comments/search",
+            params={"query": "diwali"},
+        )
+
+        assert response.json() == {"results": [], "totalRecords": 0}
+
+    def test_search_page_size_validated(
+        self: "TestSearchChapterHealthComments",
+        admin_client: TestClient,
+    ) -> None:
+        """
+        Test a page size outside 1 to 100 or a negative page is rejected.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+
+        Returns:
+            None
+
+        """
+        for params in [{"rows": -1}, {"rows": 101}, {"page": -1}]:
+            response = admin_client.get(
+                "/health/comments/search",
+                params={"query": "diwali", **params},
+            )
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestGetCommentsChapterHealth:
+    """Test cases for the chapter's health comments for a period route."""
+
+    def test_comments(
+        self: "TestGetCommentsChapterHealth",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test the comments questions' answers are listed in section order.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter = save_testing_chapter(session)
+        events = save_testing_section(session, "Events")
+        finance = save_testing_section(session, "Finance")
+        save_testing_section(session, "Sewa")
+        for section, comments in ((finance, None), (events, "Going well")):
+            question = save_testing_health_question(
+                session,
+                section,
+                "Comments",
+                is_comments=True,
+            )
+            save_testing_chapter_health(
+                session,
+                chapter.id,
+                question,
+                YEAR,
+                MONTH,
+                WEEK,
+                comments=comments,
+            )
+        score_question = save_testing_health_question(session, events)
+        save_testing_chapter_health(
+            session,
+            chapter.id,
+            score_question,
+            YEAR,
+            MONTH,
+            WEEK,
+            2,
+        )
+
+        with query_budget(1):
+            response = admin_client.get(
+                f"/health/{chapter.id}/year/{YEAR}/month/{MONTH}/week/{WEEK}/comments",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"section": "Events", "comment": "Going well"},
+            {"section": "Finance", "comment": None},
+        ]
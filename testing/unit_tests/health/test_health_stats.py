@@ -0,0 +1,26 @@
+"""Tests for the chapter health statistics."""
+import numpy as np
+
+from backend.health.health_stats import rounded, section_statistics
+
+
+def test_section_statistics_skip_missing_averages() -> None:
+    """
+    Test a chapter without scores in a section is left out of its statistics.
+
+    Returns
+        None
+
+    """
+    stats = section_statistics(
+        np.array([0, 1, 1, 2]),
+        np.array([0, 0, 1, 0]),
+        np.array([2.0, 4.0, 5.0, 6.0]),
+        (3, 2),
+    )
+
+    assert rounded(stats.averages) == [[2.0, None], [4.0, 5.0], [6.0, None]]
+    assert stats.counts.tolist() == [3, 1]
+    assert rounded(stats.mean) == [4.0, 5.0]
+    assert rounded(stats.median) == [4.0, 5.0]
+    assert rounded(stats.z_scores) == [[-1.22, None], [0.0, 0.0], [1.22, None]]
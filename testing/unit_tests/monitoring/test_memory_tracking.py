@@ -0,0 +1,86 @@
+"""Tests for the sampled per-route memory accounting."""
+import tracemalloc
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette import status
+
+from backend.monitoring.memory_tracking import MemoryTracker, memory_tracker
+from testing.fixtures.client import admin_client, client  # noqa: F401
+from testing.fixtures.database import (  # noqa: F401
+    async_session_factory,
+    session,
+    session_factory,
+)
+
+
+@pytest.fixture()
+def _sample_every_request(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Sample every request, starting from empty memory stats."""
+    monkeypatch.setattr(memory_tracker, "sample_rate", 1)
+    memory_tracker.clear()
+    yield
+    memory_tracker.clear()
+
+
+def test_record() -> None:
+    """Test the samples of a route are aggregated."""
+    tracker = MemoryTracker(sample_rate=1)
+
+    tracker.record("/chapters", 100, 10)
+    tracker.record("/chapters", 300, 30)
+    tracker.record("/sections", 50, 0)
+
+    assert tracker.summary() == [
+        {
+            "route": "/chapters",
+            "samples": 2,
+            "mean_peak": 200,
+            "max_peak": 300,
+            "mean_retained": 20,
+            "max_retained": 30,
+        },
+        {
+            "route": "/sections",
+            "samples": 1,
+            "mean_peak": 50,
+            "max_peak": 50,
+            "mean_retained": 0,
+            "max_retained": 0,
+        },
+    ]
+
+
+def test_requests_are_not_sampled_at_zero_rate() -> None:
+    """Test tracemalloc is not started when the request is not sampled."""
+    tracker = MemoryTracker(sample_rate=0)
+
+    assert not tracker.start()
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.usefixtures("_sample_every_request")
+def test_memory_stats(admin_client: TestClient) -> None:
+    """Test sampled requests are reported by route and tracing is stopped after."""
+    admin_client.get("/health")
+    admin_client.get("/health")
+
+    response = admin_client.get("/memory")
+
+    assert response.status_code == status.HTTP_200_OK
+    health_stats = next(s for s in response.json() if s["route"] == "/health")
+    assert health_stats["samples"] == 2  # noqa: PLR2004
+    assert health_stats["max_peak"] > 0
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.usefixtures("_sample_every_request")
+def test_clear_memory_stats(admin_client: TestClient) -> None:
+    """Test the memory stats can be cleared."""
+    admin_client.get("/health")
+
+    response = admin_client.delete("/memory")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
@@ -0,0 +1,81 @@
+"""Tests for the Prometheus metrics."""
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from starlette import status
+
+from backend.monitoring import monitoring_routes
+from testing.fixtures.client import admin_client, client  # noqa: F401
+from testing.fixtures.database import (  # noqa: F401
+    async_session_factory,
+    session,
+    session_factory,
+)
+
+
+def sample_value(name: str, labels: dict[str, str]) -> float:
+    """Get the current value of a metric sample, 0 if it has not been recorded."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_metrics(client: TestClient) -> None:
+    """Test the metrics are served in the Prometheus text format."""
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_requests_total" in response.text
+    assert "http_request_duration_seconds_bucket" in response.text
+    assert "http_requests_in_flight" in response.text
+
+
+def test_metrics_token(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the metrics need the metrics token as a bearer token when it is set."""
+    monkeypatch.setattr(monitoring_routes, "METRICS_TOKEN", "scrape")
+
+    anonymous_response = client.get("/metrics")
+    wrong_token_response = client.get(
+        "/metrics",
+        headers={"Authorization": "Bearer wrong"},
+    )
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape"})
+
+    assert anonymous_response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert wrong_token_response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_requests_are_labelled_by_route_template(admin_client: TestClient) -> None:
+    """Test requests for different chapters are counted in the same series."""
+    labels = {
+        "method": "GET",
+        "route": "/chapter/{chapter_id}",
+        "status_code": "404",
+    }
+    before = sample_value("http_requests_total", labels)
+
+    admin_client.get(f"/chapter/{uuid4()}")
+    admin_client.get(f"/chapter/{uuid4()}")
+
+    assert sample_value("http_requests_total", labels) == before + 2
+    assert (
+        sample_value(
+            "http_request_duration_seconds_count",
+            {"method": "GET", "route": "/chapter/{chapter_id}"},
+        )
+        >= before + 2
+    )
+
+
+def test_unmatched_requests_share_a_series(client: TestClient) -> None:
+    """Test requests which do not match a route do not create a series per path."""
+    labels = {"method": "GET", "route": "<unmatched>", "status_code": "404"}
+    before = sample_value("http_requests_total", labels)
+
+    client.get(f"/{uuid4()}")
+
+    assert sample_value("http_requests_total", labels) == before + 1
@@ -0,0 +1,167 @@
+"""Tests for the on-demand request profiler."""
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette import status
+
+from backend.users.users_commands.tokens import create_access_token
+from testing.fixtures.client import admin_client, client  # noqa: F401
+from testing.fixtures.database import (  # noqa: F401
+    async_session_factory,
+    session,
+    session_factory,
+)
+from testing.helpers.setup.save_testing_user import save_testing_user
+
+
+def bearer_token(
+    session: Session,
+    user_type: str,
+    claimed_user_type: str | None = None,
+    is_deleted: bool = False,
+) -> dict[str, str]:
+    """Get an Authorization header for a saved user of the given type."""
+    user = save_testing_user(session, user_type, is_deleted)
+    token = create_access_token(
+        data={"sub": user.email, "user_type": claimed_user_type or user_type},
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestProfilingMiddleware:
+    """Test cases for the profiling middleware."""
+
+    def test_admin_request_is_profiled(
+        self: "TestProfilingMiddleware",
+        admin_client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test an admin's request with the profile header is profiled.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        response = admin_client.get(
+            "/health",
+            headers={"X-Profile": "true", **bearer_token(session, "admin")},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        profile_id = response.headers["X-Profile-Id"]
+
+        profile_response = admin_client.get(f"/profiles/{profile_id}")
+
+        assert profile_response.status_code == status.HTTP_200_OK
+        assert "speedscope" in json.loads(profile_response.content)["$schema"]
+        assert {
+            "id": profile_id,
+            "method": "GET",
+            "path": "/health",
+        }.items() <= admin_client.get("/profiles").json()[0].items()
+
+    def test_profile_query_parameter(
+        self: "TestProfilingMiddleware",
+        client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test a request can ask to be profiled with a query parameter.
+
+        Args:
+            client (TestClient): Test client
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        response = client.get(
+            "/health?profile=1",
+            headers=bearer_token(session, "super_admin"),
+        )
+
+        assert "X-Profile-Id" in response.headers
+
+    def test_non_admin_request_is_not_profiled(
+        self: "TestProfilingMiddleware",
+        client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test requests which are not made by an admin are never profiled.
+
+        Args:
+            client (TestClient): Test client
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        chapter_response = client.get(
+            "/health",
+            headers={"X-Profile": "true", **bearer_token(session, "chapter")},
+        )
+        anonymous_response = client.get("/health", headers={"X-Profile": "true"})
+
+        assert "X-Profile-Id" not in chapter_response.headers
+        assert "X-Profile-Id" not in anonymous_response.headers
+
+    def test_former_admin_request_is_not_profiled(
+        self: "TestProfilingMiddleware",
+        client: TestClient,
+        session: Session,
+    ) -> None:
+        """
+        Test an admin token is not enough once the user is deleted or demoted.
+
+        Args:
+            client (TestClient): Test client
+            session (Session): Database session
+
+        Returns:
+            None
+
+        """
+        deleted_response = client.get(
+            "/health",
+            headers={
+                "X-Profile": "true",
+                **bearer_token(session, "admin", is_deleted=True),
+            },
+        )
+        demoted_response = client.get(
+            "/health",
+            headers={
+                "X-Profile": "true",
+                **bearer_token(session, "chapter", claimed_user_type="admin"),
+            },
+        )
+
+        assert "X-Profile-Id" not in deleted_response.headers
+        assert "X-Profile-Id" not in demoted_response.headers
+
+    def test_missing_profile(
+        self: "TestProfilingMiddleware",
+        admin_client: TestClient,
+    ) -> None:
+        """
+        Test a profile which does not exist is not found.
+
+        Args:
+            admin_client (TestClient): Test client authenticated as an admin
+
+        Returns:
+            None
+
+        """
+        response = admin_client.get("/profiles/missing")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
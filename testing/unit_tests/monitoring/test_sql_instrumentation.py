@@ -0,0 +1,79 @@
+"""Tests for the per-request SQL instrumentation."""
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette import status
+
+from backend.monitoring.sql_instrumentation import QueryStats
+from testing.fixtures.client import admin_client, client  # noqa: F401
+from testing.fixtures.database import (  # noqa: F401
+    async_session_factory,
+    session,
+    session_factory,
+)
+from testing.helpers.query_budget import query_budget
+from testing.helpers.setup.save_testing_health import save_testing_section
+
+
+def test_query_stats_record() -> None:
+    """Test the query count, total time and slowest statement are recorded."""
+    stats = QueryStats()
+
+    stats.record("SELECT 1", 0.5)
+    stats.record("SELECT\n    2", 2.0)
+    stats.record("SELECT 3", 1.0)
+
+    assert stats.count == 3  # noqa: PLR2004
+    assert stats.total_time == 3.5  # noqa: PLR2004
+    assert stats.slowest_time == 2.0  # noqa: PLR2004
+    assert stats.slowest_statement == "SELECT 2"
+
+
+def test_server_timing_header(admin_client: TestClient, session: Session) -> None:
+    """Test the queries issued by a request are reported in the Server-Timing header."""
+    save_testing_section(session)
+    # Load the cached sections, so the request only checks they are up to date
+    admin_client.get("/sections")
+
+    response = admin_client.get("/sections")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "db;dur=" in response.headers["Server-Timing"]
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+    assert "app;dur=" in response.headers["Server-Timing"]
+
+
+def test_structured_log_line(
+    admin_client: TestClient,
+    session: Session,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a JSON log line is written for each request."""
+    save_testing_section(session)
+    admin_client.get("/sections")
+
+    with caplog.at_level(logging.INFO, logger="backend.sql"):
+        admin_client.get("/sections")
+
+    log_line = json.loads(caplog.records[-1].getMessage())
+    assert log_line["method"] == "GET"
+    assert log_line["path"] == "/sections"
+    assert log_line["status_code"] == status.HTTP_200_OK
+    assert log_line["query_count"] == 1
+    assert log_line["slowest_statement"].startswith(
+        "SELECT health_reference_version.version",
+    )
+
+
+def test_query_budget_exceeded(admin_client: TestClient) -> None:
+    """Test a route issuing more queries than its budget fails the test."""
+    admin_client.get("/sections")
+    budget = query_budget(0)
+    budget.__enter__()
+    admin_client.get("/sections")
+
+    with pytest.raises(AssertionError, match="1 queries exceeded the budget of 0"):
+        budget.__exit__(None, None, None)
@@ -0,0 +1,83 @@
+"""Test the read replica routing in the database module."""
+import asyncio
+import os
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import make_url
+
+from backend import database
+from backend.database import (
+    async_session_local_factory,
+    get_async_read_session_factory,
+    mark_replica_unavailable,
+    replica_is_usable,
+    reset_replica_status,
+)
+
+
+@pytest.fixture(autouse=True)
+def _replica_status() -> Iterator[None]:
+    """Reset the cached replica health check around each test."""
+    reset_replica_status()
+    yield
+    reset_replica_status()
+
+
+def unreachable_database_url() -> str:
+    """Get a database url which nothing is listening on."""
+    return (
+        make_url(os.environ["DATABASE_URL"])
+        .set(host="127.0.0.1", port=1)
+        .render_as_string(hide_password=False)
+    )
+
+
+def test_replica_is_usable() -> None:
+    """Test a reachable replica which is up to date is used."""
+    replica = async_session_local_factory(os.environ["DATABASE_URL"], pooled=False)
+
+    assert asyncio.run(replica_is_usable(replica))
+
+
+def test_unreachable_replica_is_not_usable() -> None:
+    """Test reads fall back to the primary when the replica cannot be reached."""
+    replica = async_session_local_factory(unreachable_database_url(), pooled=False)
+
+    assert not asyncio.run(replica_is_usable(replica))
+
+
+def test_lagging_replica_is_not_usable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test reads fall back to the primary when the replica lags too far behind."""
+    monkeypatch.setattr(database, "DATABASE_READ_MAX_LAG", -1)
+    replica = async_session_local_factory(os.environ["DATABASE_URL"], pooled=False)
+
+    assert not asyncio.run(replica_is_usable(replica))
+
+
+def test_replica_check_is_cached() -> None:
+    """Test the replica is not checked again within the check interval."""
+    replica = async_session_local_factory(os.environ["DATABASE_URL"], pooled=False)
+    mark_replica_unavailable()
+
+    assert not asyncio.run(replica_is_usable(replica))
+
+
+def test_reads_use_primary_without_replica(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test reads use the primary when no replica is configured."""
+    monkeypatch.setattr(database, "DATABASE_READ_URL", "")
+    monkeypatch.setattr(database, "_async_read_session_factory", None)
+    primary = async_session_local_factory(os.environ["DATABASE_URL"], pooled=False)
+    monkeypatch.setattr(database, "_async_session_factory", primary)
+
+    assert asyncio.run(get_async_read_session_factory()) is primary
+
+
+def test_reads_use_healthy_replica(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test reads use the replica when it is healthy."""
+    primary = async_session_local_factory(os.environ["DATABASE_URL"], pooled=False)
+    replica = async_session_local_factory(os.environ["DATABASE_URL"], pooled=False)
+    monkeypatch.setattr(database, "_async_session_factory", primary)
+    monkeypatch.setattr(database, "_async_read_session_factory", replica)
+
+    assert asyncio.run(get_async_read_session_factory()) is replica
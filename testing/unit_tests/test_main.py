@@ -3,7 +3,11 @@ from fastapi.testclient import TestClient
 from starlette import status
 
 from testing.fixtures.client import client  # noqa: F401
-from testing.fixtures.database import session, session_factory  # noqa: F401
+from testing.fixtures.database import (  # noqa: F401
+    async_session_factory,
+    session,
+    session_factory,
+)
 
 
 def test_health(client: TestClient) -> None:
@@ -11,10 +15,3 @@ def test_health(client: TestClient) -> None:
     response = client.get("/health")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == "ok"
-
-
-def test_trace(client: TestClient) -> None:
-    """Test the trace endpoint."""
-    response = client.get("/tracemalloc")
-    assert response.status_code == status.HTTP_200_OK
-    assert response.text == "First snapshot taken!\n"